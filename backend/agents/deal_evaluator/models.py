@@ -5,7 +5,7 @@ Note: Verdict and StrategyFit models are in backend/models/financial.py
 This file contains additional models specific to the evaluator agent.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 
@@ -41,8 +41,8 @@ class EvaluationRequest(BaseModel):
     request_negotiation_draft: bool = Field(default=False, description="Create negotiation email draft")
     recipient_email: Optional[str] = Field(None, description="Email for negotiation draft")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "address": "10 Rue de Rivoli",
                 "postal_code": "75001",
@@ -63,6 +63,7 @@ class EvaluationRequest(BaseModel):
                 "holding_period_years": 10
             }
         }
+    )
 
 
 class EvaluationResult(BaseModel):
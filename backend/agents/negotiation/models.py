@@ -2,7 +2,7 @@
 Negotiation agent models.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict
 from datetime import datetime
 
@@ -31,8 +31,8 @@ class NegotiationPack(BaseModel):
     capital_alternative: Optional[str] = Field(None, description="Alternative investment comparison")
     justification: str = Field(..., description="Negotiation justification")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "property_address": "10 Rue de Rivoli, 75001 Paris",
                 "asking_price": 500000,
@@ -45,4 +45,5 @@ class NegotiationPack(BaseModel):
                 "dvf_median_per_m2": 10200,
                 "justification": "Based on market comps and financial analysis"
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
@@ -4,6 +4,7 @@ Research agent for property data gathering.
 MIRROR: use-cases/pydantic-ai/examples/main_agent_reference/research_agent.py
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, List
 
@@ -151,15 +152,17 @@ async def assess_property_risks(
     Returns:
         Dictionary with environmental and crime risk summaries
     """
-    # Fetch environmental risks
-    env_risks = await tools.fetch_environmental_risks_tool(
-        postal_code=postal_code,
-        address=address
+    # Fetch environmental risks and crime statistics concurrently
+    # Reason: the two sources are independent and both tools catch their own
+    # errors, so waiting on them together costs max(t) instead of the sum
+    env_risks, crime_stats = await asyncio.gather(
+        tools.fetch_environmental_risks_tool(
+            postal_code=postal_code,
+            address=address
+        ),
+        tools.fetch_crime_stats_tool(postal_code=postal_code)
     )
 
-    # Fetch crime statistics
-    crime_stats = await tools.fetch_crime_stats_tool(postal_code=postal_code)
-
     return {
         "environmental": {
             "risk_level": env_risks.get("overall_risk_level", "Unknown"),
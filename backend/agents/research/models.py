@@ -2,7 +2,7 @@
 Research agent models.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -72,8 +72,8 @@ class ResearchResult(BaseModel):
         description="Research timestamp"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "listing": {
                     "address": "10 Rue de Rivoli",
@@ -88,4 +88,5 @@ class ResearchResult(BaseModel):
                 "legal_rent_ceiling": 34.2,
                 "legal_rent_compliant": True
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
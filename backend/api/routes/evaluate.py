@@ -72,7 +72,7 @@ async def evaluate_property(request: PropertyEvaluationRequest):
         purchase_price = request.price
         has_mortgage = request.loan_amount > 0
         costs_breakdown = cashflow.calculate_french_purchase_costs(purchase_price, has_mortgage)
-        total_purchase_fees = costs_breakdown["total"]
+        total_purchase_fees = costs_breakdown.total
 
         # Calculate cash flow projections with appreciation (user-defined years)
         # Use same vacancy rate as DSCR calculation for consistency
@@ -245,12 +245,12 @@ async def evaluate_property(request: PropertyEvaluationRequest):
         purchase_costs_obj = PurchaseCosts(
             down_payment=request.down_payment,
             renovation_costs=request.renovation_costs,
-            registration_duties=costs_breakdown["registration_duties"],
-            notaire_fees=costs_breakdown["notaire_fees"],
-            disbursements=costs_breakdown["disbursements"],
-            mortgage_fees=costs_breakdown["mortgage_fees"],
-            total_fees=costs_breakdown["total"],
-            total_cash_required=request.down_payment + request.renovation_costs + costs_breakdown["total"]
+            registration_duties=costs_breakdown.registration_duties,
+            notaire_fees=costs_breakdown.notaire_fees,
+            disbursements=costs_breakdown.disbursements,
+            mortgage_fees=costs_breakdown.mortgage_fees,
+            total_fees=costs_breakdown.total,
+            total_cash_required=request.down_payment + request.renovation_costs + costs_breakdown.total
         )
 
         # Legal rent status using real rent control data
@@ -261,17 +261,17 @@ async def evaluate_property(request: PropertyEvaluationRequest):
         )
 
         if rent_compliance:
-            legal_rent_status = rent_compliance["verdict"]
+            legal_rent_status = rent_compliance.verdict
             rent_band = RentBand(
-                min_rent=rent_compliance["min_rent"],
-                max_rent=rent_compliance["max_rent"],
-                median_rent=rent_compliance["median_rent"],
-                property_rent_per_m2=rent_compliance["property_rent_per_m2"],
-                total_monthly_rent=rent_compliance["total_monthly_rent"],
-                surface=rent_compliance["surface"],
-                is_compliant=rent_compliance["is_compliant"],
-                compliance_percentage=rent_compliance["compliance_percentage"],
-                is_estimate=rent_compliance.get("is_estimate", False)
+                min_rent=rent_compliance.min_rent,
+                max_rent=rent_compliance.max_rent,
+                median_rent=rent_compliance.median_rent,
+                property_rent_per_m2=rent_compliance.property_rent_per_m2,
+                total_monthly_rent=rent_compliance.total_monthly_rent,
+                surface=rent_compliance.surface,
+                is_compliant=rent_compliance.is_compliant,
+                compliance_percentage=rent_compliance.compliance_percentage,
+                is_estimate=rent_compliance.is_estimate
             )
         else:
             # Not in rent-controlled zone
@@ -0,0 +1,22 @@
+"""
+Array broadcasting helpers shared by the vectorized calculation entry points.
+
+Batch functions accept scalars or arrays for every input; `as_columns`
+turns them into equal-length 1-D float64 columns the compiled kernels can
+index row by row.
+"""
+
+from typing import Tuple, Union
+
+import numpy as np
+
+
+ArrayLike = Union[float, np.ndarray]
+
+
+def as_columns(*values: ArrayLike) -> Tuple[np.ndarray, ...]:
+    """Broadcast scalars/arrays to contiguous 1-D float64 columns of equal length."""
+    return tuple(
+        np.ascontiguousarray(column, dtype=np.float64)
+        for column in np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=np.float64)) for v in values))
+    )
@@ -0,0 +1,34 @@
+"""
+Ahead-of-time compilation of the financial kernels with Numba.
+
+Builds the `financial_aot` extension module next to this file so the
+cash flow and IRR kernels load instantly instead of paying the JIT
+compilation cost on the first request. Requires Numba at build time only.
+
+Build with:
+    python -m backend.calculations._financial_aot
+
+When the compiled module is missing, `cashflow` and `irr_npv` fall back
+to the `@njit(cache=True)` kernels (or plain Python if Numba is not installed).
+"""
+
+import os
+
+from numba.pycc import CC
+
+from backend.calculations.cashflow import _notaire_fees, _project_core
+from backend.calculations.irr_npv import _irr_solve
+
+
+cc = CC("financial_aot")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Reason: export the undecorated Python functions so the same source is used
+# for the AOT build and the JIT fallback.
+cc.export("notaire_fees", "f8(f8)")(_notaire_fees.py_func)
+cc.export("project_core", "f8[:,:](f8,f8,f8,f8,f8[:],f8,f8,i8)")(_project_core.py_func)
+cc.export("irr_solve", "f8(f8[:])")(_irr_solve.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
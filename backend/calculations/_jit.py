@@ -0,0 +1,30 @@
+"""
+Optional Numba JIT support for the calculation kernels.
+
+Numba is an optional dependency. When it is installed, `njit` and `prange`
+are the real Numba objects; otherwise `njit` is a no-op decorator and
+`prange` is the builtin `range`, so the kernels run as plain Python.
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        No-op stand-in for `numba.njit` supporting `@njit` and `@njit(...)`.
+
+        Returns:
+            The decorated function unchanged
+        """
+        # Reason: bare `@njit` passes the function directly as the only argument
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -5,11 +5,65 @@ Calculates yearly cash flows including rental income, expenses,
 mortgage payments, and property value appreciation.
 """
 
-from typing import List, Dict, Optional
+import math
+from typing import List, Dict, Optional, NamedTuple
 from dataclasses import dataclass
 
+import numpy as np
 
-def calculate_french_purchase_costs(purchase_price: float, has_mortgage: bool = True) -> Dict[str, float]:
+from backend.calculations._jit import njit
+from backend.calculations.mortgage import AmortSchedule
+
+
+# Notaire professional fees (émoluments) sliding scale (2025)
+# Each bracket: (lower bound, bracket width, rate)
+# €0-€6,500: 3.945%
+# €6,500-€17,000: 1.627%
+# €17,000-€60,000: 1.085%
+# Over €60,000: 0.814%
+NOTAIRE_FEE_BRACKETS = (
+    (0.0, 6500.0, 0.03945),
+    (6500.0, 10500.0, 0.01627),
+    (17000.0, 43000.0, 0.01085),
+    (60000.0, float('inf'), 0.00814),
+)
+
+
+@njit(cache=True)
+def _notaire_fees(purchase_price: float) -> float:
+    """
+    Notaire professional fees (émoluments) from the sliding scale.
+
+    Formula:
+        Σ rate × min(max(price - lower, 0), width) over NOTAIRE_FEE_BRACKETS
+    """
+    # Reason: each bracket contributes rate × (portion of price inside the bracket),
+    # which gives the same result as a nested if/elif without branching on price.
+    fees = 0.0
+    for lower, width, rate in NOTAIRE_FEE_BRACKETS:
+        fees += rate * min(max(purchase_price - lower, 0.0), width)
+    return fees
+
+
+class PurchaseCostBreakdown(NamedTuple):
+    """
+    Breakdown of French property purchase costs (frais d'acquisition).
+
+    Attributes:
+        registration_duties: Droits d'enregistrement (transfer taxes)
+        notaire_fees: Actual notaire professional fees (émoluments)
+        disbursements: Administrative costs and documentation
+        mortgage_fees: Additional fees if mortgage (optional)
+        total: Total acquisition costs
+    """
+    registration_duties: float
+    notaire_fees: float
+    disbursements: float
+    mortgage_fees: float
+    total: float
+
+
+def calculate_french_purchase_costs(purchase_price: float, has_mortgage: bool = True) -> PurchaseCostBreakdown:
     """
     Calculate detailed French property purchase costs (frais de notaire).
 
@@ -18,12 +72,8 @@ def calculate_french_purchase_costs(purchase_price: float, has_mortgage: bool =
         has_mortgage: Whether buyer is taking a mortgage
 
     Returns:
-        Dict with breakdown of all costs:
-        - registration_duties: Droits d'enregistrement (transfer taxes)
-        - notaire_fees: Actual notaire professional fees (émoluments)
-        - disbursements: Administrative costs and documentation
-        - mortgage_fees: Additional fees if mortgage (optional)
-        - total: Total acquisition costs
+        PurchaseCostBreakdown: Named tuple with breakdown of all costs
+        (registration_duties, notaire_fees, disbursements, mortgage_fees, total)
 
     Note:
         For resale/old properties: ~7-8% of purchase price
@@ -36,48 +86,29 @@ def calculate_french_purchase_costs(purchase_price: float, has_mortgage: bool =
     registration_duties = purchase_price * 0.0580
 
     # 2. Notaire professional fees (émoluments) - sliding scale
-    # Rates per bracket (2025):
-    # €0-€6,500: 3.945%
-    # €6,500-€17,000: 1.627%
-    # €17,000-€60,000: 1.085%
-    # Over €60,000: 0.814%
-
-    notaire_fees = 0.0
-    if purchase_price <= 6500:
-        notaire_fees = purchase_price * 0.03945
-    elif purchase_price <= 17000:
-        notaire_fees = 6500 * 0.03945 + (purchase_price - 6500) * 0.01627
-    elif purchase_price <= 60000:
-        notaire_fees = 6500 * 0.03945 + (17000 - 6500) * 0.01627 + (purchase_price - 17000) * 0.01085
-    else:
-        notaire_fees = (6500 * 0.03945 +
-                       (17000 - 6500) * 0.01627 +
-                       (60000 - 17000) * 0.01085 +
-                       (purchase_price - 60000) * 0.00814)
+    notaire_fees = _notaire_fees_impl(float(purchase_price))
 
     # 3. Disbursements (frais administratifs)
     # Approximately 0.4% of purchase price for documents, registrations, etc.
     disbursements = purchase_price * 0.004
 
     # 4. Mortgage-related fees (if applicable)
-    # Additional ~0.3-0.5% if mortgage is involved
-    mortgage_fees = 0.0
-    if has_mortgage:
-        mortgage_fees = purchase_price * 0.004  # Conservative 0.4%
+    # Additional ~0.3-0.5% if mortgage is involved (conservative 0.4%)
+    mortgage_fees = purchase_price * 0.004 * has_mortgage
 
     # Total
     total = registration_duties + notaire_fees + disbursements + mortgage_fees
 
-    return {
-        "registration_duties": registration_duties,
-        "notaire_fees": notaire_fees,
-        "disbursements": disbursements,
-        "mortgage_fees": mortgage_fees,
-        "total": total
-    }
+    return PurchaseCostBreakdown(
+        registration_duties=registration_duties,
+        notaire_fees=notaire_fees,
+        disbursements=disbursements,
+        mortgage_fees=mortgage_fees,
+        total=total
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class CashFlowProjection:
     """
     Detailed cash flow projection for a single year.
@@ -95,6 +126,10 @@ class CashFlowProjection:
         property_value: Estimated property value at end of year
         equity: Equity in property (property_value - remaining_loan_balance)
         remaining_loan_balance: Remaining loan balance at end of year
+
+    Note:
+        Slotted: one record is built per projected year, and a slotted
+        instance is smaller and faster to create than a __dict__-backed one.
     """
     year: int
     rental_income: float
@@ -110,12 +145,116 @@ class CashFlowProjection:
     remaining_loan_balance: float
 
 
+@njit(cache=True)
+def _project_core(
+    initial_property_value: float,
+    monthly_rent: float,
+    monthly_operating_expenses: float,
+    monthly_mortgage_payment: float,
+    year_end_balances: np.ndarray,
+    appreciation_rate: float,
+    vacancy_rate: float,
+    years: int
+) -> np.ndarray:
+    """
+    Numeric core of the cash flow projection for years 1..years.
+
+    Args:
+        initial_property_value: Initial property purchase price
+        monthly_rent: Monthly rental income (gross)
+        monthly_operating_expenses: Monthly operating expenses
+        monthly_mortgage_payment: Monthly mortgage payment
+        year_end_balances: Loan balance at the end of each year while the loan is active
+                           (its length is the number of years with mortgage payments)
+        appreciation_rate: Annual property appreciation rate as decimal
+        vacancy_rate: Vacancy & credit loss rate as decimal
+        years: Number of years to project
+
+    Returns:
+        np.ndarray: Array of shape (years, 11) whose columns follow the
+        CashFlowProjection fields after `year`. The cumulative cash flow
+        column starts from 0 (year 0 is added by the caller).
+    """
+    out = np.empty((years, 11))
+
+    # Annual values are the same every year
+    annual_rent = monthly_rent * 12
+    annual_vacancy_loss = annual_rent * vacancy_rate
+    effective_annual_rent = annual_rent - annual_vacancy_loss
+    annual_opex = monthly_operating_expenses * 12
+
+    # NOI (using effective rental income after vacancy)
+    noi = effective_annual_rent - annual_opex
+
+    cumulative_cf = 0.0
+    growth = 1.0 + appreciation_rate
+
+    # Reason: the loan is active for the first `payoff_year` years and paid off
+    # afterwards, so two straight-line loops replace a per-year payoff branch.
+    payoff_year = min(years, year_end_balances.shape[0])
+
+    # Years with an active loan - mortgage payment applies
+    annual_mortgage = monthly_mortgage_payment * 12
+    cash_flow = noi - annual_mortgage
+    for i in range(payoff_year):
+        remaining_balance = year_end_balances[i]
+        cumulative_cf += cash_flow
+
+        # Property appreciation: value_0 × (1 + r)^year
+        current_property_value = initial_property_value * math.pow(growth, i + 1)
+
+        out[i, 0] = annual_rent
+        out[i, 1] = annual_vacancy_loss
+        out[i, 2] = effective_annual_rent
+        out[i, 3] = annual_opex
+        out[i, 4] = annual_mortgage
+        out[i, 5] = noi
+        out[i, 6] = cash_flow
+        out[i, 7] = cumulative_cf
+        out[i, 8] = current_property_value
+        out[i, 9] = current_property_value - remaining_balance
+        out[i, 10] = remaining_balance
+
+    # Loan paid off - no more mortgage payments, cash flow = NOI
+    for i in range(payoff_year, years):
+        cumulative_cf += noi
+
+        # Property appreciation: value_0 × (1 + r)^year
+        current_property_value = initial_property_value * math.pow(growth, i + 1)
+
+        out[i, 0] = annual_rent
+        out[i, 1] = annual_vacancy_loss
+        out[i, 2] = effective_annual_rent
+        out[i, 3] = annual_opex
+        out[i, 4] = 0.0
+        out[i, 5] = noi
+        out[i, 6] = noi
+        out[i, 7] = cumulative_cf
+        out[i, 8] = current_property_value
+        out[i, 9] = current_property_value
+        out[i, 10] = 0.0
+
+    return out
+
+
+# Prefer the ahead-of-time compiled kernels (see _financial_aot.py) so the
+# first request does not pay the JIT compilation cost.
+try:
+    from backend.calculations.financial_aot import (
+        notaire_fees as _notaire_fees_impl,
+        project_core as _project_core_impl,
+    )
+except ImportError:
+    _notaire_fees_impl = _notaire_fees
+    _project_core_impl = _project_core
+
+
 def calculate_cash_flow_projection(
     initial_property_value: float,
     monthly_rent: float,
     monthly_operating_expenses: float,
     monthly_mortgage_payment: float,
-    loan_amortization_schedule: List[Dict[str, float]],
+    loan_amortization_schedule: AmortSchedule,
     appreciation_rate: float,
     vacancy_rate: float = 0.05,
     years: int = 10,
@@ -131,8 +270,8 @@ def calculate_cash_flow_projection(
         monthly_rent: Monthly rental income (gross)
         monthly_operating_expenses: Monthly operating expenses (tax, insurance, maintenance, HOA)
         monthly_mortgage_payment: Monthly mortgage payment
-        loan_amortization_schedule: List of payment details from mortgage.amortization_schedule()
-                                   Each dict contains: {payment, principal, interest, balance}
+        loan_amortization_schedule: Schedule from mortgage.amortization_schedule()
+                                   (only remaining_balance is used)
         appreciation_rate: Annual property appreciation rate as decimal (e.g., 0.03 for 3%)
         vacancy_rate: Vacancy & credit loss rate as decimal (default: 0.05 for 5%)
         years: Number of years to project (default: 10)
@@ -154,15 +293,14 @@ def calculate_cash_flow_projection(
         ... )
     """
     projections: List[CashFlowProjection] = []
-    cumulative_cf = 0.0
-    current_property_value = initial_property_value
 
     # Add Year 0: Purchase costs
     # Total cash required = down payment + renovation costs + all purchase fees
     year_0_cash_out = -(down_payment + renovation_costs + purchase_fees)
 
     # Initial loan balance (if any)
-    initial_loan_balance = loan_amortization_schedule[0]["remaining_balance"] if loan_amortization_schedule else 0
+    balances = loan_amortization_schedule.remaining_balance
+    initial_loan_balance = float(balances[0]) if len(balances) else 0
 
     # Initial equity = property value (after renovation) - loan balance
     # Note: Purchase fees are COSTS that disappear, not equity
@@ -183,56 +321,26 @@ def calculate_cash_flow_projection(
         remaining_loan_balance=initial_loan_balance
     )
     projections.append(year_0)
-    cumulative_cf = year_0_cash_out
-
-    for year in range(1, years + 1):
-        # Annual values
-        annual_rent = monthly_rent * 12
-        annual_vacancy_loss = annual_rent * vacancy_rate
-        effective_annual_rent = annual_rent - annual_vacancy_loss
-        annual_opex = monthly_operating_expenses * 12
-
-        # Remaining loan balance (get balance at end of year from amortization schedule)
-        # Amortization schedule is monthly, so year N corresponds to month N*12
-        month_index = year * 12 - 1  # 0-indexed
-        if month_index < len(loan_amortization_schedule):
-            remaining_balance = loan_amortization_schedule[month_index]["remaining_balance"]
-            # Mortgage payment only applies while loan exists
-            annual_mortgage = monthly_mortgage_payment * 12
-        else:
-            # Loan paid off - no more mortgage payments!
-            remaining_balance = 0.0
-            annual_mortgage = 0.0
-
-        # NOI (using effective rental income after vacancy)
-        noi = effective_annual_rent - annual_opex
-
-        # Cash flow (after mortgage is paid off, cash flow = NOI)
-        cash_flow = noi - annual_mortgage
-        cumulative_cf += cash_flow
 
-        # Property appreciation
-        current_property_value *= (1 + appreciation_rate)
-
-        # Equity
-        equity = current_property_value - remaining_balance
-
-        projection = CashFlowProjection(
-            year=year,
-            rental_income=annual_rent,
-            vacancy_loss=annual_vacancy_loss,
-            effective_rental_income=effective_annual_rent,
-            operating_expenses=annual_opex,
-            mortgage_payment=annual_mortgage,
-            noi=noi,
-            cash_flow=cash_flow,
-            cumulative_cash_flow=cumulative_cf,
-            property_value=current_property_value,
-            equity=equity,
-            remaining_loan_balance=remaining_balance
-        )
-
-        projections.append(projection)
+    # Remaining loan balance at end of each year from the amortization schedule
+    # Amortization schedule is monthly, so year N corresponds to month N*12 (index N*12-1)
+    last_month = min(len(balances), years * 12)
+    year_end_balances = np.ascontiguousarray(balances[11:last_month:12], dtype=np.float64)
+
+    core = _project_core_impl(
+        float(initial_property_value),
+        float(monthly_rent),
+        float(monthly_operating_expenses),
+        float(monthly_mortgage_payment),
+        year_end_balances,
+        float(appreciation_rate),
+        float(vacancy_rate),
+        years
+    )
+    core[:, 7] += year_0_cash_out
+
+    for year, row in enumerate(core.tolist(), start=1):
+        projections.append(CashFlowProjection(year, *row))
 
     return projections
 
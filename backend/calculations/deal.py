@@ -0,0 +1,260 @@
+"""
+Fused whole-deal metrics: amortization, régime réel tax, cash flows and IRR in one pass.
+
+Equivalent to chaining mortgage.amortization_schedule() → taxes.regime_reel_tax()
+→ yearly cash flows → irr_npv.irr_calculation() / npv_calculation(), but walks
+the loan month by month once inside a single kernel without building the
+intermediate schedule, tax dicts or cash flow lists.
+
+Cash flows:
+- CF_0 = −Initial Equity
+- CF_t = NOI − Debt Service − Régime Réel Tax (interest deductible), t = 1..T
+- CF_T also includes net sale proceeds: Exit Price × (1 − Selling Costs) − Remaining Balance
+
+evaluate_batch() runs the quick screening chain used by the CLI `evaluate`
+command (payment → NOI → DSCR → cap rate) over many scenarios at once.
+"""
+
+from typing import Dict
+
+import numpy as np
+
+from backend.calculations._arrays import ArrayLike, as_columns
+from backend.calculations._jit import njit, prange
+from backend.calculations.irr_npv import _irr_solve, _npv_and_derivative
+from backend.calculations.mortgage import _payment_kernel, monthly_payment
+from backend.calculations.taxes import _reel_tax
+
+
+@njit(cache=True)
+def _deal_kernel(
+    principal: float,
+    annual_rate: float,
+    loan_years: int,
+    payment: float,
+    initial_equity: float,
+    hold_years: int,
+    monthly_rent: float,
+    monthly_expenses: float,
+    marginal_rate: float,
+    social_charges_rate: float,
+    exit_price: float,
+    selling_costs_rate: float,
+    discount_rate: float
+) -> tuple:
+    """
+    Compute (irr, npv, min_dscr) for a deal in a single pass over the loan months.
+
+    Args:
+        principal: Loan principal amount
+        annual_rate: Annual interest rate
+        loan_years: Loan term in years
+        payment: Monthly mortgage payment for the loan
+        initial_equity: Cash invested at purchase (CF_0 = -initial_equity)
+        hold_years: Holding period in years (sale at end of final year)
+        monthly_rent: Monthly rent collected
+        monthly_expenses: Monthly deductible operating expenses
+        marginal_rate: Marginal income tax rate
+        social_charges_rate: Social charges rate
+        exit_price: Resale price at end of holding period
+        selling_costs_rate: Selling costs as % of resale price
+        discount_rate: Discount rate for NPV
+
+    Returns:
+        tuple: (irr, npv, min_dscr); min_dscr is inf when there is no debt service
+    """
+    monthly_rate = annual_rate / 12
+    num_payments = loan_years * 12
+    annual_noi = (monthly_rent - monthly_expenses) * 12
+
+    cash_flows = np.empty(hold_years + 1)
+    cash_flows[0] = -initial_equity
+
+    balance = principal
+    month = 0
+    min_dscr = np.inf
+
+    for year in range(1, hold_years + 1):
+        # Walk this year's loan months, accumulating interest and debt service
+        interest = 0.0
+        debt_service = 0.0
+        for _ in range(12):
+            if month < num_payments:
+                interest_payment = balance * monthly_rate
+                balance -= payment - interest_payment
+                interest += interest_payment
+                debt_service += payment
+            month += 1
+
+        # Régime réel: rent - expenses - interest is taxable
+        _, _, _, total_tax, _ = _reel_tax(
+            monthly_rent * 12, monthly_expenses * 12, interest, marginal_rate, social_charges_rate
+        )
+        cash_flows[year] = annual_noi - debt_service - total_tax
+
+        if debt_service > 0.0:
+            min_dscr = min(min_dscr, annual_noi / debt_service)
+
+    # Net sale proceeds in the final year
+    remaining_balance = max(0.0, balance) if month < num_payments else 0.0
+    cash_flows[hold_years] += exit_price * (1 - selling_costs_rate) - remaining_balance
+
+    irr = _irr_solve(cash_flows)
+    npv, _ = _npv_and_derivative(cash_flows, 1.0 / (1.0 + discount_rate))
+    return irr, npv, min_dscr
+
+
+def deal_metrics(
+    principal: float,
+    annual_rate: float,
+    loan_years: int,
+    initial_equity: float,
+    hold_years: int,
+    monthly_rent: float,
+    monthly_expenses: float,
+    exit_price: float,
+    marginal_rate: float = 0.30,
+    social_charges_rate: float = 0.172,
+    selling_costs_rate: float = 0.08,
+    discount_rate: float = 0.05
+) -> Dict[str, float]:
+    """
+    Calculate after-tax IRR, NPV and minimum DSCR for a deal under régime réel.
+
+    Args:
+        principal: Loan principal amount
+        annual_rate: Annual interest rate (e.g., 0.035 for 3.5%)
+        loan_years: Loan term in years
+        initial_equity: Cash invested at purchase (down payment + fees + works)
+        hold_years: Holding period in years (sale at end of final year)
+        monthly_rent: Monthly rent collected
+        monthly_expenses: Monthly deductible operating expenses
+        exit_price: Resale price at end of holding period
+        marginal_rate: Marginal income tax rate (default 30%)
+        social_charges_rate: Social charges rate (default 17.2%)
+        selling_costs_rate: Selling costs as % of resale price (default 8%)
+        discount_rate: Discount rate for NPV (default 5%)
+
+    Returns:
+        dict: {
+            "irr": After-tax IRR (NaN if none exists),
+            "npv": After-tax NPV at discount_rate,
+            "min_dscr": Lowest yearly DSCR while the loan is repaid (inf without debt)
+        }
+
+    Example:
+        >>> deal_metrics(400000, 0.035, 20, 130000, 10, 2500, 600, 600000)
+    """
+    has_loan = principal > 0 and loan_years > 0
+    payment = monthly_payment(principal, annual_rate, loan_years) if has_loan else 0.0
+
+    irr, npv, min_dscr = _deal_kernel(
+        float(principal) if has_loan else 0.0,
+        float(annual_rate),
+        int(loan_years) if has_loan else 0,
+        float(payment),
+        float(initial_equity),
+        int(hold_years),
+        float(monthly_rent),
+        float(monthly_expenses),
+        float(marginal_rate),
+        float(social_charges_rate),
+        float(exit_price),
+        float(selling_costs_rate),
+        float(discount_rate)
+    )
+
+    return {
+        "irr": float(irr),
+        "npv": float(npv),
+        "min_dscr": float(min_dscr)
+    }
+
+
+@njit(cache=True, parallel=True)
+def _evaluate_kernel(
+    prices: np.ndarray,
+    monthly_rents: np.ndarray,
+    annual_rates: np.ndarray,
+    loan_terms: np.ndarray,
+    loan_amounts: np.ndarray,
+    vacancy_rates: np.ndarray,
+    operating_expenses: np.ndarray
+) -> np.ndarray:
+    """
+    Payment, NOI, DSCR and cap rate per scenario in one parallel loop.
+
+    Args:
+        prices: Purchase prices
+        monthly_rents: Monthly rents (GMI)
+        annual_rates: Annual interest rates
+        loan_terms: Loan terms in years
+        loan_amounts: Loan principals
+        vacancy_rates: Vacancy & credit loss rates
+        operating_expenses: Annual operating expenses
+
+    Returns:
+        np.ndarray: Shape (N, 4): (monthly_payment, noi, dscr, cap_rate)
+    """
+    n = prices.shape[0]
+    out = np.empty((n, 4))
+    for k in prange(n):
+        payment = _payment_kernel(loan_amounts[k], annual_rates[k], loan_terms[k])
+        gmi = monthly_rents[k]
+        noi = (gmi - gmi * vacancy_rates[k]) * 12 - operating_expenses[k]
+        ads = payment * 12
+
+        # Same edge cases as financial.dscr_calculation() / cap_rate()
+        if ads == 0:
+            dscr = np.inf if noi > 0 else 0.0
+        else:
+            dscr = noi / ads
+        cap = noi / prices[k] if prices[k] != 0 else 0.0
+
+        out[k, 0] = payment
+        out[k, 1] = noi
+        out[k, 2] = dscr
+        out[k, 3] = cap
+    return out
+
+
+def evaluate_batch(
+    prices: ArrayLike,
+    monthly_rents: ArrayLike,
+    annual_rates: ArrayLike,
+    loan_terms: ArrayLike,
+    loan_amounts: ArrayLike,
+    vacancy_rate: ArrayLike = 0.05,
+    annual_operating_expenses: ArrayLike = 6000.0
+) -> np.ndarray:
+    """
+    Screen many what-if scenarios: monthly payment, NOI, DSCR and cap rate.
+
+    Args:
+        prices: Purchase prices (scalar or array)
+        monthly_rents: Expected monthly rents
+        annual_rates: Annual interest rates (e.g., 0.03 for 3%)
+        loan_terms: Loan terms in years
+        loan_amounts: Loan amounts
+        vacancy_rate: Vacancy & credit loss rate (default 5%)
+        annual_operating_expenses: Annual operating expenses (default €6,000)
+
+    Returns:
+        np.ndarray: Array of shape (N, 4) with columns
+        (monthly_payment, noi, dscr, cap_rate)
+
+    Formula:
+        Same chain as financial.py: NOI = (GMI − VCL) × 12 − OE,
+        DSCR = NOI ÷ (12 × Monthly Payment), Cap Rate = NOI ÷ Price
+
+    Note:
+        With Numba installed, the first call compiles the kernel; the compiled
+        code is cached on disk so later processes skip that cost.
+
+    Example:
+        >>> evaluate_batch([500000, 450000], 2000, 0.03, 20, [400000, 360000])
+    """
+    return _evaluate_kernel(*as_columns(
+        prices, monthly_rents, annual_rates, loan_terms, loan_amounts,
+        vacancy_rate, annual_operating_expenses
+    ))
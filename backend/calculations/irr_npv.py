@@ -8,9 +8,218 @@ Formulas from INITIAL.md:
 - Sale Proceeds (Net) = Resale Price − Selling Costs − Remaining Loan Balance
 """
 
-from typing import List
+import math
+from functools import lru_cache
+from typing import List, Sequence, Union
+import numpy as np
 import numpy_financial as npf
 
+from backend.calculations._jit import HAS_NUMBA, njit
+
+
+# Use numpy-financial's eigenvalue-based IRR instead of the Newton solver
+USE_NUMPY_FINANCIAL_IRR = False
+
+# Bracket for the bisection fallback, as discount factors x = 1/(1+r)
+# r in [-99%, +1000%] -> x in [1/11, 100]
+IRR_BRACKET = (1.0 / 11.0, 100.0)
+
+# Optional: fused multiply-add (Python 3.13+) - one rounding per Horner step
+try:
+    from math import fma as _fma
+except ImportError:
+    _fma = None
+
+
+@njit(cache=True)
+def _npv_and_derivative(cash_flows: np.ndarray, x: float) -> tuple:
+    """
+    Evaluate NPV and its derivative in the discount factor x = 1/(1+r).
+
+    Args:
+        cash_flows: Cash flows [CF_0, CF_1, ..., CF_T]
+        x: Discount factor 1/(1+r)
+
+    Returns:
+        tuple: (npv, dnpv_dx)
+
+    Formula:
+        NPV(x) = Σ CF_t × x^t, evaluated with Horner's scheme
+        dNPV/dx = Σ t × CF_t × x^(t-1), accumulated in the same pass
+    """
+    npv = 0.0
+    dnpv = 0.0
+    for t in range(cash_flows.shape[0] - 1, -1, -1):
+        dnpv = dnpv * x + npv
+        npv = npv * x + cash_flows[t]
+    return npv, dnpv
+
+
+def _npv_horner(rate: float, cash_flows: Sequence[float]) -> float:
+    """
+    Evaluate NPV at a single rate with Horner's scheme.
+
+    Args:
+        rate: Discount rate as a decimal
+        cash_flows: Cash flows [CF_0, CF_1, ..., CF_T]
+
+    Returns:
+        float: NPV value
+
+    Formula:
+        NPV = (...((CF_T × x + CF_(T-1)) × x + ...) × x + CF_0, x = 1/(1+r)
+
+    Note:
+        Each step is a fused multiply-add when math.fma is available (Python 3.13+).
+    """
+    # Reason: plain Python loop over the list; for the ~10-30 yearly flows of a
+    # deal, array conversion and ufunc dispatch cost more than the arithmetic.
+    x = 1.0 / (1.0 + rate)
+    npv = 0.0
+    if _fma is not None:
+        for cash_flow in reversed(cash_flows):
+            npv = _fma(npv, x, cash_flow)
+    else:
+        for cash_flow in reversed(cash_flows):
+            npv = npv * x + cash_flow
+    return float(npv)
+
+
+@njit(cache=True)
+def _irr_bisect(cash_flows: np.ndarray, tol: float = 1e-7, maxiter: int = 200) -> float:
+    """
+    Find IRR by bisection on the discount factor within IRR_BRACKET.
+
+    Args:
+        cash_flows: Cash flows [CF_0, CF_1, ..., CF_T]
+        tol: Convergence tolerance on the discount factor
+        maxiter: Maximum number of halvings
+
+    Returns:
+        float: IRR as a decimal, or NaN if NPV does not change sign in the bracket
+    """
+    lo, hi = IRR_BRACKET
+    npv_lo, _ = _npv_and_derivative(cash_flows, lo)
+    npv_hi, _ = _npv_and_derivative(cash_flows, hi)
+    if npv_lo == 0.0:
+        return 1.0 / lo - 1.0
+    if npv_hi == 0.0:
+        return 1.0 / hi - 1.0
+    if (npv_lo > 0.0) == (npv_hi > 0.0):
+        return np.nan
+
+    for _ in range(maxiter):
+        mid = 0.5 * (lo + hi)
+        npv_mid, _ = _npv_and_derivative(cash_flows, mid)
+        if npv_mid == 0.0 or hi - lo < tol:
+            return 1.0 / mid - 1.0
+        if (npv_mid > 0.0) == (npv_lo > 0.0):
+            lo, npv_lo = mid, npv_mid
+        else:
+            hi = mid
+
+    return 1.0 / (0.5 * (lo + hi)) - 1.0
+
+
+@njit(cache=True)
+def _irr_newton(
+    cash_flows: np.ndarray,
+    guess: float = 0.1,
+    tol: float = 1e-7,
+    maxiter: int = 100
+) -> float:
+    """
+    Find IRR with Newton-Raphson on the discount factor x = 1/(1+r).
+
+    Args:
+        cash_flows: Cash flows [CF_0, CF_1, ..., CF_T]
+        guess: Initial IRR guess as a decimal
+        tol: Convergence tolerance on the discount factor
+        maxiter: Maximum number of Newton steps
+
+    Returns:
+        float: IRR as a decimal, or NaN if Newton does not converge
+    """
+    x = 1.0 / (1.0 + guess)
+    for _ in range(maxiter):
+        npv, dnpv = _npv_and_derivative(cash_flows, x)
+        if dnpv == 0.0:
+            return np.nan
+        step = npv / dnpv
+        x -= step
+        # Reason: x <= 0 means r <= -100%, outside the domain of a real IRR
+        if x <= 0.0 or not math.isfinite(x):
+            return np.nan
+        if abs(step) < tol:
+            return 1.0 / x - 1.0
+    return np.nan
+
+
+@njit(cache=True)
+def _irr_solve(cash_flows: np.ndarray) -> float:
+    """
+    Solve IRR for one cash flow series: Newton first, bisection if it diverges.
+
+    Args:
+        cash_flows: Cash flows [CF_0, CF_1, ..., CF_T]
+
+    Returns:
+        float: IRR as a decimal, or NaN if no IRR exists
+    """
+    # Reason: with all cash flows of the same sign NPV never crosses zero
+    has_positive = False
+    has_negative = False
+    for t in range(cash_flows.shape[0]):
+        has_positive |= cash_flows[t] > 0.0
+        has_negative |= cash_flows[t] < 0.0
+    if not (has_positive and has_negative):
+        return np.nan
+
+    result = _irr_newton(cash_flows)
+    if math.isnan(result):
+        result = _irr_bisect(cash_flows)
+    return result
+
+
+# Optional: pyxirr (Rust-compiled IRR) - fastest single-call path when installed
+try:
+    from pyxirr import irr as _pyxirr_irr
+except ImportError:
+    _pyxirr_irr = None
+
+# Prefer the ahead-of-time compiled IRR kernel (see _financial_aot.py) so the
+# first request does not pay the JIT compilation cost.
+try:
+    from backend.calculations.financial_aot import irr_solve as _irr_solve_impl
+except ImportError:
+    _irr_solve_impl = _irr_solve
+
+
+@lru_cache(maxsize=None)
+def _irr_gufunc():
+    """
+    Build the row-wise IRR gufunc on first use.
+
+    Returns:
+        A '(n)->()' gufunc running _irr_solve over rows in parallel, or None
+        when Numba is not installed or NUMBA_DISABLE_JIT is set.
+    """
+    if not HAS_NUMBA:
+        return None
+
+    from numba import config, guvectorize
+
+    # Reason: with JIT disabled _irr_solve is plain Python and cannot be typed
+    if config.DISABLE_JIT:
+        return None
+
+    # Reason: built lazily so importing this module does not pay the compile cost
+    @guvectorize(["void(float64[:], float64[:])"], "(n)->()", nopython=True, target="parallel")
+    def irr_rows(cash_flows, out):
+        out[0] = _irr_solve(cash_flows)
+
+    return irr_rows
+
 
 def irr_calculation(cash_flows: List[float]) -> float:
     """
@@ -29,17 +238,50 @@ def irr_calculation(cash_flows: List[float]) -> float:
         IRR solves: 0 = Σ(CF_t / (1+r)^t) for t=0 to T
 
     Note:
-        Uses numpy-financial library.
+        Uses pyxirr when installed. Otherwise uses Newton-Raphson with Horner
+        evaluation (AOT-compiled when available), falling back to bisection when
+        Newton diverges (numpy-financial if USE_NUMPY_FINANCIAL_IRR is set).
         Returns NaN if no IRR can be calculated (e.g., all positive or all negative flows)
     """
     if not cash_flows or len(cash_flows) < 2:
         return float('nan')
 
-    try:
-        return float(npf.irr(cash_flows))
-    except (ValueError, RuntimeError):
-        # No IRR exists (e.g., all cash flows same sign)
-        return float('nan')
+    if USE_NUMPY_FINANCIAL_IRR:
+        try:
+            return float(npf.irr(cash_flows))
+        except (ValueError, RuntimeError):
+            # No IRR exists (e.g., all cash flows same sign)
+            return float('nan')
+
+    if _pyxirr_irr is not None:
+        # silent=True returns None instead of raising when no IRR is found
+        result = _pyxirr_irr(cash_flows, silent=True)
+        if result is not None:
+            return float(result)
+
+    return float(_irr_solve_impl(np.asarray(cash_flows, dtype=np.float64)))
+
+
+def irr_batch(cash_flow_matrix: Union[List[List[float]], np.ndarray]) -> np.ndarray:
+    """
+    Calculate IRR for many cash flow scenarios at once.
+
+    Args:
+        cash_flow_matrix: Cash flow scenarios of shape (S, T+1), one row per
+                          scenario [CF_0, CF_1, ..., CF_T]
+
+    Returns:
+        np.ndarray: IRR per scenario, shape (S,) (NaN where no IRR exists)
+
+    Note:
+        With Numba installed, rows are solved by a compiled gufunc running
+        across cores; otherwise each row is solved in turn.
+    """
+    cash_flows = np.ascontiguousarray(cash_flow_matrix, dtype=np.float64)
+    irr_rows = _irr_gufunc()
+    if irr_rows is not None:
+        return irr_rows(cash_flows)
+    return np.array([_irr_solve(row) for row in cash_flows])
 
 
 def npv_calculation(cash_flows: List[float], discount_rate: float) -> float:
@@ -58,12 +300,43 @@ def npv_calculation(cash_flows: List[float], discount_rate: float) -> float:
         where k is the discount rate
 
     Note:
-        Uses numpy-financial library.
+        Evaluated with Horner's scheme in x = 1/(1+k); use npv_batch() for
+        many rates or scenarios at once.
     """
     if not cash_flows:
         return 0.0
 
-    return float(npf.npv(discount_rate, cash_flows))
+    return _npv_horner(discount_rate, cash_flows)
+
+
+def npv_batch(
+    discount_rates: Union[float, List[float], np.ndarray],
+    cash_flows: Union[List[float], List[List[float]], np.ndarray]
+) -> np.ndarray:
+    """
+    Calculate NPV for many discount rates (and cash flow scenarios) at once.
+
+    Args:
+        discount_rates: Discount rates as decimals, shape (R,); a scalar is treated as R = 1
+        cash_flows: One cash flow series [CF_0, ..., CF_T], shape (T+1,),
+                    or S scenarios of equal length, shape (S, T+1)
+
+    Returns:
+        np.ndarray: NPVs of shape (R,) for a single series, or (R, S) for scenarios
+
+    Formula:
+        NPV[r, s] = Σ(CF[s, t] / (1+k_r)^t) for t=0 to T
+
+    Example:
+        >>> npv_batch([0.05, 0.08, 0.10], [-100000, 30000, 40000, 50000])
+    """
+    rates = np.atleast_1d(np.asarray(discount_rates, dtype=np.float64))
+    cf = np.asarray(cash_flows, dtype=np.float64)
+    t = np.arange(cf.shape[-1], dtype=np.float64)
+
+    # Reason: one (R, T+1) discount matrix and one matmul replace R × S npf.npv calls
+    discount = np.power(1.0 + rates[:, None], -t[None, :])
+    return discount @ cf.T
 
 
 def net_sale_proceeds(
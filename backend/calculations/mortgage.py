@@ -4,9 +4,34 @@ Mortgage calculation functions.
 Formulas from INITIAL.md:
 - Monthly Mortgage (amortizing): M = P × (i / (1 - (1 + i)^-n))
   where P=loan principal, i=monthly interest rate, n=months
+- Remaining Balance after k payments: B_k = P × (1 + i)^k − M × ((1 + i)^k − 1) / i
 """
 
-from typing import List, Dict
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from backend.calculations._jit import njit
+
+
+@lru_cache(maxsize=1024)
+def _pmt_factor(annual_rate: float, years: int) -> float:
+    """
+    Monthly payment per unit of principal for a given rate and term.
+
+    Formula:
+        i / (1 - (1 + i)^-n) = i / -expm1(-n × log1p(i))
+        1 / n when i = 0
+    """
+    num_payments = years * 12
+    if annual_rate == 0:
+        return 1 / num_payments
+
+    monthly_rate = annual_rate / 12
+    # Reason: expm1/log1p compute 1 - (1 + i)^-n without cancellation for small i
+    return monthly_rate / -math.expm1(-num_payments * math.log1p(monthly_rate))
 
 
 def monthly_payment(principal: float, annual_rate: float, years: int) -> float:
@@ -24,25 +49,169 @@ def monthly_payment(principal: float, annual_rate: float, years: int) -> float:
     Formula:
         M = P × (i / (1 - (1 + i)^-n))
         where i = monthly rate, n = number of months
+
+    Note:
+        The payment factor is cached per exact (annual_rate, years) pair.
+    """
+    if principal <= 0 or years <= 0:
+        return 0.0
+
+    return principal * _pmt_factor(annual_rate, years)
+
+
+@njit(cache=True)
+def _payment_kernel(principal: float, annual_rate: float, years: float) -> float:
+    """
+    Monthly payment for use inside compiled batch kernels (same formula as monthly_payment).
+
+    Args:
+        principal: Loan principal amount
+        annual_rate: Annual interest rate
+        years: Loan term in years
+
+    Returns:
+        float: Monthly payment amount (0 when there is no loan)
+    """
+    if principal <= 0 or years <= 0:
+        return 0.0
+
+    num_payments = years * 12
+    if annual_rate == 0:
+        return principal / num_payments
+
+    monthly_rate = annual_rate / 12
+    return principal * (monthly_rate / -math.expm1(-num_payments * math.log1p(monthly_rate)))
+
+
+def remaining_balance(principal: float, annual_rate: float, years: int, month: int) -> float:
+    """
+    Calculate the remaining loan balance after a given number of payments.
+
+    Args:
+        principal: Loan principal amount
+        annual_rate: Annual interest rate (e.g., 0.03 for 3%)
+        years: Loan term in years
+        month: Number of payments made (e.g., 120 for a sale after 10 years)
+
+    Returns:
+        float: Remaining balance (0 once the loan is paid off)
+
+    Formula:
+        B_k = P × (1 + i)^k − M × ((1 + i)^k − 1) / i
+        B_k = P − M × k when i = 0
     """
     if principal <= 0 or years <= 0:
         return 0.0
 
+    num_payments = years * 12
+    k = min(max(month, 0), num_payments)
+    if k == num_payments:
+        return 0.0
+    payment = monthly_payment(principal, annual_rate, years)
+
     if annual_rate == 0:
-        return principal / (years * 12)
+        return max(0.0, principal - payment * k)
 
     monthly_rate = annual_rate / 12
+    growth = (1 + monthly_rate) ** k
+    return max(0.0, principal * growth - payment * (growth - 1) / monthly_rate)
+
+
+def remaining_balance_vec(
+    principal: float,
+    annual_rate: float,
+    years: int,
+    months: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized remaining_balance() for many payment counts at once.
+
+    Args:
+        principal: Loan principal amount
+        annual_rate: Annual interest rate (e.g., 0.03 for 3%)
+        years: Loan term in years
+        months: Array of payment counts
+
+    Returns:
+        np.ndarray: Remaining balance after each payment count
+    """
+    months = np.asarray(months)
+    if principal <= 0 or years <= 0:
+        return np.zeros(months.shape, dtype=np.float64)
+
     num_payments = years * 12
+    k = np.clip(months, 0, num_payments).astype(np.float64)
+    payment = monthly_payment(principal, annual_rate, years)
+
+    if annual_rate == 0:
+        balances = principal - payment * k
+    else:
+        monthly_rate = annual_rate / 12
+        growth = np.power(1 + monthly_rate, k)
+        balances = principal * growth - payment * (growth - 1) / monthly_rate
+
+    # Reason: rounding can leave a tiny residue at payoff; the loan is fully repaid there
+    return np.where(k >= num_payments, 0.0, np.maximum(0.0, balances))
 
-    payment = principal * (monthly_rate / (1 - (1 + monthly_rate) ** -num_payments))
-    return payment
+
+@njit(cache=True)
+def _amort_kernel(
+    principal: float,
+    monthly_rate: float,
+    num_payments: int,
+    payment: float,
+    payments: np.ndarray,
+    principal_payments: np.ndarray,
+    interest_payments: np.ndarray,
+    balances: np.ndarray
+) -> None:
+    """
+    Fill preallocated arrays with the month-by-month amortization recurrence.
+
+    Formula:
+        interest_t = balance_{t-1} × i
+        principal_t = M - interest_t
+        balance_t = balance_{t-1} - principal_t
+    """
+    remaining_balance = principal
+    for k in range(num_payments):
+        interest_payment = remaining_balance * monthly_rate
+        principal_payment = payment - interest_payment
+        remaining_balance -= principal_payment
+
+        payments[k] = payment
+        principal_payments[k] = principal_payment
+        interest_payments[k] = interest_payment
+        balances[k] = max(0.0, remaining_balance)
+
+
+@dataclass(slots=True, frozen=True)
+class AmortSchedule:
+    """
+    Amortization schedule as parallel arrays (one entry per monthly payment).
+
+    Attributes:
+        payment_number: Payment number (1..n)
+        payment: Monthly payment (principal + interest)
+        principal_payment: Principal portion of each payment
+        interest_payment: Interest portion of each payment
+        remaining_balance: Loan balance after each payment
+    """
+    payment_number: np.ndarray
+    payment: np.ndarray
+    principal_payment: np.ndarray
+    interest_payment: np.ndarray
+    remaining_balance: np.ndarray
+
+    def __len__(self) -> int:
+        return self.payment_number.shape[0]
 
 
 def amortization_schedule(
     principal: float,
     annual_rate: float,
     years: int
-) -> List[Dict[str, float]]:
+) -> AmortSchedule:
     """
     Generate amortization schedule for a loan.
 
@@ -52,30 +221,36 @@ def amortization_schedule(
         years: Loan term in years
 
     Returns:
-        List of dictionaries with keys: payment_number, payment, principal_payment,
-        interest_payment, remaining_balance
+        AmortSchedule: Columns payment_number, payment, principal_payment,
+        interest_payment, remaining_balance (payment k at index k-1;
+        empty when there is no loan)
+
+    Example:
+        >>> schedule = amortization_schedule(400000, 0.035, 20)
+        >>> total_interest = schedule.interest_payment.sum()
     """
     if principal <= 0 or years <= 0:
-        return []
+        empty = np.empty(0, dtype=np.float64)
+        return AmortSchedule(np.empty(0, dtype=np.int64), empty, empty, empty, empty)
 
     monthly_rate = annual_rate / 12
     num_payments = years * 12
     payment = monthly_payment(principal, annual_rate, years)
 
-    schedule = []
-    remaining_balance = principal
-
-    for month in range(1, num_payments + 1):
-        interest_payment = remaining_balance * monthly_rate
-        principal_payment = payment - interest_payment
-        remaining_balance -= principal_payment
+    payments = np.empty(num_payments, dtype=np.float64)
+    principal_payments = np.empty(num_payments, dtype=np.float64)
+    interest_payments = np.empty(num_payments, dtype=np.float64)
+    balances = np.empty(num_payments, dtype=np.float64)
 
-        schedule.append({
-            "payment_number": month,
-            "payment": payment,
-            "principal_payment": principal_payment,
-            "interest_payment": interest_payment,
-            "remaining_balance": max(0, remaining_balance)
-        })
+    _amort_kernel(
+        float(principal), float(monthly_rate), num_payments, float(payment),
+        payments, principal_payments, interest_payments, balances
+    )
 
-    return schedule
\ No newline at end of file
+    return AmortSchedule(
+        payment_number=np.arange(1, num_payments + 1),
+        payment=payments,
+        principal_payment=principal_payments,
+        interest_payment=interest_payments,
+        remaining_balance=balances
+    )
@@ -16,18 +16,170 @@ Fit = Σ(w_i · s_i^norm)
 with profile-specific weights and normalized metric scores.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, Union
 from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+from backend.calculations._jit import njit
+
+
+# Score tables: one row per strategy, one column per metric
+# Metrics: [market_rent - tmc, dscr, -price_discount_pct, irr, bedrooms, dpe_score]
+# Unused metrics get weight 0 (with a dummy 0-1 range).
+# Reason: columns are ordered so each weighted sum adds terms in the same order
+# as the original per-strategy formulas.
+OWNER_OCCUPIER, LOCATION_NUE, LMNP, COLOCATION, VALUE_ADD = range(5)
+
+_SCORE_MINS = np.array([
+    [-1000.0, 0.0, -0.20, 0.0, 0.0, 0.0],   # Owner-occupier
+    [0.0, 0.8, 0.0, 0.02, 0.0, 0.0],        # Location nue
+    [0.0, 0.8, 0.0, 0.03, 0.0, 0.0],        # LMNP
+    [0.0, 0.8, 0.0, 0.05, 1.0, 0.0],        # Colocation
+    [0.0, 0.0, -0.30, 0.08, 0.0, 0.0],      # Value-Add
+])
+_SCORE_MAXS = np.array([
+    [1000.0, 1.0, 0.05, 1.0, 1.0, 1.0],
+    [1.0, 1.5, 1.0, 0.12, 1.0, 1.0],
+    [1.0, 1.5, 1.0, 0.15, 1.0, 1.0],
+    [1.0, 1.8, 1.0, 0.20, 5.0, 1.0],
+    [1.0, 1.0, 0.0, 0.25, 1.0, 100.0],
+])
+_SCORE_WEIGHTS = np.array([
+    [0.6, 0.0, 0.4, 0.0, 0.0, 0.0],
+    [0.0, 0.5, 0.0, 0.5, 0.0, 0.0],
+    [0.0, 0.5, 0.0, 0.5, 0.0, 0.0],
+    [0.0, 0.4, 0.0, 0.4, 0.2, 0.0],
+    [0.0, 0.0, 0.4, 0.3, 0.0, 0.3],
+])
+
+# Optimal 5-element sorting network (9 compare-swaps) for ranking the strategies
+_SORT_NETWORK_5 = ((0, 1), (3, 4), (2, 4), (2, 3), (1, 4), (0, 3), (0, 2), (1, 3), (1, 2))
+
+
+# Pros/cons tables
+# Entries are (template, args) pairs formatted only when StrategyFit.pros/cons
+# is read. Static entries are shared pairs with no args; dynamic entries are
+# templates grouped by threshold bin and only deferred when their bin fires.
+# 3-way tables are indexed by bin + 1 with bin = (value > high) - (value < low).
+
+# Deferred text: str.format template and its positional args
+DeferredText = Tuple[str, tuple]
+
+
+def _static(*texts: str) -> Tuple[DeferredText, ...]:
+    """Wrap fixed texts as deferred entries with no format args."""
+    return tuple((text, ()) for text in texts)
+
+
+# Owner-occupier
+_OWNER_STATIC_PROS = _static(
+    "Build equity through principal payments",
+    "Stable housing costs (fixed-rate mortgage)",
+)
+_OWNER_STATIC_CONS = _static(
+    "Lower liquidity vs renting",
+    "Maintenance and repair responsibilities",
+)
+_OWNER_DISCOUNT_PROS = (("Property priced {:.0%} below market",), (), ())
+_OWNER_DISCOUNT_CONS = ((), (), ("Property priced {:.0%} above market",))
+
+# Cash flow (DSCR) bins shared by rental strategies
+_DSCR_STRONG_PROS = ((), (), ("Strong cash flow (DSCR: {:.2f})",))
+_DSCR_NEGATIVE_CONS = (("Negative cash flow (DSCR: {:.2f})",), (), ())
+
+# IRR bins shared by rental strategies
+_IRR_EXCELLENT_PROS = ((), (), ("Excellent IRR: {:.1%}",))
+_IRR_LOW_CONS = (("Low IRR: {:.1%}",), (), ())
+
+# Location nue (unfurnished)
+_NUE_STATIC_PROS = _static(
+    "30% flat tax abatement (micro-foncier)",
+    "Long-term tenant stability",
+)
+_NUE_STATIC_CONS = _static(
+    "Lower rent vs furnished (typically 20-30% less)",
+    "Tenant protections favor long leases",
+)
+_NUE_DSCR_REASONS = (("Monthly losses expected",), (), ("Positive monthly cash flow",))
+
+# LMNP (furnished, micro-BIC)
+_LMNP_STATIC_PROS = _static(
+    "50% gross rent abatement (micro-BIC)",
+    "Higher rent vs unfurnished (20-30% premium)",
+    "Flexible tenant turnover",
+)
+_LMNP_STATIC_CONS = _static(
+    "Furniture and equipment costs",
+    "Higher vacancy risk with short leases",
+    "More intensive management required",
+)
+_LMNP_DSCR_REASONS = ((), (), ("Positive monthly cash flow",))
+_LMNP_IRR_REASONS = ((), (), ("High return potential",))
+
+# Colocation
+_COLOC_STATIC_PROS = _static(
+    "Rent per room typically exceeds whole-unit rent",
+    "Risk diversification across multiple tenants",
+)
+_COLOC_STATIC_CONS = _static(
+    "Complex management (multiple leases)",
+    "Higher turnover and vacancy coordination",
+    "Tenant compatibility issues",
+    "Furnished requirements increase upfront costs",
+)
+_COLOC_DSCR_PROS = ((), (), ("Excellent cash flow (DSCR: {:.2f})",))
+_COLOC_DSCR_REASONS = ((), (), ("Room-by-room rents boost income",))
+
+# Value-Add / déficit foncier
+_VALUE_ADD_STATIC_PROS = _static(
+    "Déficit foncier: Deduct renovation costs from income",
+    "Post-renovation: Higher rents and property value",
+    "Forced appreciation through improvements",
+)
+_VALUE_ADD_STATIC_CONS = _static(
+    "Requires upfront capital for renovations",
+    "Construction risk and timeline uncertainty",
+    "No rental income during works",
+    "Requires project management expertise",
+)
+_POOR_DPE_GRADES = frozenset(("E", "F", "G"))
+
+
+def _defer_all(templates: Tuple[str, ...], value: Any) -> Tuple[DeferredText, ...]:
+    """Pair each template with value for later formatting (no work for an empty bin)."""
+    return tuple((template, (value,)) for template in templates)
+
+
+def _materialize(items: List[DeferredText]) -> List[str]:
+    """Format deferred (template, args) entries into display strings."""
+    return [template.format(*args) if args else template for template, args in items]
 
 
 @dataclass
 class StrategyFit:
-    """Strategy fit score with reasons."""
+    """
+    Strategy fit score with reasons.
+
+    Pros and cons are kept as (template, args) entries and formatted on first
+    access of `pros` / `cons`, so ranking by score never builds the strings.
+    """
     strategy: str
     score: float  # 0-100
     reasons: List[str]
-    pros: List[str]
-    cons: List[str]
+    pro_items: List[DeferredText]
+    con_items: List[DeferredText]
+
+    @cached_property
+    def pros(self) -> List[str]:
+        """Formatted advantages of this strategy."""
+        return _materialize(self.pro_items)
+
+    @cached_property
+    def cons(self) -> List[str]:
+        """Formatted drawbacks of this strategy."""
+        return _materialize(self.con_items)
 
 
 def normalize_score(value: float, min_val: float, max_val: float) -> float:
@@ -44,8 +196,102 @@ def normalize_score(value: float, min_val: float, max_val: float) -> float:
     """
     if max_val == min_val:
         return 50.0
-    normalized = ((value - min_val) / (max_val - min_val)) * 100
-    return max(0.0, min(100.0, normalized))
+    return max(0.0, min(100.0, ((value - min_val) / (max_val - min_val)) * 100))
+
+
+def normalize_score_array(
+    values: np.ndarray,
+    min_val: Union[float, np.ndarray],
+    max_val: Union[float, np.ndarray]
+) -> np.ndarray:
+    """
+    Vectorized normalize_score() for arrays of values (and/or ranges).
+
+    Args:
+        values: Values to normalize
+        min_val: Minimum value(s) (map to 0), broadcast against values
+        max_val: Maximum value(s) (map to 100), broadcast against values
+
+    Returns:
+        np.ndarray: Normalized scores (0-100); 50 where the range is empty
+    """
+    values = np.asarray(values, dtype=np.float64)
+    span = np.asarray(max_val, dtype=np.float64) - min_val
+    empty = span == 0
+    # Reason: divide by 1 on empty ranges so np.where never sees inf/nan;
+    # fmin-then-maximum mirrors normalize_score's nesting, so NaN maps to 100
+    normalized = np.maximum(0.0, np.fmin(100.0, (values - min_val) / np.where(empty, 1.0, span) * 100))
+    return np.where(empty, 50.0, normalized)
+
+
+@njit(inline="always")
+def _clamped_score(value: float, min_val: float, max_val: float) -> float:
+    """
+    Normalized 0-100 score for the score kernel (ranges are never empty there).
+
+    Args:
+        value: Value to normalize
+        min_val: Minimum value (maps to 0)
+        max_val: Maximum value (maps to 100)
+
+    Returns:
+        float: Clamped normalized score (0-100)
+    """
+    return max(0.0, min(100.0, ((value - min_val) / (max_val - min_val)) * 100))
+
+
+@njit(cache=True)
+def _score_kernel(
+    metrics: np.ndarray,
+    mins: np.ndarray,
+    maxs: np.ndarray,
+    weights: np.ndarray
+) -> np.ndarray:
+    """
+    Weighted sum of clamped, normalized metric scores for each strategy row.
+
+    Args:
+        metrics: Metric vector of shape (M,)
+        mins: Per-strategy metric minimums of shape (S, M) (map to 0)
+        maxs: Per-strategy metric maximums of shape (S, M) (map to 100)
+        weights: Per-strategy metric weights of shape (S, M)
+
+    Returns:
+        np.ndarray: Fit score per strategy, shape (S,)
+
+    Formula:
+        Fit_s = Σ(w_sm · clamp((x_m - min_sm) / (max_sm - min_sm) × 100, 0, 100))
+    """
+    n_strategies, n_metrics = weights.shape
+    scores = np.zeros(n_strategies)
+    for s in range(n_strategies):
+        total = 0.0
+        for m in range(n_metrics):
+            total += weights[s, m] * _clamped_score(metrics[m], mins[s, m], maxs[s, m])
+        scores[s] = total
+    return scores
+
+
+def _strategy_metrics(
+    tmc: float = 0.0,
+    market_rent: float = 0.0,
+    dscr: float = 0.0,
+    irr: float = 0.0,
+    price_discount_pct: float = 0.0,
+    bedrooms: int = 0,
+    dpe_grade: str = ""
+) -> np.ndarray:
+    """Build the metric vector used by the score tables."""
+    dpe_score = 100.0 if dpe_grade in _POOR_DPE_GRADES else 50.0  # Poor DPE = value-add opportunity
+    return np.array([
+        market_rent - tmc, dscr, -price_discount_pct, irr, bedrooms, dpe_score
+    ], dtype=np.float64)
+
+
+def _base_score(strategy: int, metrics: np.ndarray) -> float:
+    """Base fit score (before penalties) of a single strategy."""
+    row = slice(strategy, strategy + 1)
+    return float(_score_kernel(metrics, _SCORE_MINS[row], _SCORE_MAXS[row], _SCORE_WEIGHTS[row])[0])
 
 
 def calculate_owner_occupier_fit(
@@ -53,7 +299,8 @@ def calculate_owner_occupier_fit(
     market_rent: float,
     dscr: float,
     price_discount_pct: float,
-    legal_rent_compliant: bool
+    legal_rent_compliant: bool,
+    base_score: Optional[float] = None
 ) -> StrategyFit:
     """
     Calculate fit score for owner-occupier strategy.
@@ -64,48 +311,51 @@ def calculate_owner_occupier_fit(
         dscr: Debt service coverage ratio
         price_discount_pct: Discount vs median (e.g., -0.10 for 10% below)
         legal_rent_compliant: Whether property complies with rent control
+        base_score: Precomputed score from _score_kernel (computed if omitted)
 
     Returns:
         StrategyFit: Strategy fit with score and reasons
     """
-    pros = []
-    cons = []
-    reasons = []
-
     # Calculate net housing cost vs renting
     net_cost_vs_rent = tmc - market_rent
 
-    # Score components (0-100 each)
-    cost_score = normalize_score(-net_cost_vs_rent, -1000, 1000)  # Better if TMC < rent
-    discount_score = normalize_score(-price_discount_pct, -0.20, 0.05)  # Better with discount
-
-    # Weighted average
-    score = (cost_score * 0.6 + discount_score * 0.4)
+    # Weighted score: cost vs rent (60%, better if TMC < rent) and discount (40%)
+    if base_score is None:
+        base_score = _base_score(
+            OWNER_OCCUPIER,
+            _strategy_metrics(tmc=tmc, market_rent=market_rent, price_discount_pct=price_discount_pct)
+        )
+    score = base_score
 
     # Pros/Cons
     if net_cost_vs_rent < 0:
-        pros.append(f"Monthly cost €{abs(net_cost_vs_rent):.0f} less than renting")
-        reasons.append("Ownership cheaper than renting")
+        cost_pros = (("Monthly cost €{:.0f} less than renting", (abs(net_cost_vs_rent),)),)
+        cost_cons = ()
+        reasons = ["Ownership cheaper than renting"]
     else:
-        cons.append(f"Monthly cost €{net_cost_vs_rent:.0f} more than renting")
-
-    if price_discount_pct < -0.05:
-        pros.append(f"Property priced {abs(price_discount_pct)*100:.0f}% below market")
-    elif price_discount_pct > 0.05:
-        cons.append(f"Property priced {price_discount_pct*100:.0f}% above market")
+        cost_pros = ()
+        cost_cons = (("Monthly cost €{:.0f} more than renting", (net_cost_vs_rent,)),)
+        reasons = []
 
-    pros.append("Build equity through principal payments")
-    pros.append("Stable housing costs (fixed-rate mortgage)")
+    discount_bin = (price_discount_pct > 0.05) - (price_discount_pct < -0.05) + 1
 
-    cons.append("Lower liquidity vs renting")
-    cons.append("Maintenance and repair responsibilities")
+    pros = [
+        *cost_pros,
+        *_defer_all(_OWNER_DISCOUNT_PROS[discount_bin], abs(price_discount_pct)),
+        *_OWNER_STATIC_PROS,
+    ]
+    cons = [
+        *cost_cons,
+        *_defer_all(_OWNER_DISCOUNT_CONS[discount_bin], price_discount_pct),
+        *_OWNER_STATIC_CONS,
+    ]
 
     return StrategyFit(
         strategy="Owner-occupier",
         score=score,
         reasons=reasons,
-        pros=pros,
-        cons=cons
+        pro_items=pros,
+        con_items=cons
     )
 
 
@@ -113,7 +363,8 @@ def calculate_location_nue_fit(
     dscr: float,
     irr: float,
     legal_rent_compliant: bool,
-    bedrooms: int
+    bedrooms: int,
+    base_score: Optional[float] = None
 ) -> StrategyFit:
     """
     Calculate fit score for location nue (unfurnished rental) strategy.
@@ -123,52 +374,48 @@ def calculate_location_nue_fit(
         irr: Internal rate of return
         legal_rent_compliant: Whether rent complies with encadrement
         bedrooms: Number of bedrooms
+        base_score: Precomputed score from _score_kernel (computed if omitted)
 
     Returns:
         StrategyFit: Strategy fit with score and reasons
     """
-    pros = []
-    cons = []
-    reasons = []
-
-    # Score components
-    dscr_score = normalize_score(dscr, 0.8, 1.5)  # DSCR > 1.2 is good
-    irr_score = normalize_score(irr, 0.02, 0.12)  # IRR 2-12% range
-
-    # Weighted average
-    score = (dscr_score * 0.5 + irr_score * 0.5)
+    # Weighted score: DSCR 0.8-1.5 (50%) and IRR 2-12% (50%)
+    if base_score is None:
+        base_score = _base_score(LOCATION_NUE, _strategy_metrics(dscr=dscr, irr=irr))
+    score = base_score
 
     # Adjust for compliance
     if not legal_rent_compliant:
         score *= 0.7  # 30% penalty for non-compliance
-        cons.append("Rent exceeds legal ceiling (encadrement)")
-        reasons.append("Legal risk with current rent")
+        compliance_cons = _static("Rent exceeds legal ceiling (encadrement)")
+        compliance_reasons = ("Legal risk with current rent",)
+    else:
+        compliance_cons = ()
+        compliance_reasons = ()
 
     # Pros/Cons
-    if dscr > 1.2:
-        pros.append(f"Strong cash flow (DSCR: {dscr:.2f})")
-        reasons.append("Positive monthly cash flow")
-    elif dscr < 1.0:
-        cons.append(f"Negative cash flow (DSCR: {dscr:.2f})")
-        reasons.append("Monthly losses expected")
-
-    if irr > 0.08:
-        pros.append(f"Excellent IRR: {irr*100:.1f}%")
-    elif irr < 0.04:
-        cons.append(f"Low IRR: {irr*100:.1f}%")
-
-    pros.append("30% flat tax abatement (micro-foncier)")
-    pros.append("Long-term tenant stability")
+    dscr_bin = (dscr > 1.2) - (dscr < 1.0) + 1
+    irr_bin = (irr > 0.08) - (irr < 0.04) + 1
 
-    cons.append("Lower rent vs furnished (typically 20-30% less)")
-    cons.append("Tenant protections favor long leases")
+    pros = [
+        *_defer_all(_DSCR_STRONG_PROS[dscr_bin], dscr),
+        *_defer_all(_IRR_EXCELLENT_PROS[irr_bin], irr),
+        *_NUE_STATIC_PROS,
+    ]
+    cons = [
+        *compliance_cons,
+        *_defer_all(_DSCR_NEGATIVE_CONS[dscr_bin], dscr),
+        *_defer_all(_IRR_LOW_CONS[irr_bin], irr),
+        *_NUE_STATIC_CONS,
+    ]
+    reasons = [*compliance_reasons, *_NUE_DSCR_REASONS[dscr_bin]]
 
     return StrategyFit(
         strategy="Location nue (unfurnished)",
         score=score,
         reasons=reasons,
-        pros=pros,
-        cons=cons
+        pro_items=pros,
+        con_items=cons
     )
 
 
@@ -176,7 +423,8 @@ def calculate_lmnp_fit(
     dscr: float,
     irr: float,
     legal_rent_compliant: bool,
-    bedrooms: int
+    bedrooms: int,
+    base_score: Optional[float] = None
 ) -> StrategyFit:
     """
     Calculate fit score for LMNP (furnished rental) strategy.
@@ -186,53 +434,46 @@ def calculate_lmnp_fit(
         irr: Internal rate of return
         legal_rent_compliant: Whether rent complies with encadrement
         bedrooms: Number of bedrooms
+        base_score: Precomputed score from _score_kernel (computed if omitted)
 
     Returns:
         StrategyFit: Strategy fit with score and reasons
     """
-    pros = []
-    cons = []
-    reasons = []
-
-    # Score components
-    dscr_score = normalize_score(dscr, 0.8, 1.5)
-    irr_score = normalize_score(irr, 0.03, 0.15)  # Higher IRR potential for furnished
-
-    # Weighted average
-    score = (dscr_score * 0.5 + irr_score * 0.5)
+    # Weighted score: DSCR 0.8-1.5 (50%) and IRR 3-15% (50%, higher potential for furnished)
+    if base_score is None:
+        base_score = _base_score(LMNP, _strategy_metrics(dscr=dscr, irr=irr))
+    score = base_score
 
     # Adjust for compliance
     if not legal_rent_compliant:
         score *= 0.7
-        cons.append("Furnished rent exceeds legal ceiling")
+        compliance_cons = _static("Furnished rent exceeds legal ceiling")
+    else:
+        compliance_cons = ()
 
     # Pros/Cons
-    if dscr > 1.2:
-        pros.append(f"Strong cash flow (DSCR: {dscr:.2f})")
-        reasons.append("Positive monthly cash flow")
-    elif dscr < 1.0:
-        cons.append(f"Negative cash flow (DSCR: {dscr:.2f})")
-
-    if irr > 0.10:
-        pros.append(f"Excellent IRR: {irr*100:.1f}%")
-        reasons.append("High return potential")
-    elif irr < 0.05:
-        cons.append(f"Low IRR: {irr*100:.1f}%")
-
-    pros.append("50% gross rent abatement (micro-BIC)")
-    pros.append("Higher rent vs unfurnished (20-30% premium)")
-    pros.append("Flexible tenant turnover")
-
-    cons.append("Furniture and equipment costs")
-    cons.append("Higher vacancy risk with short leases")
-    cons.append("More intensive management required")
+    dscr_bin = (dscr > 1.2) - (dscr < 1.0) + 1
+    irr_bin = (irr > 0.10) - (irr < 0.05) + 1
+
+    pros = [
+        *_defer_all(_DSCR_STRONG_PROS[dscr_bin], dscr),
+        *_defer_all(_IRR_EXCELLENT_PROS[irr_bin], irr),
+        *_LMNP_STATIC_PROS,
+    ]
+    cons = [
+        *compliance_cons,
+        *_defer_all(_DSCR_NEGATIVE_CONS[dscr_bin], dscr),
+        *_defer_all(_IRR_LOW_CONS[irr_bin], irr),
+        *_LMNP_STATIC_CONS,
+    ]
+    reasons = [*_LMNP_DSCR_REASONS[dscr_bin], *_LMNP_IRR_REASONS[irr_bin]]
 
     return StrategyFit(
         strategy="LMNP (furnished, micro-BIC)",
         score=score,
         reasons=reasons,
-        pros=pros,
-        cons=cons
+        pro_items=pros,
+        con_items=cons
     )
 
 
@@ -240,7 +481,8 @@ def calculate_colocation_fit(
     dscr: float,
     irr: float,
     bedrooms: int,
-    legal_rent_compliant: bool
+    legal_rent_compliant: bool,
+    base_score: Optional[float] = None
 ) -> StrategyFit:
     """
     Calculate fit score for colocation (flatshare) strategy.
@@ -250,60 +492,57 @@ def calculate_colocation_fit(
         irr: Internal rate of return
         bedrooms: Number of bedrooms
         legal_rent_compliant: Whether rent complies with encadrement
+        base_score: Precomputed score from _score_kernel (computed if omitted)
 
     Returns:
         StrategyFit: Strategy fit with score and reasons
     """
-    pros = []
-    cons = []
-    reasons = []
-
-    # Score components
-    dscr_score = normalize_score(dscr, 0.8, 1.8)  # Higher DSCR potential
-    irr_score = normalize_score(irr, 0.05, 0.20)  # Higher IRR potential
-    bedrooms_score = normalize_score(bedrooms, 1, 5)  # More bedrooms better
-
-    # Weighted average
-    score = (dscr_score * 0.4 + irr_score * 0.4 + bedrooms_score * 0.2)
+    # Weighted score: DSCR 0.8-1.8 (40%), IRR 5-20% (40%), bedrooms 1-5 (20%)
+    if base_score is None:
+        base_score = _base_score(COLOCATION, _strategy_metrics(dscr=dscr, irr=irr, bedrooms=bedrooms))
+    score = base_score
 
     # Penalty for insufficient bedrooms
     if bedrooms < 2:
         score *= 0.3  # 70% penalty - colocation needs multiple bedrooms
-        cons.append("Insufficient bedrooms for colocation")
-        reasons.append("Not suitable for flatsharing")
+        bedroom_cons = _static("Insufficient bedrooms for colocation")
+        bedroom_reasons = ("Not suitable for flatsharing",)
+    elif bedrooms >= 3:
+        bedroom_cons = ()
+        bedroom_reasons = ("Multiple-room premium",)
+    else:
+        bedroom_cons = ()
+        bedroom_reasons = ()
 
     # Pros/Cons
-    if bedrooms >= 3:
-        pros.append(f"{bedrooms} bedrooms ideal for colocation")
-        reasons.append("Multiple-room premium")
-
-    if dscr > 1.4:
-        pros.append(f"Excellent cash flow (DSCR: {dscr:.2f})")
-        reasons.append("Room-by-room rents boost income")
-    elif dscr < 1.0:
-        cons.append(f"Negative cash flow (DSCR: {dscr:.2f})")
-
-    if irr > 0.15:
-        pros.append(f"Exceptional IRR: {irr*100:.1f}%")
-        reasons.append("Maximum revenue optimization")
-
-    pros.append("Rent per room typically exceeds whole-unit rent")
-    pros.append("Risk diversification across multiple tenants")
-
-    cons.append("Complex management (multiple leases)")
-    cons.append("Higher turnover and vacancy coordination")
-    cons.append("Tenant compatibility issues")
-    cons.append("Furnished requirements increase upfront costs")
-
-    if not legal_rent_compliant:
-        cons.append("Room rents may exceed encadrement limits")
+    bedroom_pros = (("{} bedrooms ideal for colocation", (bedrooms,)),) if bedrooms >= 3 else ()
+    dscr_bin = (dscr > 1.4) - (dscr < 1.0) + 1
+    exceptional_irr = irr > 0.15
+
+    pros = [
+        *bedroom_pros,
+        *_defer_all(_COLOC_DSCR_PROS[dscr_bin], dscr),
+        *((("Exceptional IRR: {:.1f}%", (irr*100,)),) if exceptional_irr else ()),
+        *_COLOC_STATIC_PROS,
+    ]
+    cons = [
+        *bedroom_cons,
+        *_defer_all(_DSCR_NEGATIVE_CONS[dscr_bin], dscr),
+        *_COLOC_STATIC_CONS,
+        *(() if legal_rent_compliant else _static("Room rents may exceed encadrement limits")),
+    ]
+    reasons = [
+        *bedroom_reasons,
+        *_COLOC_DSCR_REASONS[dscr_bin],
+        *(("Maximum revenue optimization",) if exceptional_irr else ()),
+    ]
 
     return StrategyFit(
         strategy="Colocation",
         score=score,
         reasons=reasons,
-        pros=pros,
-        cons=cons
+        pro_items=pros,
+        con_items=cons
     )
 
 
@@ -311,7 +550,8 @@ def calculate_value_add_fit(
     dscr: float,
     irr: float,
     price_discount_pct: float,
-    dpe_grade: str
+    dpe_grade: str,
+    base_score: Optional[float] = None
 ) -> StrategyFit:
     """
     Calculate fit score for value-add / déficit foncier strategy.
@@ -321,52 +561,48 @@ def calculate_value_add_fit(
         irr: Internal rate of return
         price_discount_pct: Discount vs median
         dpe_grade: DPE energy grade
+        base_score: Precomputed score from _score_kernel (computed if omitted)
 
     Returns:
         StrategyFit: Strategy fit with score and reasons
     """
-    pros = []
-    cons = []
-    reasons = []
+    poor_dpe = dpe_grade in _POOR_DPE_GRADES
 
-    # Score components
-    discount_score = normalize_score(-price_discount_pct, -0.30, 0.0)  # Bigger discount better
-    irr_score = normalize_score(irr, 0.08, 0.25)  # Higher IRR potential post-renovation
-    dpe_score = 100 if dpe_grade in ["E", "F", "G"] else 50  # Poor DPE = value-add opportunity
-
-    # Weighted average
-    score = (discount_score * 0.4 + irr_score * 0.3 + dpe_score * 0.3)
+    # Weighted score: discount 0-30% (40%), IRR 8-25% post-renovation (30%),
+    # DPE (30%: 100 for E/F/G upgrade opportunity, else 50)
+    if base_score is None:
+        base_score = _base_score(
+            VALUE_ADD,
+            _strategy_metrics(irr=irr, price_discount_pct=price_discount_pct, dpe_grade=dpe_grade)
+        )
+    score = base_score
 
     # Pros/Cons
-    if price_discount_pct < -0.10:
-        pros.append(f"Significant discount: {abs(price_discount_pct)*100:.0f}%")
-        reasons.append("Below-market acquisition")
-
-    if dpe_grade in ["E", "F", "G"]:
-        pros.append(f"DPE {dpe_grade}: Major energy upgrade potential")
-        reasons.append("Renovation value-add opportunity")
-    else:
-        cons.append(f"DPE {dpe_grade}: Limited energy upgrade value")
-
-    if irr > 0.15:
-        pros.append(f"High IRR post-renovation: {irr*100:.1f}%")
-        reasons.append("Strong value creation potential")
-
-    pros.append("Déficit foncier: Deduct renovation costs from income")
-    pros.append("Post-renovation: Higher rents and property value")
-    pros.append("Forced appreciation through improvements")
-
-    cons.append("Requires upfront capital for renovations")
-    cons.append("Construction risk and timeline uncertainty")
-    cons.append("No rental income during works")
-    cons.append("Requires project management expertise")
+    big_discount = price_discount_pct < -0.10
+    high_irr = irr > 0.15
+
+    pros = [
+        *((("Significant discount: {:.0f}%", (abs(price_discount_pct)*100,)),) if big_discount else ()),
+        *((("DPE {}: Major energy upgrade potential", (dpe_grade,)),) if poor_dpe else ()),
+        *((("High IRR post-renovation: {:.1f}%", (irr*100,)),) if high_irr else ()),
+        *_VALUE_ADD_STATIC_PROS,
+    ]
+    cons = [
+        *(() if poor_dpe else (("DPE {}: Limited energy upgrade value", (dpe_grade,)),)),
+        *_VALUE_ADD_STATIC_CONS,
+    ]
+    reasons = [
+        *(("Below-market acquisition",) if big_discount else ()),
+        *(("Renovation value-add opportunity",) if poor_dpe else ()),
+        *(("Strong value creation potential",) if high_irr else ()),
+    ]
 
     return StrategyFit(
         strategy="Value-Add / déficit foncier",
         score=score,
         reasons=reasons,
-        pros=pros,
-        cons=cons
+        pro_items=pros,
+        con_items=cons
     )
 
 
@@ -396,13 +632,31 @@ def calculate_all_strategy_fits(
     Returns:
         List[StrategyFit]: List of strategy fits sorted by score (best first)
     """
+    # Reason: one kernel call scores all five strategies; the fit functions
+    # then only apply penalties and assemble pros/cons.
+    metrics = _strategy_metrics(tmc, market_rent, dscr, irr, price_discount_pct, bedrooms, dpe_grade)
+    scores = _score_kernel(metrics, _SCORE_MINS, _SCORE_MAXS, _SCORE_WEIGHTS).tolist()
+
     strategies = [
-        calculate_owner_occupier_fit(tmc, market_rent, dscr, price_discount_pct, legal_rent_compliant),
-        calculate_location_nue_fit(dscr, irr, legal_rent_compliant, bedrooms),
-        calculate_lmnp_fit(dscr, irr, legal_rent_compliant, bedrooms),
-        calculate_colocation_fit(dscr, irr, bedrooms, legal_rent_compliant),
-        calculate_value_add_fit(dscr, irr, price_discount_pct, dpe_grade)
+        calculate_owner_occupier_fit(tmc, market_rent, dscr, price_discount_pct, legal_rent_compliant,
+                                     base_score=scores[OWNER_OCCUPIER]),
+        calculate_location_nue_fit(dscr, irr, legal_rent_compliant, bedrooms,
+                                   base_score=scores[LOCATION_NUE]),
+        calculate_lmnp_fit(dscr, irr, legal_rent_compliant, bedrooms,
+                           base_score=scores[LMNP]),
+        calculate_colocation_fit(dscr, irr, bedrooms, legal_rent_compliant,
+                                 base_score=scores[COLOCATION]),
+        calculate_value_add_fit(dscr, irr, price_discount_pct, dpe_grade,
+                                base_score=scores[VALUE_ADD])
     ]
-
-    # Sort by score descending
-    return sorted(strategies, key=lambda x: x.score, reverse=True)
\ No newline at end of file
+    fit_scores = [fit.score for fit in strategies]
+
+    # Sort by score descending with the fixed 5-element network
+    order = [0, 1, 2, 3, 4]
+    for i, j in _SORT_NETWORK_5:
+        a, b = order[i], order[j]
+        # Reason: break ties on the original position so the result matches
+        # a stable sort; a bare compare-swap network is not stable.
+        if fit_scores[a] < fit_scores[b] or (fit_scores[a] == fit_scores[b] and a > b):
+            order[i], order[j] = b, a
+    return [strategies[k] for k in order]
\ No newline at end of file
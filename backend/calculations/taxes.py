@@ -7,6 +7,96 @@ Formulas from INITIAL.md:
 - Régime réel: Taxable = Gross Rent − Actual Deductible Expenses − Interest
 """
 
+from typing import Tuple
+
+import numpy as np
+
+from backend.calculations._arrays import ArrayLike, as_columns
+from backend.calculations._jit import njit, prange
+
+# Months per year, inverted once so monthly conversions are a multiply
+_INV12 = 1.0 / 12.0
+
+# Optional: fused multiply-add (Python 3.13+) - single rounding for a*b + c
+try:
+    from math import fma as _fma
+except ImportError:
+    _fma = None
+
+
+@njit(cache=True)
+def _micro_tax(
+    gross_annual_rent: float,
+    abatement_rate: float,
+    marginal_rate: float,
+    social_charges_rate: float
+) -> Tuple[float, float, float, float]:
+    """Micro regime tax core: (taxable_income, income_tax, social_charges, total_tax)."""
+    taxable_income = gross_annual_rent * (1 - abatement_rate)
+    income_tax = taxable_income * marginal_rate
+    social_charges = taxable_income * social_charges_rate
+    return taxable_income, income_tax, social_charges, income_tax + social_charges
+
+
+@njit(cache=True)
+def _reel_tax(
+    gross_annual_rent: float,
+    deductible_expenses: float,
+    interest_payments: float,
+    marginal_rate: float,
+    social_charges_rate: float
+) -> Tuple[float, float, float, float, float]:
+    """Régime réel tax core: (taxable_income, income_tax, social_charges, total_tax, deficit)."""
+    taxable_income = gross_annual_rent - deductible_expenses - interest_payments
+
+    # Tax only applies to positive taxable income
+    income_tax = max(0.0, taxable_income * marginal_rate)
+    social_charges = max(0.0, taxable_income * social_charges_rate)
+    deficit = min(0.0, taxable_income)  # Negative taxable income = deficit
+    return taxable_income, income_tax, social_charges, income_tax + social_charges, deficit
+
+
+@njit(cache=True, parallel=True)
+def _micro_tax_kernel(
+    rents: np.ndarray,
+    abatements: np.ndarray,
+    marginals: np.ndarray,
+    socials: np.ndarray
+) -> np.ndarray:
+    """Apply _micro_tax to each scenario, writing rows of an (N, 4) array."""
+    n = rents.shape[0]
+    out = np.empty((n, 4))
+    for i in prange(n):
+        taxable, income_tax, social, total = _micro_tax(rents[i], abatements[i], marginals[i], socials[i])
+        out[i, 0] = taxable
+        out[i, 1] = income_tax
+        out[i, 2] = social
+        out[i, 3] = total
+    return out
+
+
+@njit(cache=True, parallel=True)
+def _reel_tax_kernel(
+    rents: np.ndarray,
+    deductible_expenses: np.ndarray,
+    interest_payments: np.ndarray,
+    marginals: np.ndarray,
+    socials: np.ndarray
+) -> np.ndarray:
+    """Apply _reel_tax to each scenario, writing rows of an (N, 5) array."""
+    n = rents.shape[0]
+    out = np.empty((n, 5))
+    for i in prange(n):
+        taxable, income_tax, social, total, deficit = _reel_tax(
+            rents[i], deductible_expenses[i], interest_payments[i], marginals[i], socials[i]
+        )
+        out[i, 0] = taxable
+        out[i, 1] = income_tax
+        out[i, 2] = social
+        out[i, 3] = total
+        out[i, 4] = deficit
+    return out
+
 
 def lmnp_micro_bic_tax(
     gross_annual_rent: float,
@@ -32,10 +122,9 @@ def lmnp_micro_bic_tax(
         Social Charges = Taxable × Social Charges Rate
         Total Tax = Income Tax + Social Charges
     """
-    taxable_income = gross_annual_rent * (1 - abatement_rate)
-    income_tax = taxable_income * marginal_rate
-    social_charges = taxable_income * social_charges_rate
-    total_tax = income_tax + social_charges
+    taxable_income, income_tax, social_charges, total_tax = _micro_tax(
+        float(gross_annual_rent), float(abatement_rate), float(marginal_rate), float(social_charges_rate)
+    )
 
     return {
         "taxable_income": taxable_income,
@@ -69,10 +158,9 @@ def location_nue_micro_foncier_tax(
         Social Charges = Taxable × Social Charges Rate
         Total Tax = Income Tax + Social Charges
     """
-    taxable_income = gross_annual_rent * (1 - flat_abatement)
-    income_tax = taxable_income * marginal_rate
-    social_charges = taxable_income * social_charges_rate
-    total_tax = income_tax + social_charges
+    taxable_income, income_tax, social_charges, total_tax = _micro_tax(
+        float(gross_annual_rent), float(flat_abatement), float(marginal_rate), float(social_charges_rate)
+    )
 
     return {
         "taxable_income": taxable_income,
@@ -111,22 +199,71 @@ def regime_reel_tax(
     Note:
         Taxable income can be negative (deficit foncier), which can be carried forward
     """
-    taxable_income = gross_annual_rent - deductible_expenses - interest_payments
-
-    # Tax only applies to positive taxable income
-    income_tax = max(0, taxable_income * marginal_rate)
-    social_charges = max(0, taxable_income * social_charges_rate)
-    total_tax = income_tax + social_charges
+    taxable_income, income_tax, social_charges, total_tax, deficit = _reel_tax(
+        float(gross_annual_rent), float(deductible_expenses), float(interest_payments),
+        float(marginal_rate), float(social_charges_rate)
+    )
 
     return {
         "taxable_income": taxable_income,
         "income_tax": income_tax,
         "social_charges": social_charges,
         "total_tax": total_tax,
-        "deficit": min(0, taxable_income)  # Negative taxable income = deficit
+        "deficit": deficit
     }
 
 
+def tax_batch(
+    gross_annual_rent: ArrayLike,
+    abatements: ArrayLike,
+    marginals: ArrayLike,
+    socials: ArrayLike
+) -> np.ndarray:
+    """
+    Calculate micro regime taxes (micro-BIC / micro-foncier) for many scenarios.
+
+    Args:
+        gross_annual_rent: Gross annual rental income (scalar or array)
+        abatements: Abatement rates (e.g., 0.50 micro-BIC, 0.30 micro-foncier)
+        marginals: Marginal income tax rates
+        socials: Social charges rates
+
+    Returns:
+        np.ndarray: Array of shape (N, 4) with columns
+        (taxable_income, income_tax, social_charges, total_tax)
+
+    Example:
+        >>> tax_batch(24000, 0.50, np.array([0.11, 0.30, 0.41]), 0.172)
+    """
+    return _micro_tax_kernel(*as_columns(gross_annual_rent, abatements, marginals, socials))
+
+
+def regime_reel_tax_batch(
+    gross_annual_rent: ArrayLike,
+    deductible_expenses: ArrayLike,
+    interest_payments: ArrayLike,
+    marginals: ArrayLike,
+    socials: ArrayLike
+) -> np.ndarray:
+    """
+    Calculate régime réel taxes for many scenarios.
+
+    Args:
+        gross_annual_rent: Gross annual rental income (scalar or array)
+        deductible_expenses: Actual deductible expenses
+        interest_payments: Mortgage interest payments
+        marginals: Marginal income tax rates
+        socials: Social charges rates
+
+    Returns:
+        np.ndarray: Array of shape (N, 5) with columns
+        (taxable_income, income_tax, social_charges, total_tax, deficit)
+    """
+    return _reel_tax_kernel(
+        *as_columns(gross_annual_rent, deductible_expenses, interest_payments, marginals, socials)
+    )
+
+
 def after_tax_margin(
     pre_tax_monthly_cash_flow: float,
     annual_income_tax: float,
@@ -146,5 +283,28 @@ def after_tax_margin(
     Formula:
         After-Tax Margin (Monthly) = Pre-Tax Monthly Cash Flow − (Income Tax + Social Charges)/12
     """
-    monthly_tax = (annual_income_tax + annual_social_charges) / 12
-    return pre_tax_monthly_cash_flow - monthly_tax
\ No newline at end of file
+    if _fma is not None:
+        return _fma(-(annual_income_tax + annual_social_charges), _INV12, pre_tax_monthly_cash_flow)
+    return pre_tax_monthly_cash_flow - (annual_income_tax + annual_social_charges) * _INV12
+
+
+def after_tax_margin_vec(
+    pre_tax_monthly_cash_flow: ArrayLike,
+    annual_income_tax: ArrayLike,
+    annual_social_charges: ArrayLike
+) -> np.ndarray:
+    """
+    Vectorized after_tax_margin() for monthly timelines or scenario grids.
+
+    Args:
+        pre_tax_monthly_cash_flow: Pre-tax monthly cash flow(s)
+        annual_income_tax: Annual income tax (scalar or array)
+        annual_social_charges: Annual social charges (scalar or array)
+
+    Returns:
+        np.ndarray: After-tax monthly margin, broadcast over the inputs
+    """
+    return (
+        np.asarray(pre_tax_monthly_cash_flow, dtype=np.float64)
+        - (np.asarray(annual_income_tax, dtype=np.float64) + annual_social_charges) * _INV12
+    )
\ No newline at end of file
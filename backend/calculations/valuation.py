@@ -11,6 +11,31 @@ Formulas from INITIAL.md:
 - Yield on Cost = Stabilized NOI ÷ (Purchase Price + CapEx/Travaux)
 """
 
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+
+# DPE grade adjustment, indexed by ord(grade) - ord("A")
+_DPE_PENALTIES: Tuple[float, ...] = (
+    0.05,   # A: Premium for excellent energy efficiency
+    0.02,   # B: Slight premium
+    0.0,    # C: Neutral
+    -0.02,  # D: Slight penalty
+    -0.05,  # E: Moderate penalty
+    -0.10,  # F: Significant penalty
+    -0.15,  # G: Severe penalty
+)
+# Array form of _DPE_PENALTIES for the vectorized path
+_DPE = np.array(_DPE_PENALTIES)
+
+# Days-on-market penalty per threshold crossed (×1.5 and ×2 the median)
+DOM_PENALTY_STEP = -0.05
+
+# Price verdicts indexed by (ratio >= 0.95) + (ratio > 1.05)
+_VERDICTS = ("Under-priced", "Average", "Overpriced")
+_VERDICTS_ARR = np.array(_VERDICTS)
+
 
 def nowcast_value(
     dvf_median: float,
@@ -30,6 +55,10 @@ def nowcast_value(
 
     Formula:
         Now-Cast = DVF Median × (1+Δ_market) × (1+Δ_listing)
+
+    Note:
+        Also accepts numpy arrays (e.g. from listing_delta_batch) and
+        computes the now-cast element-wise.
     """
     return dvf_median * (1 + market_delta) * (1 + listing_delta)
 
@@ -53,14 +82,35 @@ def price_verdict(property_price_per_m2: float, nowcast_value_per_m2: float) ->
     if nowcast_value_per_m2 == 0:
         return "Unknown"
 
-    ratio = property_price_per_m2 / nowcast_value_per_m2
+    # Reason: float() so numpy scalar inputs give Python bools, which sum to 0/1/2
+    ratio = float(property_price_per_m2 / nowcast_value_per_m2)
+    return _VERDICTS[(ratio >= 0.95) + (ratio > 1.05)]
+
+
+def price_verdict_array(
+    property_prices_per_m2: np.ndarray,
+    nowcast_values_per_m2: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized price_verdict() over many listings.
+
+    Args:
+        property_prices_per_m2: Asking prices (€/m²)
+        nowcast_values_per_m2: Now-cast valuations (€/m²)
+
+    Returns:
+        np.ndarray: Verdict string per listing ("Unknown" where now-cast is 0)
+    """
+    prices, nowcasts = np.broadcast_arrays(
+        np.asarray(property_prices_per_m2, dtype=np.float64),
+        np.asarray(nowcast_values_per_m2, dtype=np.float64)
+    )
+    unknown = nowcasts == 0
 
-    if ratio < 0.95:
-        return "Under-priced"
-    elif ratio <= 1.05:
-        return "Average"
-    else:
-        return "Overpriced"
+    # Reason: divide only where the now-cast is known to avoid divide-by-zero warnings
+    ratio = np.divide(prices, nowcasts, out=np.ones_like(prices), where=~unknown)
+    verdict_index = (ratio >= 0.95).astype(np.intp) + (ratio > 1.05)
+    return np.where(unknown, "Unknown", _VERDICTS_ARR[verdict_index])
 
 
 def listing_delta_calculation(
@@ -85,34 +135,27 @@ def listing_delta_calculation(
 
     Logic:
         - Price cuts indicate motivated seller (negative adjustment)
-        - High days-on-market indicates overpricing (negative adjustment)
+        - High days-on-market indicates overpricing (-5% above 1.5× median, -10% above 2×)
         - Poor DPE grade indicates higher costs (negative adjustment)
         - Poor condition indicates renovation needs (negative adjustment)
     """
-    delta = 0.0
-
     # Price cut adjustment
-    delta += price_cut_pct
+    delta = price_cut_pct
 
     # Days on market adjustment (if significantly above median)
-    if days_on_market > median_dom * 1.5:
-        dom_penalty = -0.05  # 5% penalty for stale listing
-        delta += dom_penalty
-    elif days_on_market > median_dom * 2:
-        dom_penalty = -0.10  # 10% penalty for very stale listing
-        delta += dom_penalty
-
-    # DPE grade penalty
-    dpe_penalties = {
-        "A": 0.05,   # Premium for excellent energy efficiency
-        "B": 0.02,   # Slight premium
-        "C": 0.0,    # Neutral
-        "D": -0.02,  # Slight penalty
-        "E": -0.05,  # Moderate penalty
-        "F": -0.10,  # Significant penalty
-        "G": -0.15   # Severe penalty
-    }
-    delta += dpe_penalties.get(dpe_grade.upper(), 0.0)
+    # Reason: each threshold crossed adds a 5% penalty (-5% stale, -10% very stale);
+    # summing the comparisons avoids an if/elif chain.
+    delta += DOM_PENALTY_STEP * (
+        (days_on_market > median_dom * 1.5) + (days_on_market > median_dom * 2)
+    )
+
+    # DPE grade penalty (unknown grades are neutral)
+    grade = dpe_grade.upper()
+    dpe_index = ord(grade) - 65 if len(grade) == 1 else -1
+    # Reason: the scalar path indexes the tuple; a numpy scalar lookup plus
+    # float() conversion costs more than the rest of the function.
+    if 0 <= dpe_index < len(_DPE_PENALTIES):
+        delta += _DPE_PENALTIES[dpe_index]
 
     # Condition penalty
     delta += condition_penalty
@@ -120,6 +163,48 @@ def listing_delta_calculation(
     return delta
 
 
+def listing_delta_batch(
+    price_cut_pct: np.ndarray,
+    days_on_market: np.ndarray,
+    median_dom: Union[np.ndarray, float],
+    dpe_grades: Union[str, Sequence[str]],
+    condition_penalty: Union[np.ndarray, float] = 0.0
+) -> np.ndarray:
+    """
+    Vectorized listing_delta_calculation() over many listings.
+
+    Args:
+        price_cut_pct: Recent price cut percentage per listing
+        days_on_market: Days each property has been listed
+        median_dom: Median days on market (per listing or shared)
+        dpe_grades: DPE grades, either one string with one letter per listing
+                    (e.g. "DCEG") or a sequence of grade strings
+        condition_penalty: Condition penalty (per listing or shared)
+
+    Returns:
+        np.ndarray: Listing delta per listing
+    """
+    if not isinstance(dpe_grades, str):
+        # Reason: anything that is not a single letter maps to "?" (neutral)
+        dpe_grades = "".join(g if len(g) == 1 else "?" for g in dpe_grades)
+
+    days = np.asarray(days_on_market, dtype=np.float64)
+    median = np.asarray(median_dom, dtype=np.float64)
+
+    # DPE grade penalty, gathered from _DPE (unknown grades are neutral)
+    codes = np.frombuffer(dpe_grades.upper().encode("ascii", "replace"), dtype=np.uint8)
+    dpe_index = codes.astype(np.intp) - ord("A")
+    valid = (dpe_index >= 0) & (dpe_index < len(_DPE))
+    dpe_penalty = np.where(valid, _DPE[np.clip(dpe_index, 0, len(_DPE) - 1)], 0.0)
+
+    # Days on market penalty: -5% per threshold crossed
+    dom_penalty = DOM_PENALTY_STEP * (
+        (days > median * 1.5).astype(np.float64) + (days > median * 2)
+    )
+
+    return np.asarray(price_cut_pct, dtype=np.float64) + dom_penalty + dpe_penalty + condition_penalty
+
+
 def yield_on_cost(
     stabilized_noi: float,
     purchase_price: float,
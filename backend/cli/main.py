@@ -3,16 +3,111 @@ CLI interface using Typer.
 
 Usage:
     python -m backend.cli.main evaluate --help
+    python -m backend.cli.main evaluate-batch --csv scenarios.csv
     python -m backend.cli.main research --address "10 Rue de Rivoli, 75001 Paris"
 """
 
+import csv
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
 app = typer.Typer(help="Real Estate Deal Evaluator CLI")
-console = Console()
+_console: Optional[Console] = None
+
+# Verdicts indexed by DSCR band: <= 1.0, (1.0, 1.2], > 1.2
+_VERDICTS = (
+    ("[bold red]PASS[/bold red]", "Negative cash flow"),
+    ("[bold yellow]CAUTION[/bold yellow]", "Marginal cash flow"),
+    ("[bold green]BUY[/bold green]", "Positive cash flow"),
+)
+
+# Table cell formatters (bound str.format, shared by evaluate and evaluate-batch)
+_FMT_EUR0 = "€{:,.0f}".format
+_FMT_EUR2 = "€{:,.2f}".format
+_FMT_2F = "{:.2f}".format
+_FMT_PCT2 = "{:.2f}%".format
+
+
+def _get_console() -> Console:
+    """
+    Get the shared Rich console, creating it on first use.
+
+    Returns:
+        Console: Console used by all commands
+    """
+    # Reason: built lazily so `--help` (handled by Typer before any command
+    # body runs) never constructs it.
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
+
+def _verdict(dscr: float) -> Tuple[str, str]:
+    """
+    Buy/caution/pass verdict from DSCR.
+
+    Args:
+        dscr: Debt service coverage ratio
+
+    Returns:
+        Tuple[str, str]: (Rich-markup label, reason)
+    """
+    # Reason: (dscr > 1.0) + (dscr > 1.2) is the 0/1/2 band index
+    return _VERDICTS[(dscr > 1.0) + (dscr > 1.2)]
+
+
+def evaluate_core(
+    price: float,
+    surface: float,
+    loan_amount: float,
+    annual_rate: float,
+    loan_term: int,
+    monthly_rent: float,
+    vacancy_rate: float = 0.05,
+    annual_operating_expenses: float = 6000.0
+) -> Dict[str, float]:
+    """
+    Numerical pipeline behind the `evaluate` command, without Typer or Rich.
+
+    Args:
+        price: Property price (EUR)
+        surface: Surface area (m²)
+        loan_amount: Loan amount (EUR)
+        annual_rate: Annual interest rate (e.g., 0.03 for 3%)
+        loan_term: Loan term (years)
+        monthly_rent: Expected monthly rent (EUR)
+        vacancy_rate: Vacancy & credit loss rate (default 5%)
+        annual_operating_expenses: Annual operating expenses (default €6,000 placeholder)
+
+    Returns:
+        dict: monthly_payment, price_per_m2, noi, dscr, cap_rate
+
+    Example:
+        >>> evaluate_core(500000, 50, 400000, 0.03, 20, 2000)["dscr"]
+        0.631...
+    """
+    # Reason: imported here rather than at module top because the calculation
+    # modules load Numba when installed; after the first call this is a cached
+    # sys.modules lookup.
+    from backend.calculations import financial, mortgage
+
+    monthly_payment = mortgage.monthly_payment(loan_amount, annual_rate, loan_term)
+    gmi = financial.gross_monthly_income(monthly_rent)
+    vcl = financial.vacancy_credit_loss(gmi, vacancy_rate)
+    noi = financial.noi_calculation(gmi, vcl, annual_operating_expenses)
+    ads = financial.annual_debt_service(monthly_payment)
+
+    return {
+        "monthly_payment": monthly_payment,
+        "price_per_m2": price / surface,
+        "noi": noi,
+        "dscr": financial.dscr_calculation(noi, ads),
+        "cap_rate": financial.cap_rate(noi, price)
+    }
 
 
 @app.command()
@@ -39,47 +134,109 @@ def evaluate(
             --down-payment 100000 \\
             --loan-amount 400000
     """
+    # Reason: only this command renders tables/panels, so other commands skip
+    # the rich.table / rich.panel import cost.
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _get_console()
     console.print(Panel.fit(
         "[bold blue]Real Estate Deal Evaluator[/bold blue]\\n" +
         f"Analyzing: {address}",
         border_style="blue"
     ))
 
-    # Import calculation modules
-    from backend.calculations import financial, mortgage
-
     # Calculate metrics
-    monthly_payment = mortgage.monthly_payment(loan_amount, annual_rate, loan_term)
-    gmi = financial.gross_monthly_income(monthly_rent)
-    vcl = financial.vacancy_credit_loss(gmi, 0.05)
-    noi = financial.noi_calculation(gmi, vcl, 6000)  # Placeholder annual OE
-    ads = financial.annual_debt_service(monthly_payment)
-    dscr = financial.dscr_calculation(noi, ads)
-    cap_rate = financial.cap_rate(noi, price)
+    metrics = evaluate_core(price, surface, loan_amount, annual_rate, loan_term, monthly_rent)
+    dscr = metrics["dscr"]
 
     # Create results table
     table = Table(title="Financial Analysis", show_header=True, header_style="bold magenta")
     table.add_column("Metric", style="cyan")
     table.add_column("Value", style="green")
 
-    table.add_row("Property Price", f"€{price:,.0f}")
-    table.add_row("Price per m²", f"€{price/surface:,.0f}")
-    table.add_row("Monthly Payment", f"€{monthly_payment:,.2f}")
-    table.add_row("NOI (Annual)", f"€{noi:,.2f}")
-    table.add_row("DSCR", f"{dscr:.2f}")
-    table.add_row("Cap Rate", f"{cap_rate*100:.2f}%")
+    table.add_row("Property Price", _FMT_EUR0(price))
+    table.add_row("Price per m²", _FMT_EUR0(metrics["price_per_m2"]))
+    table.add_row("Monthly Payment", _FMT_EUR2(metrics["monthly_payment"]))
+    table.add_row("NOI (Annual)", _FMT_EUR2(metrics["noi"]))
+    table.add_row("DSCR", _FMT_2F(dscr))
+    table.add_row("Cap Rate", _FMT_PCT2(metrics["cap_rate"]*100))
 
     console.print(table)
 
     # Verdict
-    if dscr > 1.2:
-        verdict = "[bold green]BUY[/bold green] - Positive cash flow"
-    elif dscr > 1.0:
-        verdict = "[bold yellow]CAUTION[/bold yellow] - Marginal cash flow"
-    else:
-        verdict = "[bold red]PASS[/bold red] - Negative cash flow"
+    label, reason = _verdict(dscr)
+    console.print(f"\\nVerdict: {label} - {reason}")
+
+
+@app.command("evaluate-batch")
+def evaluate_batch(
+    csv_path: Path = typer.Option(..., "--csv", help="CSV file with one scenario per row"),
+    annual_rate: float = typer.Option(0.03, "--annual-rate", help="Default annual interest rate"),
+    loan_term: int = typer.Option(20, "--loan-term", help="Default loan term (years)"),
+    monthly_rent: float = typer.Option(2000, "--monthly-rent", help="Default expected monthly rent (EUR)"),
+):
+    """
+    Evaluate many what-if scenarios from a CSV file in one vectorized pass.
+
+    Required columns: price, surface, loan_amount. Optional columns: address,
+    monthly_rent, annual_rate, loan_term (blank or missing use the defaults).
 
-    console.print(f"\\nVerdict: {verdict}")
+    Example:
+        python -m backend.cli.main evaluate-batch --csv scenarios.csv
+    """
+    from rich.table import Table
+
+    import numpy as np
+    from backend.calculations import deal
+
+    console = _get_console()
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    if not rows:
+        console.print("[yellow]No scenarios found in CSV[/yellow]")
+        raise typer.Exit(code=1)
+
+    def column(name: str, default: Optional[float] = None) -> np.ndarray:
+        try:
+            return np.array([float(row.get(name) or default) for row in rows])
+        except (TypeError, ValueError):
+            raise typer.BadParameter(f"Missing or invalid value in column: {name}", param_hint="--csv") from None
+
+    prices = column("price")
+    surfaces = column("surface")
+    # Reason: price per m² divides by surface; `not > 0` also rejects NaN
+    if not (surfaces > 0).all():
+        raise typer.BadParameter("Surface must be positive in every row", param_hint="--csv")
+    results = deal.evaluate_batch(
+        prices=prices,
+        monthly_rents=column("monthly_rent", monthly_rent),
+        annual_rates=column("annual_rate", annual_rate),
+        loan_terms=column("loan_term", loan_term),
+        loan_amounts=column("loan_amount")
+    )
+
+    # Create results table
+    table = Table(title=f"Financial Analysis ({len(rows)} scenarios)", show_header=True, header_style="bold magenta")
+    for name in ("Scenario", "Price", "Price per m²", "Monthly Payment", "NOI (Annual)", "DSCR", "Cap Rate", "Verdict"):
+        table.add_column(name, style="cyan" if name == "Scenario" else "green")
+
+    for i, (row, price, surface, (payment, noi, dscr, cap)) in enumerate(
+        zip(rows, prices.tolist(), surfaces.tolist(), results.tolist()), start=1
+    ):
+        table.add_row(
+            row.get("address") or str(i),
+            _FMT_EUR0(price),
+            _FMT_EUR0(price/surface),
+            _FMT_EUR2(payment),
+            _FMT_EUR2(noi),
+            _FMT_2F(dscr),
+            _FMT_PCT2(cap*100),
+            _verdict(dscr)[0]
+        )
+
+    console.print(table)
 
 
 @app.command()
@@ -92,6 +249,7 @@ def research(
     Example:
         python -m backend.cli.main research --address "10 Rue de Rivoli, 75001 Paris"
     """
+    console = _get_console()
     console.print(f"[cyan]Researching property at: {address}[/cyan]")
     console.print("[yellow]Note: Full research agent integration pending API keys[/yellow]")
 
@@ -114,6 +272,7 @@ def negotiate(
             --draft
     """
     discount = ((asking_price - offer_price) / asking_price) * 100
+    console = _get_console()
     console.print(f"[cyan]Negotiation Analysis[/cyan]")
     console.print(f"Property: {address}")
     console.print(f"Asking: €{asking_price:,.0f}")
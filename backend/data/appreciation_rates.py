@@ -5,13 +5,21 @@ Based on market data from Notaires de France and French government statistics (2
 Rates represent historical annual appreciation and forward-looking estimates.
 """
 
-from typing import Dict, Optional
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from backend.data.french_departments import normalize_dept_key
 
 # Annual appreciation rates by department (%)
 # Based on 2024-2025 market data
 # Negative values represent price corrections
 # Source: Notaires de France, Q4 2024 / Q1 2025 data
-DEPARTMENT_APPRECIATION_RATES: Dict[str, float] = {
+# Read-only: exposed as a MappingProxyType so it can be shared safely
+DEPARTMENT_APPRECIATION_RATES: Mapping[str, float] = MappingProxyType({
     # Île-de-France (Paris Region)
     "75": -2.9,   # Paris - significant correction in 2024, stabilizing 2025
     "92": -3.0,   # Hauts-de-Seine - inner suburbs correction
@@ -63,13 +71,41 @@ DEPARTMENT_APPRECIATION_RATES: Dict[str, float] = {
     "73": 0.0, "74": 0.5, "79": -1.0, "81": -0.7, "82": -1.0,
     "84": -0.5, "85": 0.4, "86": -1.3, "88": -1.4, "89": -1.5,
     "90": -1.3,
-}
+})
 
 # Forward-looking adjustment for 2025+
 # Market expected to stabilize with slight growth (+0.1% to +1% nationally)
 FORWARD_ADJUSTMENT = 1.5  # Add this to historical rates for forward projections
 
+# Conservative default for departments without data (%)
+DEFAULT_APPRECIATION_RATE = 0.5
 
+# Decimal rates precomputed per department (forward-adjusted and raw) so a
+# lookup is a single dict probe with no arithmetic. Kept as plain dicts with
+# interned keys (a read-only proxy would add a delegation step per lookup).
+_RATES_FORWARD_DECIMAL: Dict[str, float] = {
+    sys.intern(dept): (rate + FORWARD_ADJUSTMENT) / 100.0 for dept, rate in DEPARTMENT_APPRECIATION_RATES.items()
+}
+_RATES_RAW_DECIMAL: Dict[str, float] = {
+    sys.intern(dept): rate / 100.0 for dept, rate in DEPARTMENT_APPRECIATION_RATES.items()
+}
+_DEFAULT_FORWARD = (DEFAULT_APPRECIATION_RATE + FORWARD_ADJUSTMENT) / 100.0
+_DEFAULT_RAW = DEFAULT_APPRECIATION_RATE / 100.0
+
+# Dense rate tables indexed by int(2-digit department) for batch lookups
+_RATE_ARRAY_FORWARD = np.full(100, _DEFAULT_FORWARD)
+_RATE_ARRAY_RAW = np.full(100, _DEFAULT_RAW)
+for _dept in DEPARTMENT_APPRECIATION_RATES:
+    if len(_dept) == 2 and _dept.isdigit():
+        _RATE_ARRAY_FORWARD[int(_dept)] = _RATES_FORWARD_DECIMAL[_dept]
+        _RATE_ARRAY_RAW[int(_dept)] = _RATES_RAW_DECIMAL[_dept]
+del _dept
+
+
+# Reason: cached on the call arguments themselves; an inner cache keyed on
+# (department, forward_looking) would still re-parse the postal code each call
+# and costs more than the single dict probe it wraps.
+@lru_cache(maxsize=4096)
 def get_appreciation_rate(postal_code: Optional[str] = None,
                          department: Optional[str] = None,
                          forward_looking: bool = True) -> float:
@@ -85,6 +121,9 @@ def get_appreciation_rate(postal_code: Optional[str] = None,
         float: Annual appreciation rate as decimal (e.g., 0.02 for 2%)
                Returns 0.5% (0.005) as conservative default if not found
 
+    Note:
+        Results are cached per (postal_code, department, forward_looking).
+
     Examples:
         >>> get_appreciation_rate("75001")  # Paris
         -0.014  # -1.4% (after forward adjustment from -2.9%)
@@ -95,19 +134,63 @@ def get_appreciation_rate(postal_code: Optional[str] = None,
     """
     # Extract department from postal code
     if postal_code and len(postal_code) == 5:
-        department = postal_code[:2]
+        department = normalize_dept_key(postal_code)
 
-    # Get base rate
-    base_rate = DEPARTMENT_APPRECIATION_RATES.get(department, 0.5)  # 0.5% default
+    return get_appreciation_rate_by_key(department, forward_looking)
+
+
+def get_appreciation_rate_by_key(dept_key: Optional[str], forward_looking: bool = True) -> float:
+    """
+    Get annual appreciation rate for a department key (no postal code parsing).
+
+    Args:
+        dept_key: Department key from french_departments.normalize_dept_key()
+                  (or a 2-digit department code)
+        forward_looking: If True, applies forward adjustment for future years
 
-    # Apply forward-looking adjustment if requested
+    Returns:
+        float: Annual appreciation rate as decimal (0.5% default if not found)
+    """
+    # Rates are already adjusted and converted to decimal at import
     if forward_looking:
-        adjusted_rate = base_rate + FORWARD_ADJUSTMENT
-    else:
-        adjusted_rate = base_rate
+        return _RATES_FORWARD_DECIMAL.get(dept_key, _DEFAULT_FORWARD)
+    return _RATES_RAW_DECIMAL.get(dept_key, _DEFAULT_RAW)
+
 
-    # Convert from percentage to decimal
-    return adjusted_rate / 100.0
+def get_appreciation_rates_batch(postal_codes: Union[Sequence[str], np.ndarray],
+                                 forward_looking: bool = True) -> np.ndarray:
+    """
+    Get appreciation rates for many postal codes at once.
+
+    Args:
+        postal_codes: 5-digit French postal codes (list or string array)
+        forward_looking: If True, applies forward adjustment for future years
+
+    Returns:
+        np.ndarray: Annual appreciation rates as decimals, same values as
+                    get_appreciation_rate() for each code
+
+    Note:
+        The department digits are read straight from the string buffer and
+        gathered from a dense 100-entry table, so there is no per-code dict probe.
+    """
+    codes = np.ascontiguousarray(np.asarray(postal_codes, dtype=np.str_).ravel())
+    table = _RATE_ARRAY_FORWARD if forward_looking else _RATE_ARRAY_RAW
+    default = _DEFAULT_FORWARD if forward_looking else _DEFAULT_RAW
+    width = codes.dtype.itemsize // 4
+    if codes.size == 0 or width < 5:
+        return np.full(codes.size, default)
+
+    # Reason: '<U' arrays store one uint32 code point per character
+    chars = codes.view(np.uint32).reshape(codes.size, width).astype(np.int64) - ord("0")
+    tens, units = chars[:, 0], chars[:, 1]
+    dept = tens * 10 + units
+
+    valid = (np.char.str_len(codes) == 5) & (tens >= 0) & (tens <= 9) & (units >= 0) & (units <= 9)
+    # Corsica (20x) and overseas (97x) resolve to 3-char keys with no rate entry
+    valid &= (dept != 20) & (dept != 97)
+
+    return np.where(valid, table[np.where(valid, dept, 0)], default)
 
 
 def get_appreciation_rate_display(postal_code: Optional[str] = None,
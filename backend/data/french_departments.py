@@ -5,11 +5,14 @@ Maps department codes (first 2 digits of postal code) to their main cities.
 For precise city detection, use specific postal code mappings where available.
 """
 
-from typing import Dict, Optional, Tuple
+import sys
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
 # Department code to (department_name, main_city) mapping
 # Covers all 101 French departments including overseas territories
-FRENCH_DEPARTMENTS: Dict[str, Tuple[str, str]] = {
+# Read-only: exposed as a MappingProxyType so it can be shared safely
+FRENCH_DEPARTMENTS: Mapping[str, Tuple[str, str]] = MappingProxyType({
     # Auvergne-Rhône-Alpes
     "01": ("Ain", "Bourg-en-Bresse"),
     "03": ("Allier", "Moulins"),
@@ -139,11 +142,25 @@ FRENCH_DEPARTMENTS: Dict[str, Tuple[str, str]] = {
     "973": ("Guyane", "Cayenne"),
     "974": ("La Réunion", "Saint-Denis"),
     "976": ("Mayotte", "Mamoudzou"),
-}
+})
+
+# Parallel department code -> name / main city lookups (one dict probe per
+# lookup, no tuple indexing); FRENCH_DEPARTMENTS remains the public source.
+# Plain dicts with interned keys: these are the hot lookup path.
+_DEPT_NAME: Dict[str, str] = {sys.intern(code): name for code, (name, _) in FRENCH_DEPARTMENTS.items()}
+_DEPT_CITY: Dict[str, str] = {sys.intern(code): city for code, (_, city) in FRENCH_DEPARTMENTS.items()}
+
+# Corsica postal codes (20xxx) resolve on their third digit: 200-204 are
+# Corse-du-Sud (2A), 205-209 Haute-Corse (2B); seeded as 3-char keys so the
+# lookup is a plain dict probe
+for _digit in "0123456789":
+    _key = sys.intern("20" + _digit)
+    _DEPT_NAME[_key], _DEPT_CITY[_key] = FRENCH_DEPARTMENTS["2A" if _digit in "01234" else "2B"]
+del _digit, _key
 
 # Specific postal code mappings for major cities
 # This overrides department-level detection for precision
-SPECIFIC_POSTAL_CODES: Dict[str, str] = {
+SPECIFIC_POSTAL_CODES: Mapping[str, str] = MappingProxyType({
     # Haute-Savoie (74) - Major cities
     "74000": "Annecy",
     "74100": "Annemasse",
@@ -158,42 +175,71 @@ SPECIFIC_POSTAL_CODES: Dict[str, str] = {
 
     # Add more specific cities as needed for precision
     # (The system will fall back to department main city if not found)
-}
+})
 
 
-def get_city_from_department(postal_code: str) -> Optional[str]:
+def normalize_dept_key(postal_code: Optional[str]) -> Optional[str]:
     """
-    Get main city for a department based on postal code.
+    Normalize a postal code to its department lookup key.
+
+    Parse once and reuse the key with get_city_by_key(), get_department_name_by_key()
+    and appreciation_rates.get_appreciation_rate_by_key() when looking up
+    several attributes of the same address.
 
     Args:
-        postal_code: 5-digit French postal code
+        postal_code: French postal code
 
     Returns:
-        str: Main city of the department, or None if department not found
+        str: 3-char key for overseas (97x, full codes only) and Corsica (20x),
+             otherwise the 2-digit department code; None if too short
     """
     if not postal_code or len(postal_code) < 2:
         return None
 
-    # Handle overseas departments (3-digit codes)
-    if postal_code.startswith("97") and len(postal_code) == 5:
-        dept_code = postal_code[:3]
-        if dept_code in FRENCH_DEPARTMENTS:
-            return FRENCH_DEPARTMENTS[dept_code][1]
+    prefix = postal_code[:2]
+    if (prefix == "97" and len(postal_code) == 5) or prefix == "20":
+        # Reason: a bare "20" has no third digit and defaults to Corse-du-Sud ("200")
+        return (postal_code + "0")[:3]
+    return prefix
 
-    # Handle Corsica special case (2A, 2B)
-    if postal_code.startswith("20"):
-        second_digit = postal_code[2] if len(postal_code) > 2 else "0"
-        if second_digit in "01234":
-            return "Ajaccio"  # Corse-du-Sud (2A)
-        else:
-            return "Bastia"  # Haute-Corse (2B)
 
-    # Standard 2-digit department code
-    dept_code = postal_code[:2]
-    if dept_code in FRENCH_DEPARTMENTS:
-        return FRENCH_DEPARTMENTS[dept_code][1]
+def get_city_by_key(dept_key: Optional[str]) -> Optional[str]:
+    """
+    Get main city for a department key from normalize_dept_key().
 
-    return None
+    Args:
+        dept_key: Normalized department key
+
+    Returns:
+        str: Main city of the department, or None if not found
+    """
+    return _DEPT_CITY.get(dept_key)
+
+
+def get_department_name_by_key(dept_key: Optional[str]) -> Optional[str]:
+    """
+    Get department name for a department key from normalize_dept_key().
+
+    Args:
+        dept_key: Normalized department key
+
+    Returns:
+        str: Department name, or None if not found
+    """
+    return _DEPT_NAME.get(dept_key)
+
+
+def get_city_from_department(postal_code: str) -> Optional[str]:
+    """
+    Get main city for a department based on postal code.
+
+    Args:
+        postal_code: 5-digit French postal code
+
+    Returns:
+        str: Main city of the department, or None if department not found
+    """
+    return _DEPT_CITY.get(normalize_dept_key(postal_code))
 
 
 def get_department_name(postal_code: str) -> Optional[str]:
@@ -206,26 +252,37 @@ def get_department_name(postal_code: str) -> Optional[str]:
     Returns:
         str: Department name, or None if not found
     """
-    if not postal_code or len(postal_code) < 2:
-        return None
+    return _DEPT_NAME.get(normalize_dept_key(postal_code))
+
+
+class _CityMap(dict):
+    """
+    Postal code -> city: SPECIFIC_POSTAL_CODES overrides, with the department
+    main city filled in on first miss so repeat lookups are a single probe.
+    """
 
-    # Handle overseas departments
-    if postal_code.startswith("97") and len(postal_code) == 5:
-        dept_code = postal_code[:3]
-        if dept_code in FRENCH_DEPARTMENTS:
-            return FRENCH_DEPARTMENTS[dept_code][0]
-
-    # Handle Corsica
-    if postal_code.startswith("20"):
-        second_digit = postal_code[2] if len(postal_code) > 2 else "0"
-        if second_digit in "01234":
-            return "Corse-du-Sud"
-        else:
-            return "Haute-Corse"
-
-    # Standard departments
-    dept_code = postal_code[:2]
-    if dept_code in FRENCH_DEPARTMENTS:
-        return FRENCH_DEPARTMENTS[dept_code][0]
-
-    return None
+    def __missing__(self, postal_code: str) -> Optional[str]:
+        city = get_city_from_department(postal_code)
+        # Reason: only cache resolved numeric codes so malformed inputs cannot grow the map
+        if city is not None and postal_code.isdigit():
+            self[postal_code] = city
+        return city
+
+
+_CITY_BY_POSTAL = _CityMap(SPECIFIC_POSTAL_CODES)
+
+
+def resolve_city(postal_code: str) -> Optional[str]:
+    """
+    Get city for a postal code: specific mapping if known, else department main city.
+
+    Args:
+        postal_code: 5-digit French postal code
+
+    Returns:
+        str: City name, or None if the department is not found
+    """
+    if not postal_code:
+        return None
+    # Reason: subscript (not .get) so _CityMap.__missing__ resolves and caches misses
+    return _CITY_BY_POSTAL[postal_code]
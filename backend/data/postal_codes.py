@@ -5,13 +5,40 @@ Based on official French postal code data from data.gouv.fr and INSEE.
 This provides accurate city names for postal codes, fixing location/postcode mismatches.
 """
 
-from typing import Dict, Optional, Tuple
+import sys
+from bisect import bisect_left
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from backend.data.french_departments import resolve_city
 
 # Comprehensive postal code to city mapping for major French cities
 # Format: postal_code -> (city_name, department_code)
-POSTAL_CODE_TO_CITY: Dict[str, Tuple[str, str]] = {
+_POSTAL_CODE_TO_CITY: Dict[str, Tuple[str, str]] = {
     # Paris (75)
-    **{f"750{str(i).zfill(2)}": ("Paris", "75") for i in range(1, 21)},
+    "75001": ("Paris", "75"),
+    "75002": ("Paris", "75"),
+    "75003": ("Paris", "75"),
+    "75004": ("Paris", "75"),
+    "75005": ("Paris", "75"),
+    "75006": ("Paris", "75"),
+    "75007": ("Paris", "75"),
+    "75008": ("Paris", "75"),
+    "75009": ("Paris", "75"),
+    "75010": ("Paris", "75"),
+    "75011": ("Paris", "75"),
+    "75012": ("Paris", "75"),
+    "75013": ("Paris", "75"),
+    "75014": ("Paris", "75"),
+    "75015": ("Paris", "75"),
+    "75016": ("Paris", "75"),
+    "75017": ("Paris", "75"),
+    "75018": ("Paris", "75"),
+    "75019": ("Paris", "75"),
+    "75020": ("Paris", "75"),
 
     # Hauts-de-Seine (92)
     "92000": ("Nanterre", "92"),
@@ -402,7 +429,29 @@ POSTAL_CODE_TO_CITY: Dict[str, Tuple[str, str]] = {
     "80000": ("Amiens", "80"),
 }
 
+# Read-only public view; lookups below use the plain dict directly
+POSTAL_CODE_TO_CITY: Mapping[str, Tuple[str, str]] = MappingProxyType(_POSTAL_CODE_TO_CITY)
+
+# Reason: the stored department is always the postal code prefix, so lookups
+# only need the city; keep a flat postal code -> interned city name dict
+assert all(dept == code[:2] for code, (_, dept) in _POSTAL_CODE_TO_CITY.items())
+_POSTAL_TO_CITY: Dict[str, str] = {
+    code: sys.intern(city) for code, (city, _) in _POSTAL_CODE_TO_CITY.items()
+}
+
+# Sorted codes for prefix queries: matches are one contiguous run
+_SORTED_CODES: Tuple[str, ...] = tuple(sorted(_POSTAL_TO_CITY))
 
+# Direct-index layout for batch lookups: city name (or None) at int(postal_code)
+_CITY_ARR = np.full(100000, None, dtype=object)
+for _code, _city in _POSTAL_TO_CITY.items():
+    _CITY_ARR[int(_code)] = _city
+del _code, _city
+
+
+# Reason: real-estate batches repeat the same popular postal codes, and a
+# C-level cache hit is cheaper than entering the Python function at all.
+@lru_cache(maxsize=4096)
 def get_city_from_postal_code(postal_code: str) -> Optional[str]:
     """
     Get official city name from French postal code.
@@ -412,26 +461,72 @@ def get_city_from_postal_code(postal_code: str) -> Optional[str]:
 
     Returns:
         str: Official city name, or None if not found
+
+    Note:
+        Results are cached per postal code.
     """
     if not postal_code or len(postal_code) != 5:
         return None
 
     # First, check specific postal code mappings (most precise)
-    result = POSTAL_CODE_TO_CITY.get(postal_code)
-    if result:
-        return result[0]
+    city = _POSTAL_TO_CITY.get(postal_code)
+    if city:
+        return city
+
+    # Fallback to department-level detection for all French postcodes:
+    # specific city mappings first, then main city of department (one probe)
+    return resolve_city(postal_code)
+
+
+def _parse_postal_codes(postal_codes: Union[Sequence[str], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse postal codes to integers without a per-code Python loop.
+
+    Args:
+        postal_codes: Postal codes (list or string array)
+
+    Returns:
+        tuple: (values, valid) int64 array of parsed codes and a mask that is
+               True only for exactly-5-ASCII-digit codes
+    """
+    codes = np.ascontiguousarray(np.asarray(postal_codes, dtype=np.str_).ravel())
+    width = codes.dtype.itemsize // 4
+    if codes.size == 0 or width < 5:
+        return np.zeros(codes.size, dtype=np.int64), np.zeros(codes.size, dtype=bool)
+
+    # Reason: '<U' arrays store one uint32 code point per character
+    digits = codes.view(np.uint32).reshape(codes.size, width)[:, :5].astype(np.int64) - ord("0")
+    valid = (np.char.str_len(codes) == 5) & ((digits >= 0) & (digits <= 9)).all(axis=1)
+    values = digits @ np.array([10000, 1000, 100, 10, 1])
+    return np.where(valid, values, 0), valid
 
-    # Fallback to department-level detection for all French postcodes
-    from backend.data.french_departments import get_city_from_department, SPECIFIC_POSTAL_CODES
 
-    # Check specific city mappings first
-    if postal_code in SPECIFIC_POSTAL_CODES:
-        return SPECIFIC_POSTAL_CODES[postal_code]
+def get_cities_from_postal_codes(postal_codes: Union[Sequence[str], np.ndarray]) -> np.ndarray:
+    """
+    Get official city names for many postal codes at once.
 
-    # Fall back to main city of department
-    return get_city_from_department(postal_code)
+    Args:
+        postal_codes: 5-digit French postal codes (list or string array)
 
+    Returns:
+        np.ndarray: Object array of city names (or None), one per code, same
+                    values as get_city_from_postal_code()
+
+    Note:
+        Listed codes resolve with one vectorized gather from a direct-index
+        array; only unlisted codes go through the department fallback.
+    """
+    values, valid = _parse_postal_codes(postal_codes)
+    cities = _CITY_ARR[values]
+    cities[~valid] = None
 
+    codes = postal_codes.tolist() if isinstance(postal_codes, np.ndarray) else list(postal_codes)
+    for i in np.flatnonzero(np.equal(cities, None)):
+        cities[i] = get_city_from_postal_code(codes[i])
+    return cities
+
+
+@lru_cache(maxsize=4096)
 def get_department_from_postal_code(postal_code: str) -> Optional[str]:
     """
     Get department code from French postal code.
@@ -441,18 +536,41 @@ def get_department_from_postal_code(postal_code: str) -> Optional[str]:
 
     Returns:
         str: 2-digit department code, or None if not found
+
+    Note:
+        Results are cached per postal code.
     """
     if not postal_code or len(postal_code) != 5:
         return None
 
-    result = POSTAL_CODE_TO_CITY.get(postal_code)
-    if result:
-        return result[1]
+    # Department is the first 2 digits (checked against the table at import);
+    # interned so same-department results are one shared string
+    return sys.intern(postal_code[:2])
+
 
-    # Fallback: extract first 2 digits
-    return postal_code[:2]
+def get_postal_codes_by_prefix(prefix: str) -> List[str]:
+    """
+    List known postal codes starting with a prefix.
 
+    Args:
+        prefix: Leading digits, e.g. "75" for a department or "750" for Paris
 
+    Returns:
+        list: Matching postal codes from the table, in ascending order
+
+    Example:
+        >>> get_postal_codes_by_prefix("6900")[:2]
+        ['69001', '69002']
+    """
+    # Reason: binary search to the first match, then walk the sorted run
+    start = bisect_left(_SORTED_CODES, prefix)
+    end = start
+    while end < len(_SORTED_CODES) and _SORTED_CODES[end].startswith(prefix):
+        end += 1
+    return list(_SORTED_CODES[start:end])
+
+
+@lru_cache(maxsize=4096)
 def get_city_and_department(postal_code: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Get both city name and department code from postal code.
@@ -462,12 +580,12 @@ def get_city_and_department(postal_code: str) -> Tuple[Optional[str], Optional[s
 
     Returns:
         tuple: (city_name, department_code) or (None, None) if not found
+
+    Note:
+        Results are cached per postal code.
     """
     if not postal_code or len(postal_code) != 5:
         return None, None
 
-    result = POSTAL_CODE_TO_CITY.get(postal_code)
-    if result:
-        return result
-
-    return None, postal_code[:2]  # Return department as fallback
+    # Department falls back to the first 2 digits for unlisted codes too
+    return _POSTAL_TO_CITY.get(postal_code), sys.intern(postal_code[:2])
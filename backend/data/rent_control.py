@@ -5,7 +5,12 @@ Based on official government data for rent-controlled zones (zones tendues).
 Paris and several major cities have strict rent caps per m².
 """
 
-from typing import Optional, Tuple, Dict
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Optional, Tuple, Dict, Mapping, Sequence
+
+import numpy as np
 
 # Paris rent control by quartier (2024-2025 data)
 # Format: postal_code -> (min_rent_per_m2, max_rent_per_m2, median_rent_per_m2)
@@ -244,10 +249,32 @@ DEPARTMENT_TO_REGION: Dict[str, str] = {
     "20": "Corse", "2A": "Corse", "2B": "Corse",
 }
 
+# All rent-controlled postal codes in one table so a band lookup is a single
+# probe; Paris is merged last so its quartier data wins on any overlap
+_RENT_CONTROL_BANDS: Dict[str, Tuple[float, float, float]] = {**OTHER_CITIES_RENT_CONTROL, **PARIS_RENT_CONTROL}
+RENT_CONTROL_ALL: Mapping[str, Tuple[float, float, float]] = MappingProxyType(_RENT_CONTROL_BANDS)
+
+# The same bands as one contiguous (N, 3) array plus a postal code -> row index,
+# for applying rent control to many properties at once
+_BAND_INDEX: Dict[str, int] = {code: i for i, code in enumerate(_RENT_CONTROL_BANDS)}
+_BAND_TABLE: np.ndarray = np.array(list(_RENT_CONTROL_BANDS.values()), dtype=np.float64).reshape(-1, 3)
+
 # National average fallback (used when region not mapped)
 NATIONAL_AVERAGE_RENT: Tuple[float, float, float] = (9.0, 14.0, 11.5)
 
+# Department -> regional band, resolved once so an estimate is a single probe
+_DEPT_TO_BAND: Dict[str, Tuple[float, float, float]] = {
+    dept: REGIONAL_RENT_ESTIMATES.get(region, NATIONAL_AVERAGE_RENT)
+    for dept, region in DEPARTMENT_TO_REGION.items()
+}
+
+# Corsica department from the third postal code character: 0 (2A, Corse-du-Sud)
+# for "0"-"4", 1 (2B, Haute-Corse) otherwise; indexed by ord(), clamped to 255
+_CORSE_MAP = bytes(0 if c in b"01234" else 1 for c in range(256))
+_CORSE_DEPT = ("2A", "2B")
+
 
+@lru_cache(maxsize=4096)
 def get_rent_control_band(postal_code: str) -> Optional[Tuple[float, float, float]]:
     """
     Get legal rent control band for a postal code.
@@ -261,22 +288,67 @@ def get_rent_control_band(postal_code: str) -> Optional[Tuple[float, float, floa
     Note:
         Rent control (encadrement des loyers) applies in "zones tendues" (tight market zones).
         Paris has the strictest controls with quartier-level variations.
+        Results are cached per postal code.
     """
     if not postal_code or len(postal_code) != 5:
         return None
 
-    # Check Paris first (most detailed data)
-    if postal_code in PARIS_RENT_CONTROL:
-        return PARIS_RENT_CONTROL[postal_code]
+    # Paris and other cities share one table (None if not in a rent-controlled zone)
+    return _RENT_CONTROL_BANDS.get(postal_code)
 
-    # Check other cities
-    if postal_code in OTHER_CITIES_RENT_CONTROL:
-        return OTHER_CITIES_RENT_CONTROL[postal_code]
 
-    # Not in a rent-controlled zone
-    return None
+def get_rent_control_bands_batch(postal_codes: Sequence[str]) -> np.ndarray:
+    """
+    Get legal rent control bands for many postal codes at once.
 
+    Args:
+        postal_codes: 5-digit French postal codes
 
+    Returns:
+        np.ndarray: (len(postal_codes), 3) array of (min, max, median) rent per m²,
+                    one row per code; rows for codes outside a controlled zone are NaN
+
+    Example:
+        >>> get_rent_control_bands_batch(["75001", "00000"])[:, 1]
+        array([35.2,  nan])
+    """
+    # Reason: float64 keeps the rows equal to get_rent_control_band(), so
+    # compliance checks at the band edges agree with the scalar path
+    idx = np.fromiter((_BAND_INDEX.get(code, -1) for code in postal_codes), dtype=np.intp, count=len(postal_codes))
+    return np.where((idx >= 0)[:, None], _BAND_TABLE[idx], np.nan)
+
+
+def _department_band(postal_code: str) -> Tuple[float, float, float]:
+    """
+    Regional band for a postal code (at least 2 characters) via its department.
+    """
+    # Extract department code
+    # Reason: character compares avoid startswith() method dispatch; the cheap
+    # length check runs first for the overseas case.
+    first, second = postal_code[0], postal_code[1]
+    # Handle overseas departments (3-digit codes)
+    if len(postal_code) == 5 and first == "9" and second == "7":
+        dept_code = postal_code[:3]
+    # Handle Corsica special case
+    elif first == "2" and second == "0":
+        # Reason: table lookup replaces the substring scan; a bare "20" defaults to 2A
+        dept_code = _CORSE_DEPT[_CORSE_MAP[min(ord(postal_code[2]), 255)]] if len(postal_code) > 2 else "2A"
+    # Standard 2-digit department
+    else:
+        dept_code = postal_code[:2]
+
+    # Get regional band from department (fallback to national average)
+    return _DEPT_TO_BAND.get(dept_code, NATIONAL_AVERAGE_RENT)
+
+
+# Band for every 3-digit prefix of a 5-digit postal code, built from the rules
+# above; the first three digits decide overseas (97x) and Corsica (20x) cases
+_PREFIX_TO_BAND: Dict[str, Tuple[float, float, float]] = {
+    f"{prefix:03d}": _department_band(f"{prefix:03d}00") for prefix in range(1000)
+}
+
+
+@lru_cache(maxsize=4096)
 def get_regional_rent_estimate(postal_code: str) -> Optional[Tuple[float, float, float]]:
     """
     Get regional rent estimate for areas without specific rent control data.
@@ -290,40 +362,59 @@ def get_regional_rent_estimate(postal_code: str) -> Optional[Tuple[float, float,
     Note:
         This provides market-based estimates, not legal rent control limits.
         Used for guidance when no official rent control exists.
+        Results are cached per postal code.
     """
     if not postal_code or len(postal_code) < 2:
         return None
 
-    # Extract department code
-    # Handle overseas departments (3-digit codes)
-    if postal_code.startswith("97") and len(postal_code) == 5:
-        dept_code = postal_code[:3]
-    # Handle Corsica special case
-    elif postal_code.startswith("20"):
-        second_digit = postal_code[2] if len(postal_code) > 2 else "0"
-        if second_digit in "01234":
-            dept_code = "2A"
-        else:
-            dept_code = "2B"
-    # Standard 2-digit department
-    else:
-        dept_code = postal_code[:2]
+    # 5-digit codes resolve with one prefix probe; anything else (short or
+    # non-digit prefixes) goes through the department rules
+    if len(postal_code) == 5:
+        band = _PREFIX_TO_BAND.get(postal_code[:3])
+        if band is not None:
+            return band
 
-    # Get region from department
-    region = DEPARTMENT_TO_REGION.get(dept_code)
+    return _department_band(postal_code)
 
-    if region and region in REGIONAL_RENT_ESTIMATES:
-        return REGIONAL_RENT_ESTIMATES[region]
 
-    # Fallback to national average
-    return NATIONAL_AVERAGE_RENT
+@dataclass(slots=True)
+class RentCompliance:
+    """
+    Rent compliance check result for one property.
+
+    Attributes:
+        min_rent: Minimum rent per m² (legal control or market estimate)
+        max_rent: Maximum rent per m² (legal control or market estimate)
+        median_rent: Median/reference rent per m²
+        property_rent_per_m2: Actual rent per m² for this property
+        total_monthly_rent: Proposed monthly rent
+        surface: Property surface area in m²
+        is_compliant: Whether rent is within limits
+        compliance_percentage: Where rent sits in the band (0-100%, 50% = median)
+        verdict: Human-readable compliance status
+        is_estimate: True if using regional estimate, False if legal control
+    """
+    min_rent: float
+    max_rent: float
+    median_rent: float
+    property_rent_per_m2: float
+    total_monthly_rent: float
+    surface: float
+    is_compliant: bool
+    compliance_percentage: float
+    verdict: str
+    is_estimate: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as the plain dict check_rent_compliance used to return."""
+        return asdict(self)
 
 
 def check_rent_compliance(
     postal_code: str,
     monthly_rent: float,
     surface: float
-) -> Optional[Dict[str, any]]:
+) -> Optional[RentCompliance]:
     """
     Check if proposed rent complies with legal rent control limits or provide market estimate.
 
@@ -333,16 +424,8 @@ def check_rent_compliance(
         surface: Property surface area in m²
 
     Returns:
-        dict with:
-            - min_rent: Minimum rent per m² (legal control or market estimate)
-            - max_rent: Maximum rent per m² (legal control or market estimate)
-            - median_rent: Median/reference rent per m²
-            - property_rent_per_m2: Actual rent per m² for this property
-            - is_compliant: Whether rent is within limits
-            - compliance_percentage: Where rent sits in the band (0-100%, 50% = median)
-            - verdict: Human-readable compliance status
-            - is_estimate: True if using regional estimate, False if legal control
-        or None if invalid postal code
+        RentCompliance: Band, rent per m², compliance and verdict (use
+        .to_dict() for the plain dict form), or None if invalid postal code
     """
     # Try to get legal rent control band first
     band = get_rent_control_band(postal_code)
@@ -391,18 +474,18 @@ def check_rent_compliance(
         else:
             verdict = "Conformant – High"
 
-    return {
-        "min_rent": min_rent,
-        "max_rent": max_rent,
-        "median_rent": median_rent,
-        "property_rent_per_m2": property_rent_per_m2,
-        "total_monthly_rent": monthly_rent,
-        "surface": surface,
-        "is_compliant": is_compliant,
-        "compliance_percentage": compliance_percentage,
-        "verdict": verdict,
-        "is_estimate": is_estimate
-    }
+    return RentCompliance(
+        min_rent=min_rent,
+        max_rent=max_rent,
+        median_rent=median_rent,
+        property_rent_per_m2=property_rent_per_m2,
+        total_monthly_rent=monthly_rent,
+        surface=surface,
+        is_compliant=is_compliant,
+        compliance_percentage=compliance_percentage,
+        verdict=verdict,
+        is_estimate=is_estimate
+    )
 
 
 def get_recommended_rent(postal_code: str, surface: float) -> Optional[float]:
@@ -5,11 +5,44 @@ MIRROR: use-cases/pydantic-ai/examples/main_agent_reference/tools.py lines 18-12
 """
 
 import logging
+from importlib.util import find_spec
 from typing import List, Dict, Any, Optional
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# Optional: h2 lets the shared client negotiate HTTP/2; without it httpx
+# speaks HTTP/1.1
+_HAS_H2 = find_spec("h2") is not None
+
+# Shared client so repeated searches reuse keep-alive connections instead of
+# paying client setup and a TCP + TLS handshake per call; closed by the app on shutdown
+_BRAVE_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_brave_client() -> httpx.AsyncClient:
+    """
+    Get the shared Brave Search HTTP client, creating it on first use.
+    """
+    global _BRAVE_CLIENT
+    if _BRAVE_CLIENT is None or _BRAVE_CLIENT.is_closed:
+        _BRAVE_CLIENT = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+            http2=_HAS_H2
+        )
+    return _BRAVE_CLIENT
+
+
+async def close_brave_client() -> None:
+    """
+    Close the shared Brave Search HTTP client (call on application shutdown).
+    """
+    global _BRAVE_CLIENT
+    if _BRAVE_CLIENT is not None:
+        await _BRAVE_CLIENT.aclose()
+        _BRAVE_CLIENT = None
+
 
 async def search_web(
     api_key: str,
@@ -64,52 +97,52 @@ async def search_web(
 
     logger.info(f"Searching Brave for: {query}")
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://api.search.brave.com/res/v1/web/search",
-                headers=headers,
-                params=params,
-                timeout=30.0
-            )
-
-            # Handle rate limiting
-            if response.status_code == 429:
-                raise Exception("Rate limit exceeded. Check your Brave API quota.")
-
-            # Handle authentication errors
-            if response.status_code == 401:
-                raise Exception("Invalid Brave API key")
-
-            # Handle other errors
-            if response.status_code != 200:
-                raise Exception(f"Brave API returned {response.status_code}: {response.text}")
-
-            data = response.json()
-
-            # Extract web results
-            web_results = data.get("web", {}).get("results", [])
-
-            # Convert to our format
-            results = []
-            for idx, result in enumerate(web_results):
-                # Calculate a simple relevance score based on position
-                score = 1.0 - (idx * 0.05)  # Decrease by 0.05 for each position
-                score = max(score, 0.1)  # Minimum score of 0.1
-
-                results.append({
-                    "title": result.get("title", ""),
-                    "url": result.get("url", ""),
-                    "description": result.get("description", ""),
-                    "score": score
-                })
-
-            logger.info(f"Found {len(results)} results for query: {query}")
-            return results
-
-        except httpx.RequestError as e:
-            logger.error(f"Request error during Brave search: {e}")
-            raise Exception(f"Request failed: {str(e)}")
-        except Exception as e:
-            logger.error(f"Error during Brave search: {e}")
-            raise
\ No newline at end of file
+    client = _get_brave_client()
+    try:
+        response = await client.get(
+            "https://api.search.brave.com/res/v1/web/search",
+            headers=headers,
+            params=params,
+            timeout=30.0
+        )
+
+        # Handle rate limiting
+        if response.status_code == 429:
+            raise Exception("Rate limit exceeded. Check your Brave API quota.")
+
+        # Handle authentication errors
+        if response.status_code == 401:
+            raise Exception("Invalid Brave API key")
+
+        # Handle other errors
+        if response.status_code != 200:
+            raise Exception(f"Brave API returned {response.status_code}: {response.text}")
+
+        data = response.json()
+
+        # Extract web results
+        web_results = data.get("web", {}).get("results", [])
+
+        # Convert to our format
+        results = []
+        for idx, result in enumerate(web_results):
+            # Calculate a simple relevance score based on position
+            score = 1.0 - (idx * 0.05)  # Decrease by 0.05 for each position
+            score = max(score, 0.1)  # Minimum score of 0.1
+
+            results.append({
+                "title": result.get("title", ""),
+                "url": result.get("url", ""),
+                "description": result.get("description", ""),
+                "score": score
+            })
+
+        logger.info(f"Found {len(results)} results for query: {query}")
+        return results
+
+    except httpx.RequestError as e:
+        logger.error(f"Request error during Brave search: {e}")
+        raise Exception(f"Request failed: {str(e)}")
+    except Exception as e:
+        logger.error(f"Error during Brave search: {e}")
+        raise
\ No newline at end of file
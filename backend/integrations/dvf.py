@@ -5,15 +5,57 @@ Implements progressive geographic search with robust filtering and weighted stat
 """
 
 import logging
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
+from datetime import datetime
+from importlib.util import find_spec
 import httpx
 import math
 import statistics
+import time
+
+import numpy as np
+
+from backend.calculations._jit import HAS_NUMBA, njit, prange
 
 logger = logging.getLogger(__name__)
 
+# Optional: orjson parses large DVF payloads about twice as fast as json
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
+
+# Optional: h2 lets the shared client negotiate HTTP/2 (multiplexed requests
+# over one connection); without it httpx speaks HTTP/1.1
+_HAS_H2 = find_spec("h2") is not None
+
+# Shared client so repeated DVF fetches reuse keep-alive connections instead
+# of paying a TCP + TLS handshake per call; closed by the app on shutdown
+_DVF_CLIENT: Optional[httpx.AsyncClient] = None
+
+# Raw DVF records by (postal_code, property_type) with their fetch time; the
+# source data changes a few times a year, so a day-old answer is still current.
+# Kept in fetch order (oldest first) and capped, since each entry holds a full
+# raw payload
+DVF_CACHE_TTL_SECONDS = 86400
+DVF_CACHE_MAX_ENTRIES = 256
+_DVF_CACHE: Dict[Tuple[str, str], Tuple[float, List[Dict[str, Any]]]] = {}
 
+# Comp surface band multipliers: ±12.5% for the initial search, widened to
+# ±17.5% when it finds too few comps
+_SURF_LO_NARROW, _SURF_HI_NARROW = 0.875, 1.125
+_SURF_LO_WIDE, _SURF_HI_WIDE = 0.825, 1.175
+
+# Comp sale-date windows: api.cquest.org only has data up to 2019, so the
+# ~24/~36 month windows are anchored on the last available data, not today
+_MIN_DATE_24M = "2017-01-01"
+_MIN_DATE_36M = "2016-01-01"
+
+# fetch_dvf_comps() default radius; addresses are not geocoded yet
+_DEFAULT_RADIUS_KM = 0.5
+
+
+@njit(cache=True)
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate distance between two points in km using Haversine formula.
@@ -38,6 +80,51 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
+@njit(cache=True, parallel=True)
+def _haversine_kernel(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Compiled loop form of haversine_batch (one haversine_distance per point).
+    """
+    distances = np.empty(lats.shape[0])
+    for i in prange(lats.shape[0]):
+        distances[i] = haversine_distance(lat, lon, lats[i], lons[i])
+    return distances
+
+
+def haversine_batch(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Calculate distances in km from one point to many points (vectorized Haversine).
+
+    Args:
+        lat, lon: Reference point coordinates
+        lats, lons: Arrays of point coordinates (NaN gives a NaN distance)
+
+    Returns:
+        Array of distances in kilometers
+
+    Note:
+        Uses the compiled kernel when Numba is installed, NumPy ufuncs otherwise;
+        both agree with haversine_distance() to rounding.
+    """
+    if HAS_NUMBA:
+        return _haversine_kernel(
+            float(lat), float(lon),
+            np.ascontiguousarray(lats, dtype=np.float64), np.ascontiguousarray(lons, dtype=np.float64)
+        )
+
+    R = 6371  # Earth radius in km
+
+    lat_rad = math.radians(lat)
+    lats_rad = np.radians(lats)
+    dlat = np.radians(lats - lat)
+    dlon = np.radians(lons - lon)
+
+    a = np.sin(dlat/2)**2 + math.cos(lat_rad) * np.cos(lats_rad) * np.sin(dlon/2)**2
+    c = 2 * np.arcsin(np.sqrt(a))
+
+    return R * c
+
+
 def time_decay_weight(sale_date: str, reference_date: datetime, decay_rate: float = 0.1) -> float:
     """
     Calculate time decay weight for comparable sales.
@@ -60,6 +147,55 @@ def time_decay_weight(sale_date: str, reference_date: datetime, decay_rate: floa
         return 0.5  # Default weight if date parsing fails
 
 
+def _is_iso_date(value: Any) -> bool:
+    """
+    True for plain YYYY-MM-DD strings, the shape both strptime and datetime64 parse alike.
+    """
+    return (
+        isinstance(value, str) and len(value) == 10 and value.isascii()
+        and value[4] == "-" and value[7] == "-" and value[:4].isdigit() and value[:4] != "0000"
+    )
+
+
+def time_decay_weights(
+    sale_dates: List[str],
+    reference_date: datetime,
+    decay_rate: float = 0.1
+) -> np.ndarray:
+    """
+    Calculate time decay weights for many comparable sales at once.
+
+    Args:
+        sale_dates: Sale dates as strings (YYYY-MM-DD)
+        reference_date: Reference date (usually today)
+        decay_rate: Decay rate per year (default 0.1 = 10% per year)
+
+    Returns:
+        Array of weights, same values as time_decay_weight() per date
+    """
+    is_iso = [_is_iso_date(sale_date) for sale_date in sale_dates]
+    try:
+        parsed = np.array([sale_date for sale_date, ok in zip(sale_dates, is_iso) if ok], dtype="datetime64[D]")
+    except ValueError:
+        # Reason: a malformed date slipped into the fast path; the scalar function handles it
+        return np.array([time_decay_weight(sale_date, reference_date, decay_rate) for sale_date in sale_dates])
+
+    # Reason: whole days between dates equal timedelta.days against a
+    # reference datetime, since sale dates fall at midnight
+    days_ago = (np.datetime64(reference_date.date(), "D") - parsed).astype(np.float64)
+    months_ago = days_ago / 30.44
+    years_ago = months_ago / 12
+
+    weights = np.empty(len(sale_dates))
+    weights[np.array(is_iso, dtype=bool)] = np.maximum(0.1, np.exp(-decay_rate * years_ago))  # Minimum weight of 0.1
+
+    # Other formats and missing dates go through the scalar parser
+    for i, ok in enumerate(is_iso):
+        if not ok:
+            weights[i] = time_decay_weight(sale_dates[i], reference_date, decay_rate)
+    return weights
+
+
 def room_similarity_weight(subject_rooms: int, comp_rooms: int) -> float:
     """
     Calculate similarity weight based on room count difference.
@@ -101,48 +237,48 @@ def calculate_weighted_median_and_bands(
     if not comps:
         return {}
 
-    # Calculate weights and collect prices
-    weighted_prices = []
-    for comp in comps:
-        price_per_m2 = comp.get("price_per_m2", 0)
-        if price_per_m2 <= 0:
-            continue
-
-        # Time decay weight
-        time_weight = time_decay_weight(
-            comp.get("date_mutation", ""),
-            reference_date
-        )
+    # Collect comps with a usable price
+    priced = [comp for comp in comps if comp.get("price_per_m2", 0) > 0]
+    if not priced:
+        return {}
+    prices = [comp["price_per_m2"] for comp in priced]
 
-        # Room similarity weight (if applicable)
-        room_weight = 1.0
-        if subject_rooms and comp.get("nombre_pieces_principales"):
-            room_weight = room_similarity_weight(
-                subject_rooms,
-                comp.get("nombre_pieces_principales", 0)
-            )
+    # Time decay weights, parsed for all comps at once
+    time_weights = time_decay_weights([comp.get("date_mutation", "") for comp in priced], reference_date)
 
-        # Combined weight
-        weight = time_weight * room_weight
+    # Room similarity weight (if applicable)
+    room_weights = np.array([
+        room_similarity_weight(subject_rooms, comp.get("nombre_pieces_principales", 0))
+        if subject_rooms and comp.get("nombre_pieces_principales") else 1.0
+        for comp in priced
+    ])
 
-        # Add weighted samples (simulate by repeating based on weight)
-        repeat_count = max(1, int(weight * 10))
-        weighted_prices.extend([price_per_m2] * repeat_count)
+    # Combined weight; weighted samples: each price counts repeat_count times
+    repeat_counts = np.maximum(1, (time_weights * room_weights * 10).astype(np.int64))
 
-    if not weighted_prices:
-        return {}
+    # Reason: instead of materializing each price repeat_count times and
+    # sorting, sort the prices once and map positions in the repeated
+    # sequence back to prices through the cumulative repeat counts
+    order = np.argsort(prices, kind="stable")
+    cumulative = np.cumsum(repeat_counts[order])
+    n = int(cumulative[-1])
 
-    # Calculate percentiles
-    weighted_prices.sort()
-    n = len(weighted_prices)
+    def weighted_at(positions: List[int]) -> List[float]:
+        return [prices[i] for i in order[np.searchsorted(cumulative, positions, side="right")].tolist()]
+
+    p25, p75, p10, p90, mid_low, mid_high = weighted_at(
+        [int(n * 0.25), int(n * 0.75), int(n * 0.10), int(n * 0.90), (n - 1) // 2, n // 2]
+    )
 
     return {
-        "median": statistics.median(weighted_prices),
-        "p25": weighted_prices[int(n * 0.25)],
-        "p75": weighted_prices[int(n * 0.75)],
-        "p10": weighted_prices[int(n * 0.10)],
-        "p90": weighted_prices[int(n * 0.90)],
-        "mean": statistics.mean(weighted_prices),
+        "median": mid_high if n % 2 else (mid_low + mid_high) / 2,
+        "p25": p25,
+        "p75": p75,
+        "p10": p10,
+        "p90": p90,
+        # Reason: repeat_counts is already an array; statistics.fmean would
+        # walk it as NumPy scalars in the interpreter
+        "mean": float(np.average(prices, weights=repeat_counts)),
         "count": len(comps)
     }
 
@@ -176,12 +312,9 @@ async def fetch_dvf_comps_progressive(
     Returns:
         (List of comparables, geographic scope description)
     """
-    reference_date = datetime.now()
-
-    # Time filtering: NOTE - api.cquest.org only has data up to 2019
-    # Using wider time window due to data availability
-    min_date_24m = "2017-01-01"  # Last ~24 months of available data
-    min_date_36m = "2016-01-01"  # Last ~36 months of available data
+    # Time filtering: wider windows due to data availability (see _MIN_DATE_24M)
+    min_date_24m = _MIN_DATE_24M
+    min_date_36m = _MIN_DATE_36M
 
     logger.info(f"Starting progressive DVF search for {postal_code}, surface {surface}m²")
     logger.warning("Using api.cquest.org DVF data (only updated through June 2019)")
@@ -195,31 +328,74 @@ async def fetch_dvf_comps_progressive(
 
     logger.info(f"Fetched {len(all_comps)} raw DVF records for {postal_code}")
 
+    # Reason: columns, band masks and distances do not depend on the radius,
+    # so every pass below only re-combines masks
+    columns = _prepare_comp_arrays(all_comps)
+    bands = _band_masks(columns, surface, min_date_24m, min_date_36m)
+
     # Progressive search if we have coordinates
     if lat and lon:
+        distances = haversine_batch(lat, lon, columns.lat, columns.lon)
+
         for radius_km in [0.4, 0.8, 1.2]:
-            comps = _filter_comps(
-                all_comps, surface, rooms, reference_date,
-                lat=lat, lon=lon, radius_km=radius_km,
-                min_date_24m=min_date_24m, min_date_36m=min_date_36m
-            )
+            selected = _select_comps(columns, bands, distances <= radius_km)
 
-            if len(comps) >= min_comps:
-                logger.info(f"Found {len(comps)} comps within {radius_km}km radius")
-                return comps, f"{radius_km}km radius"
+            if len(selected) >= min_comps:
+                logger.info(f"Found {len(selected)} comps within {radius_km}km radius")
+                return [_comp_from_record(all_comps[i]) for i in selected.tolist()], f"{radius_km}km radius"
 
         logger.info(f"Insufficient comps in radius searches, falling back to commune")
 
     # Fall back to commune-wide search
-    comps = _filter_comps(
-        all_comps, surface, rooms, reference_date,
-        min_date_24m=min_date_24m, min_date_36m=min_date_36m
-    )
+    selected = _select_comps(columns, bands)
+    comps = [_comp_from_record(all_comps[i]) for i in selected.tolist()]
 
     logger.info(f"Found {len(comps)} comps in commune {postal_code}")
     return comps, f"Commune {postal_code}"
 
 
+def _get_dvf_client() -> httpx.AsyncClient:
+    """
+    Get the shared DVF HTTP client, creating it on first use.
+    """
+    global _DVF_CLIENT
+    if _DVF_CLIENT is None or _DVF_CLIENT.is_closed:
+        _DVF_CLIENT = httpx.AsyncClient(
+            timeout=15.0,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+            http2=_HAS_H2
+        )
+    return _DVF_CLIENT
+
+
+async def close_dvf_client() -> None:
+    """
+    Close the shared DVF HTTP client (call on application shutdown).
+    """
+    global _DVF_CLIENT
+    if _DVF_CLIENT is not None:
+        await _DVF_CLIENT.aclose()
+        _DVF_CLIENT = None
+
+
+def _store_dvf_cache(cache_key: Tuple[str, str], results: List[Dict[str, Any]]) -> None:
+    """
+    Cache a DVF response, evicting expired entries and then the oldest ones over the cap.
+    """
+    now = time.monotonic()
+
+    # Reason: re-inserting moves the key to the end, so dict order stays
+    # fetch-time order and expired entries are always at the front
+    _DVF_CACHE.pop(cache_key, None)
+    while _DVF_CACHE:
+        oldest = next(iter(_DVF_CACHE))
+        if now - _DVF_CACHE[oldest][0] < DVF_CACHE_TTL_SECONDS and len(_DVF_CACHE) < DVF_CACHE_MAX_ENTRIES:
+            break
+        del _DVF_CACHE[oldest]
+
+    _DVF_CACHE[cache_key] = (now, results)
+
+
 async def _fetch_raw_dvf_data(
     postal_code: str,
     property_type: str,
@@ -227,25 +403,36 @@ async def _fetch_raw_dvf_data(
 ) -> List[Dict[str, Any]]:
     """
     Fetch raw DVF data from API.
+
+    Note:
+        Successful responses are cached per (postal_code, property_type) for
+        DVF_CACHE_TTL_SECONDS, up to DVF_CACHE_MAX_ENTRIES codes (oldest evicted
+        first); errors and non-200 responses are not cached.
+        Responses are parsed with orjson when installed.
     """
+    cache_key = (postal_code, property_type)
+    cached = _DVF_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < DVF_CACHE_TTL_SECONDS:
+        return cached[1]
+
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            url = "https://api.cquest.org/dvf"
-            params = {
-                "code_postal": postal_code,
-                "type_local": property_type
-            }
+        url = "https://api.cquest.org/dvf"
+        params = {
+            "code_postal": postal_code,
+            "type_local": property_type
+        }
 
-            response = await client.get(url, params=params)
+        response = await _get_dvf_client().get(url, params=params)
 
-            if response.status_code != 200:
-                logger.warning(f"DVF API returned status {response.status_code}")
-                return []
+        if response.status_code != 200:
+            logger.warning(f"DVF API returned status {response.status_code}")
+            return []
 
-            data = response.json()
-            results = data.get("resultats", data.get("features", []))
+        data = _orjson_loads(response.content) if _orjson_loads is not None else response.json()
+        results = data.get("resultats", data.get("features", []))
 
-            return results
+        _store_dvf_cache(cache_key, results)
+        return results
 
     except httpx.TimeoutException:
         logger.warning(f"DVF API timeout for {postal_code}")
@@ -255,6 +442,208 @@ async def _fetch_raw_dvf_data(
         return []
 
 
+class _RawComps(NamedTuple):
+    """
+    Raw DVF records as parallel column arrays (one entry per record).
+
+    Attributes:
+        sale_date: datetime64[D] sale dates, NaT when missing, unparseable or not a "Vente"
+        surface: Built surface in m² (NaN when missing or zero)
+        valeur: Sale price (NaN when missing or zero)
+        lat: Latitude (NaN when missing or zero)
+        lon: Longitude (NaN when missing or zero)
+    """
+    sale_date: np.ndarray
+    surface: np.ndarray
+    valeur: np.ndarray
+    lat: np.ndarray
+    lon: np.ndarray
+
+
+def _parse_sale_dates(sale_dates: List[str]) -> np.ndarray:
+    """
+    Parse YYYY-MM-DD strings to datetime64[D]; empty or unparseable dates become NaT.
+    """
+    try:
+        return np.array(sale_dates, dtype="datetime64[D]")
+    except ValueError:
+        pass
+
+    # Reason: one malformed date fails the whole array; parse one by one instead
+    parsed = np.full(len(sale_dates), np.datetime64("NaT"), dtype="datetime64[D]")
+    for i, sale_date in enumerate(sale_dates):
+        try:
+            parsed[i] = np.datetime64(sale_date, "D")
+        except ValueError:
+            pass
+    return parsed
+
+
+def _prepare_comp_arrays(raw_comps: List[Dict[str, Any]]) -> _RawComps:
+    """
+    Load the fields the comp filters test into column arrays.
+
+    Args:
+        raw_comps: Raw DVF records
+
+    Returns:
+        _RawComps: Columns for the records, in their original order
+    """
+    nan = math.nan
+
+    def column(values):
+        return np.array(values, dtype=np.float64)
+
+    # Reason: non-sales get an empty date (NaT), so one column covers both
+    # the nature and the date filter
+    sale_dates = [
+        (record.get("date_mutation", "") or "") if record.get("nature_mutation", "") == "Vente" else ""
+        for record in raw_comps
+    ]
+
+    return _RawComps(
+        sale_date=_parse_sale_dates(sale_dates),
+        surface=column([
+            record.get("surface_relle_bati") or record.get("surface_reelle_bati") or nan
+            for record in raw_comps
+        ]),
+        valeur=column([record.get("valeur_fonciere") or nan for record in raw_comps]),
+        lat=column([record.get("lat") or nan for record in raw_comps]),
+        lon=column([record.get("lon") or nan for record in raw_comps]),
+    )
+
+
+def _comp_mask(
+    columns: _RawComps,
+    min_date: str,
+    min_surface: float,
+    max_surface: float
+) -> np.ndarray:
+    """
+    Boolean mask of sales on or after min_date within the surface band.
+    """
+    surface = columns.surface
+
+    # Reason: NaT dates and NaN (missing) surface/valeur compare False,
+    # dropping the record
+    return (
+        (columns.sale_date >= np.datetime64(min_date, "D"))
+        & (columns.valeur > 0) & (surface > 0)
+        & (surface >= min_surface) & (surface <= max_surface)
+    )
+
+
+def _band_masks(
+    columns: _RawComps,
+    surface: float,
+    min_date_24m: str,
+    min_date_36m: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Non-geographic masks for the initial and the widened search.
+
+    Returns:
+        (±12.5% surface / 24 months, ±17.5% surface / 36 months)
+    """
+    return (
+        _comp_mask(columns, min_date_24m, surface * _SURF_LO_NARROW, surface * _SURF_HI_NARROW),
+        _comp_mask(columns, min_date_36m, surface * _SURF_LO_WIDE, surface * _SURF_HI_WIDE),
+    )
+
+
+_CLAMP_QUANTILES = np.array([0.05, 0.95])
+
+# Below this many comps the P5-P95 clamp is skipped: interpolated quantiles
+# fall strictly inside a small set's range, so the clamp would always drop
+# both extremes (two comps -> none, three -> one)
+_CLAMP_MIN_COMPS = 20
+
+
+def _clamp_bounds(prices: np.ndarray) -> np.ndarray:
+    """
+    P5 and P95 of prices, equal to np.quantile(prices, [0.05, 0.95]).
+
+    Note:
+        Only the four order statistics around the two quantile positions are
+        placed with np.partition; np.quantile does the same selection but its
+        generic setup dominates on comp-sized arrays.
+    """
+    n = prices.size
+    position = (n - 1) * _CLAMP_QUANTILES
+    below = np.floor(position).astype(np.intp)
+    above = np.minimum(below + 1, n - 1)
+
+    ordered = np.partition(prices, np.concatenate((below, above)))
+    low, high = ordered[below], ordered[above]
+    fraction = position - below
+
+    # Reason: same two-sided lerp as numpy's "linear" method, so the bounds
+    # (and therefore the clamp) are bit-identical to np.quantile
+    diff = high - low
+    return np.where(fraction >= 0.5, high - diff * (1 - fraction), low + diff * fraction)
+
+
+def _select_comps(
+    columns: _RawComps,
+    bands: Tuple[np.ndarray, np.ndarray],
+    in_radius: Any = True
+) -> np.ndarray:
+    """
+    Indices of the records kept as comparables.
+
+    Args:
+        columns: Columns from _prepare_comp_arrays()
+        bands: Masks from _band_masks()
+        in_radius: Boolean mask of records within the search radius (True for no radius)
+
+    Returns:
+        Indices into the raw records, in their original order
+    """
+    narrow, wide = bands
+
+    # Initial surface band: ±12.5%, last 24 months
+    mask = in_radius & narrow
+
+    # If insufficient, widen surface band to ±17.5% and extend time to 36 months
+    if np.count_nonzero(mask) < 12:
+        mask = in_radius & wide
+
+    selected = np.flatnonzero(mask)
+
+    # Remove outliers using P5-P95 clamp (only on sets large enough for the
+    # quantiles to separate real outliers from the ordinary spread)
+    if selected.size >= _CLAMP_MIN_COMPS:
+        prices = columns.valeur[selected] / columns.surface[selected]
+        p5, p95 = _clamp_bounds(prices)
+
+        selected = selected[(prices >= p5) & (prices <= p95)]
+
+    return selected
+
+
+def _comp_from_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the comparable sale dict returned to callers from a raw DVF record.
+    """
+    surface_bati = record.get("surface_relle_bati") or record.get("surface_reelle_bati")
+    valeur = record.get("valeur_fonciere")
+
+    return {
+        "id_mutation": record.get("reference_document", ""),
+        "date_mutation": record.get("date_mutation", ""),
+        "adresse": f"{record.get('numero_voie', '')} {record.get('type_voie', '')} {record.get('voie', '')}".strip(),
+        "code_postal": record.get("code_postal"),
+        "commune": record.get("commune"),
+        "type_local": record.get("type_local"),
+        "surface_reelle_bati": surface_bati,
+        "nombre_pieces_principales": record.get("nombre_pieces_principales"),
+        "valeur_fonciere": valeur,
+        "price_per_m2": valeur / surface_bati,
+        "lat": record.get("lat"),
+        "lon": record.get("lon")
+    }
+
+
 def _filter_comps(
     raw_comps: List[Dict[str, Any]],
     surface: float,
@@ -275,126 +664,71 @@ def _filter_comps(
     - Time filtering (24 months, extend to 36 if needed)
     - Nature mutation filtering (Vente only)
     - Outlier removal (MAD, P5-P95 clamp)
+
+    Note:
+        Filters run as vectorized masks over column arrays; distances are
+        computed once and only the surviving records are turned into dicts.
     """
-    comps = []
-
-    # Initial surface band: ±12.5%
-    min_surface = surface * 0.875
-    max_surface = surface * 1.125
-
-    # Filter comps
-    for record in raw_comps:
-        # Nature mutation filter
-        nature = record.get("nature_mutation", "")
-        if nature != "Vente":
-            continue
-
-        # Date filter (try 24m first)
-        date_mutation = record.get("date_mutation", "")
-        if not date_mutation or date_mutation < min_date_24m:
-            continue
-
-        # Geographic filter (if radius provided)
-        if lat and lon and radius_km:
-            comp_lat = record.get("lat")
-            comp_lon = record.get("lon")
-            if not comp_lat or not comp_lon:
-                continue
-
-            distance = haversine_distance(lat, lon, comp_lat, comp_lon)
-            if distance > radius_km:
-                continue
-
-        # Surface filter
-        surface_bati = record.get("surface_relle_bati") or record.get("surface_reelle_bati")
-        valeur = record.get("valeur_fonciere")
-
-        if not surface_bati or not valeur or valeur <= 0 or surface_bati <= 0:
-            continue
-
-        if surface_bati < min_surface or surface_bati > max_surface:
-            continue
-
-        # Valid comp
-        price_per_m2 = valeur / surface_bati
-
-        comps.append({
-            "id_mutation": record.get("reference_document", ""),
-            "date_mutation": date_mutation,
-            "adresse": f"{record.get('numero_voie', '')} {record.get('type_voie', '')} {record.get('voie', '')}".strip(),
-            "code_postal": record.get("code_postal"),
-            "commune": record.get("commune"),
-            "type_local": record.get("type_local"),
-            "surface_reelle_bati": surface_bati,
-            "nombre_pieces_principales": record.get("nombre_pieces_principales"),
-            "valeur_fonciere": valeur,
-            "price_per_m2": price_per_m2,
-            "lat": record.get("lat"),
-            "lon": record.get("lon")
-        })
-
-    # If insufficient, widen surface band to ±17.5%
-    if len(comps) < 12:
-        min_surface = surface * 0.825
-        max_surface = surface * 1.175
-
-        comps = []
-        for record in raw_comps:
-            nature = record.get("nature_mutation", "")
-            if nature != "Vente":
-                continue
-
-            date_mutation = record.get("date_mutation", "")
-            if not date_mutation or date_mutation < min_date_36m:  # Extend time too
-                continue
-
-            if lat and lon and radius_km:
-                comp_lat = record.get("lat")
-                comp_lon = record.get("lon")
-                if not comp_lat or not comp_lon:
-                    continue
-
-                distance = haversine_distance(lat, lon, comp_lat, comp_lon)
-                if distance > radius_km:
-                    continue
-
-            surface_bati = record.get("surface_relle_bati") or record.get("surface_reelle_bati")
-            valeur = record.get("valeur_fonciere")
-
-            if not surface_bati or not valeur or valeur <= 0 or surface_bati <= 0:
-                continue
-
-            if surface_bati < min_surface or surface_bati > max_surface:
-                continue
-
-            price_per_m2 = valeur / surface_bati
-
-            comps.append({
-                "id_mutation": record.get("reference_document", ""),
-                "date_mutation": date_mutation,
-                "adresse": f"{record.get('numero_voie', '')} {record.get('type_voie', '')} {record.get('voie', '')}".strip(),
-                "code_postal": record.get("code_postal"),
-                "commune": record.get("commune"),
-                "type_local": record.get("type_local"),
-                "surface_reelle_bati": surface_bati,
-                "nombre_pieces_principales": record.get("nombre_pieces_principales"),
-                "valeur_fonciere": valeur,
-                "price_per_m2": price_per_m2,
-                "lat": record.get("lat"),
-                "lon": record.get("lon")
-            })
-
-    # Remove outliers using P5-P95 clamp
-    if comps:
-        prices = [c["price_per_m2"] for c in comps]
-        prices.sort()
-        n = len(prices)
-        p5 = prices[int(n * 0.05)]
-        p95 = prices[int(n * 0.95)]
-
-        comps = [c for c in comps if p5 <= c["price_per_m2"] <= p95]
-
-    return comps
+    columns = _prepare_comp_arrays(raw_comps)
+
+    # Geographic filter (if radius provided); NaN coordinates never match
+    in_radius = True
+    if lat and lon and radius_km:
+        in_radius = haversine_batch(lat, lon, columns.lat, columns.lon) <= radius_km
+
+    selected = _select_comps(columns, _band_masks(columns, surface, min_date_24m, min_date_36m), in_radius)
+
+    return [_comp_from_record(raw_comps[i]) for i in selected.tolist()]
+
+
+async def fetch_dvf_comps(
+    address: str,
+    postal_code: str,
+    radius_km: float = _DEFAULT_RADIUS_KM,
+    surface: Optional[float] = None,
+    property_type: str = "Appartement"
+) -> List[Dict[str, Any]]:
+    """
+    Fetch DVF comparables for an address (legacy entry point used by the research agent).
+
+    Args:
+        address: Property address
+        postal_code: 5-digit French postal code
+        radius_km: Search radius in km
+        surface: Property surface in m² (enables the surface band filter)
+        property_type: Type of property (Appartement, Maison)
+
+    Returns:
+        List of comparable sales
+
+    Note:
+        Addresses are not geocoded yet, so the search covers the commune and
+        address/radius_km are accepted for compatibility only (a non-default
+        radius logs a warning). With a surface this delegates to
+        fetch_dvf_comps_progressive(); without one, every sale of the last
+        ~36 months is kept (with the P5-P95 clamp).
+    """
+    if radius_km != _DEFAULT_RADIUS_KM:
+        logger.warning(
+            f"radius_km={radius_km} ignored for {postal_code}: addresses are not "
+            "geocoded yet, returning commune-wide comps"
+        )
+
+    if surface:
+        comps, _ = await fetch_dvf_comps_progressive(postal_code, surface, property_type=property_type)
+        return comps
+
+    # Same 36-month window as the widened progressive search
+    min_date = _MIN_DATE_36M
+    raw_comps = await _fetch_raw_dvf_data(postal_code, property_type, min_date)
+    if not raw_comps:
+        return []
+
+    columns = _prepare_comp_arrays(raw_comps)
+    mask = _comp_mask(columns, min_date, 0.0, math.inf)
+    selected = _select_comps(columns, (mask, mask))
+
+    return [_comp_from_record(raw_comps[i]) for i in selected.tolist()]
 
 
 def calculate_median_price_per_m2(comps: List[Dict[str, Any]]) -> float:
@@ -415,4 +749,11 @@ def calculate_median_price_per_m2(comps: List[Dict[str, Any]]) -> float:
     if not prices_per_m2:
         return 0.0
 
+    # Reason: sparse postal codes often give one or two comps; answering
+    # those directly skips statistics.median's sort and dispatch
+    if len(prices_per_m2) == 1:
+        return prices_per_m2[0]
+    if len(prices_per_m2) == 2:
+        return (prices_per_m2[0] + prices_per_m2[1]) / 2
+
     return statistics.median(prices_per_m2)
@@ -6,6 +6,7 @@ API: https://developers.google.com/workspace/gmail/api/guides/drafts
 
 import logging
 import base64
+import hashlib
 from email.mime.text import MIMEText
 from typing import Optional
 
@@ -68,7 +69,10 @@ async def create_draft(
         # return result['id']
 
         # For now, return placeholder
-        draft_id = f"draft_placeholder_{hash(to + subject)}"
+        # Reason: builtin hash() of a str changes per process (PYTHONHASHSEED),
+        # so the same draft got a different id after every restart
+        digest = hashlib.blake2b((to + subject).encode(), digest_size=8).hexdigest()
+        draft_id = f"draft_placeholder_{digest}"
 
         logger.info(f"Draft created (placeholder): {draft_id}")
 
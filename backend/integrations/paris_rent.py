@@ -6,10 +6,17 @@ API: https://opendata.paris.fr/explore/dataset/logement-encadrement-des-loyers/a
 
 import logging
 from typing import Dict, Any, Optional
-import httpx
 
 logger = logging.getLogger(__name__)
 
+# Room count -> API piece_principale label; 5+ rooms share the last label
+_ROOMS_TO_PIECE: Dict[int, str] = {1: "1 pièce", 2: "2 pièces", 3: "3 pièces", 4: "4 pièces"}
+_PIECE_5_PLUS = "5 pièces et +"
+
+# Typical Paris reference rents per m² (2025 estimates) by room count
+_ROOMS_TO_REF: Dict[int, float] = {1: 30.0, 2: 26.0, 3: 24.0, 4: 22.0}
+_REF_5_PLUS = 20.0
+
 
 async def fetch_rent_cap(
     quartier: str,
@@ -45,63 +52,47 @@ async def fetch_rent_cap(
     meuble = "meublé" if furnished else "non meublé"
 
     # Map rooms to API piece_principale parameter
-    if rooms == 1:
-        piece = "1 pièce"
-    elif rooms == 2:
-        piece = "2 pièces"
-    elif rooms == 3:
-        piece = "3 pièces"
-    elif rooms == 4:
-        piece = "4 pièces"
-    else:
-        piece = "5 pièces et +"
+    piece = _ROOMS_TO_PIECE.get(rooms, _PIECE_5_PLUS)
 
     try:
         # Note: This is a placeholder. Real implementation would query:
         # https://opendata.paris.fr/api/records/1.0/search/?dataset=logement-encadrement-des-loyers
+        # Reason: no HTTP client is built until the real call exists; creating
+        # one (SSL context setup) cost ~40ms per call for no request
+
+        # Placeholder - actual API call would look like (with a shared client):
+        # params = {
+        #     "dataset": "logement-encadrement-des-loyers",
+        #     "q": f"nom_quartier:\"{quartier}\" AND piece_principale:\"{piece}\" AND meuble:\"{meuble}\"",
+        #     "rows": 1
+        # }
+        # response = await client.get(
+        #     "https://opendata.paris.fr/api/records/1.0/search/",
+        #     params=params,
+        #     timeout=30.0
+        # )
+
+        # For now, return placeholder data based on typical Paris rent caps
+        # Real implementation would parse API response
+
+        # Typical Paris rent caps (2025 estimates), looked up by room count
+        reference_rent = _ROOMS_TO_REF.get(rooms, _REF_5_PLUS)
+
+        # Furnished premium (~20%)
+        if furnished:
+            reference_rent *= 1.2
+
+        # Ceiling is reference + 20% (majoré)
+        ceiling_rent = reference_rent * 1.2
 
-        async with httpx.AsyncClient() as client:
-            # Placeholder - actual API call would look like:
-            # params = {
-            #     "dataset": "logement-encadrement-des-loyers",
-            #     "q": f"nom_quartier:\"{quartier}\" AND piece_principale:\"{piece}\" AND meuble:\"{meuble}\"",
-            #     "rows": 1
-            # }
-            # response = await client.get(
-            #     "https://opendata.paris.fr/api/records/1.0/search/",
-            #     params=params,
-            #     timeout=30.0
-            # )
-
-            # For now, return placeholder data based on typical Paris rent caps
-            # Real implementation would parse API response
-
-            # Typical Paris rent caps (2025 estimates)
-            base_reference = {
-                "1 pièce": 30.0,
-                "2 pièces": 26.0,
-                "3 pièces": 24.0,
-                "4 pièces": 22.0,
-                "5 pièces et +": 20.0
-            }
-
-            reference_rent = base_reference.get(piece, 25.0)
-
-            # Furnished premium (~20%)
-            if furnished:
-                reference_rent *= 1.2
-
-            # Ceiling is reference + 20% (majoré)
-            ceiling_rent = reference_rent * 1.2
-
-            return {
-                "reference_rent_eur_m2": round(reference_rent, 2),
-                "ceiling_rent_eur_m2": round(ceiling_rent, 2),
-                "quartier": quartier,
-                "epoque": construction_period,
-                "meuble": furnished,
-                "note": "Placeholder data - real API integration needed"
-            }
+        return {
+            "reference_rent_eur_m2": round(reference_rent, 2),
+            "ceiling_rent_eur_m2": round(ceiling_rent, 2),
+            "quartier": quartier,
+            "epoque": construction_period,
+            "meuble": furnished,
+            "note": "Placeholder data - real API integration needed"
+        }
 
     except Exception as e:
         logger.error(f"Error fetching rent cap: {e}")
@@ -5,6 +5,8 @@ Run with: python -m uvicorn backend.main:app --reload
 Access at: http://localhost:8000
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -17,11 +19,23 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: close pooled HTTP clients on shutdown."""
+    yield
+
+    from backend.integrations.brave import close_brave_client
+    from backend.integrations.dvf import close_dvf_client
+    await close_dvf_client()
+    await close_brave_client()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Real Estate Deal Evaluator",
     description="AI-powered Paris real estate investment analysis",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Configure CORS for frontend
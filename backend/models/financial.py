@@ -2,7 +2,7 @@
 Financial models for real estate analysis.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 from datetime import datetime
 
@@ -65,8 +65,8 @@ class FinancialInputs(BaseModel):
         description="Selling costs as % of sale price"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "down_payment": 100000,
                 "loan_amount": 400000,
@@ -80,6 +80,7 @@ class FinancialInputs(BaseModel):
                 "rental_regime": "location_nue"
             }
         }
+    )
 
 
 class CashFlow(BaseModel):
@@ -96,8 +97,8 @@ class CashFlow(BaseModel):
     property_value: Optional[float] = Field(None, description="Property value at year end")
     loan_balance: Optional[float] = Field(None, description="Remaining loan balance")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "year": 1,
                 "rental_income": 24000,
@@ -110,6 +111,7 @@ class CashFlow(BaseModel):
                 "cumulative_cash_flow": -3200
             }
         }
+    )
 
 
 class Verdict(BaseModel):
@@ -148,8 +150,8 @@ class Verdict(BaseModel):
         description="Verdict timestamp"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "buy_pass": "BUY",
                 "dscr": 1.25,
@@ -169,6 +171,7 @@ class Verdict(BaseModel):
                 "timestamp": "2025-09-30T12:00:00"
             }
         }
+    )
 
 
 class StrategyFit(BaseModel):
@@ -182,8 +185,8 @@ class StrategyFit(BaseModel):
     pros: List[str] = Field(..., description="Advantages of this strategy")
     cons: List[str] = Field(..., description="Disadvantages of this strategy")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "strategy": "Location nue (unfurnished)",
                 "score": 75.0,
@@ -197,4 +200,5 @@ class StrategyFit(BaseModel):
                     "Tenant protections favor long leases"
                 ]
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
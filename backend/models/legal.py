@@ -2,7 +2,7 @@
 Legal and compliance models.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 
@@ -39,8 +39,8 @@ class LegalRentCheck(BaseModel):
     )
     furnished: bool = Field(..., description="Whether property is furnished")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "reference_rent_eur_m2": 28.50,
                 "ceiling_rent_eur_m2": 34.20,
@@ -51,6 +51,7 @@ class LegalRentCheck(BaseModel):
                 "furnished": False
             }
         }
+    )
 
 
 class ZoneTendue(BaseModel):
@@ -66,8 +67,8 @@ class ZoneTendue(BaseModel):
         description="List of applicable restrictions"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "postal_code": "75001",
                 "is_zone_tendue": True,
@@ -78,6 +79,7 @@ class ZoneTendue(BaseModel):
                 ]
             }
         }
+    )
 
 
 class Compliance(BaseModel):
@@ -102,8 +104,8 @@ class Compliance(BaseModel):
         description="Whether property is overall compliant"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "legal_rent": {
                     "reference_rent_eur_m2": 28.50,
@@ -125,4 +127,5 @@ class Compliance(BaseModel):
                 "dpe_issues": [],
                 "overall_compliant": True
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
@@ -2,7 +2,7 @@
 Property and address models.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import date
 
@@ -14,8 +14,8 @@ class Address(BaseModel):
     postal_code: str = Field(..., pattern=r"^\d{5}$", description="5-digit postal code")
     quartier: Optional[str] = Field(None, description="Paris neighborhood/quartier")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "street": "10 Rue de Rivoli",
                 "city": "Paris",
@@ -23,6 +23,7 @@ class Address(BaseModel):
                 "quartier": "Louvre"
             }
         }
+    )
 
 
 class Property(BaseModel):
@@ -50,8 +51,8 @@ class Property(BaseModel):
     parking: Optional[bool] = Field(None, description="Parking included")
     balcony: Optional[bool] = Field(None, description="Has balcony/terrace")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "address": {
                     "street": "10 Rue de Rivoli",
@@ -67,6 +68,7 @@ class Property(BaseModel):
                 "furnished": False
             }
         }
+    )
 
 
 class Listing(BaseModel):
@@ -82,8 +84,8 @@ class Listing(BaseModel):
     description: Optional[str] = Field(None, description="Listing description")
     photos: Optional[list] = Field(default_factory=list, description="Photo URLs")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "property": {
                     "address": {
@@ -99,4 +101,5 @@ class Listing(BaseModel):
                 "listing_date": "2025-01-01",
                 "days_on_market": 30
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
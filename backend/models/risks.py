@@ -2,7 +2,7 @@
 Risk assessment models (environmental and crime).
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict
 
 
@@ -19,8 +19,8 @@ class NaturalRisk(BaseModel):
     )
     description: Optional[str] = Field(None, description="Risk description")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "risk_type": "flood",
                 "status": "Moderate",
@@ -28,6 +28,7 @@ class NaturalRisk(BaseModel):
                 "description": "Property in flood zone with moderate risk"
             }
         }
+    )
 
 
 class TechnologicalRisk(BaseModel):
@@ -44,8 +45,8 @@ class TechnologicalRisk(BaseModel):
     )
     description: Optional[str] = Field(None, description="Risk description")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "risk_type": "ICPE",
                 "status": "Low",
@@ -54,6 +55,7 @@ class TechnologicalRisk(BaseModel):
                 "description": "Industrial site 500m away"
             }
         }
+    )
 
 
 class EnvironmentalRisk(BaseModel):
@@ -78,8 +80,8 @@ class EnvironmentalRisk(BaseModel):
         description="Link to Géorisques report"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "postal_code": "75001",
                 "address": "10 Rue de Rivoli, 75001 Paris",
@@ -97,6 +99,7 @@ class EnvironmentalRisk(BaseModel):
                 "source_url": "https://www.georisques.gouv.fr/..."
             }
         }
+    )
 
 
 class CrimeRisk(BaseModel):
@@ -118,8 +121,8 @@ class CrimeRisk(BaseModel):
     )
     summary: str = Field(..., description="Summary of crime risk")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "postal_code": "75001",
                 "crime_score": 35.0,
@@ -133,6 +136,7 @@ class CrimeRisk(BaseModel):
                 "summary": "Above-average crime rates, primarily property crimes in tourist area"
             }
         }
+    )
 
 
 class RiskSummary(BaseModel):
@@ -144,8 +148,8 @@ class RiskSummary(BaseModel):
         description="Overall risk assessment combining all factors"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "environmental_risk": {
                     "postal_code": "75001",
@@ -163,4 +167,5 @@ class RiskSummary(BaseModel):
                 },
                 "overall_risk_assessment": "Moderate: Low environmental risk but elevated crime in tourist area"
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
@@ -6,7 +6,9 @@ import pytest
 from backend.calculations.cashflow import (
     calculate_cash_flow_projection,
     calculate_total_return_with_sale,
-    CashFlowProjection
+    calculate_french_purchase_costs,
+    CashFlowProjection,
+    PurchaseCostBreakdown
 )
 from backend.calculations.mortgage import amortization_schedule
 
@@ -226,3 +228,62 @@ def test_cash_flow_positive_vs_negative():
 
     assert projections_positive[0].cash_flow > 0
     assert projections_negative[0].cash_flow < 0
+
+
+def test_purchase_costs_breakdown():
+    """Test French purchase cost breakdown for a typical resale property."""
+    costs = calculate_french_purchase_costs(500000, has_mortgage=True)
+
+    assert isinstance(costs, PurchaseCostBreakdown)
+    assert costs.registration_duties == pytest.approx(500000 * 0.058)
+    # Sliding scale: 6500*3.945% + 10500*1.627% + 43000*1.085% + 440000*0.814%
+    expected_notaire = 6500 * 0.03945 + 10500 * 0.01627 + 43000 * 0.01085 + 440000 * 0.00814
+    assert costs.notaire_fees == pytest.approx(expected_notaire)
+    assert costs.mortgage_fees == pytest.approx(500000 * 0.004)
+    assert costs.total == pytest.approx(
+        costs.registration_duties + costs.notaire_fees + costs.disbursements + costs.mortgage_fees
+    )
+
+
+def test_purchase_costs_small_price_and_no_mortgage():
+    """Test first notaire bracket only and no mortgage fees (edge case)."""
+    registration, notaire, disbursements, mortgage_fees, total = calculate_french_purchase_costs(
+        5000, has_mortgage=False
+    )
+
+    assert notaire == pytest.approx(5000 * 0.03945)
+    assert mortgage_fees == 0.0
+    assert total == pytest.approx(registration + notaire + disbursements)
+
+
+def test_cash_flow_projection_loan_payoff():
+    """Test mortgage payments stop once the loan is paid off (edge case)."""
+    schedule = amortization_schedule(
+        principal=100000,
+        annual_rate=0.04,
+        years=5
+    )
+
+    projections = calculate_cash_flow_projection(
+        initial_property_value=200000,
+        monthly_rent=1000,
+        monthly_operating_expenses=100,
+        monthly_mortgage_payment=1841.65,
+        loan_amortization_schedule=schedule,
+        appreciation_rate=0.01,
+        years=8,
+        down_payment=100000
+    )
+
+    # Year 0 + 8 projected years
+    assert len(projections) == 9
+    assert projections[0].cash_flow == -100000
+    assert projections[5].mortgage_payment == pytest.approx(1841.65 * 12)
+    assert projections[5].remaining_loan_balance == pytest.approx(0.0, abs=1e-6)
+    assert projections[6].mortgage_payment == 0.0
+    assert projections[6].remaining_loan_balance == 0.0
+    assert projections[6].cash_flow == pytest.approx(projections[6].noi)
+    assert projections[8].property_value == pytest.approx(200000 * 1.01 ** 8)
+    assert projections[8].cumulative_cash_flow == pytest.approx(
+        sum(p.cash_flow for p in projections)
+    )
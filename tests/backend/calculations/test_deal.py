@@ -0,0 +1,96 @@
+"""
+Unit tests for backend/calculations/deal.py
+"""
+
+import math
+
+import pytest
+from backend.calculations import deal, financial, irr_npv, mortgage, taxes
+
+
+def _composed_metrics(principal, annual_rate, loan_years, equity, hold_years,
+                      rent, expenses, exit_price, discount_rate=0.05):
+    """Reference pipeline built from the individual calculation functions."""
+    schedule = mortgage.amortization_schedule(principal, annual_rate, loan_years)
+    cash_flows = [-equity]
+    dscrs = []
+    for year in range(1, hold_years + 1):
+        months = slice((year - 1) * 12, year * 12)
+        interest = schedule.interest_payment[months].sum()
+        debt_service = schedule.payment[months].sum()
+        noi = (rent - expenses) * 12
+        tax = taxes.regime_reel_tax(rent * 12, expenses * 12, interest)["total_tax"]
+        cash_flows.append(noi - debt_service - tax)
+        if debt_service > 0:
+            dscrs.append(noi / debt_service)
+
+    balance = schedule.remaining_balance[hold_years * 12 - 1] if hold_years * 12 <= len(schedule) else 0.0
+    cash_flows[-1] += irr_npv.net_sale_proceeds(exit_price, 0.08, balance)
+
+    return {
+        "irr": irr_npv.irr_calculation(cash_flows),
+        "npv": irr_npv.npv_calculation(cash_flows, discount_rate),
+        "min_dscr": min(dscrs) if dscrs else math.inf,
+    }
+
+
+class TestDealMetrics:
+    """Tests for deal_metrics()"""
+
+    def test_matches_composed_pipeline(self):
+        """Test fused kernel equals amortization → tax → cash flows → IRR/NPV."""
+        args = (400000, 0.035, 20, 130000, 10, 2500, 600, 600000)
+        result = deal.deal_metrics(*args)
+        expected = _composed_metrics(*args)
+
+        assert result["irr"] == pytest.approx(expected["irr"], abs=1e-9)
+        assert result["npv"] == pytest.approx(expected["npv"])
+        assert result["min_dscr"] == pytest.approx(expected["min_dscr"])
+
+    def test_hold_beyond_loan_term(self):
+        """Test holding past payoff: no debt service or balance after year 5."""
+        args = (100000, 0.04, 5, 100000, 8, 1500, 300, 250000)
+        result = deal.deal_metrics(*args)
+        expected = _composed_metrics(*args)
+
+        assert result["irr"] == pytest.approx(expected["irr"], abs=1e-9)
+        assert result["npv"] == pytest.approx(expected["npv"])
+
+    def test_no_loan(self):
+        """Test all-cash purchase has no DSCR constraint (edge case)."""
+        result = deal.deal_metrics(0, 0.035, 20, 300000, 10, 1500, 300, 350000)
+
+        assert result["min_dscr"] == math.inf
+        assert result["irr"] > 0
+
+
+class TestEvaluateBatch:
+    """Tests for evaluate_batch()"""
+
+    def test_matches_scalar_chain(self):
+        """Test each row equals payment → NOI → DSCR → cap rate from financial.py."""
+        prices = [500000, 450000, 300000]
+        rents = [2000, 1500, 1800]
+        rates = [0.03, 0.0, 0.04]
+        terms = [20, 25, 15]
+        loans = [400000, 360000, 200000]
+        result = deal.evaluate_batch(prices, rents, rates, terms, loans)
+
+        assert result.shape == (3, 4)
+        for row, price, rent, rate, term, loan in zip(result, prices, rents, rates, terms, loans):
+            payment = mortgage.monthly_payment(loan, rate, term)
+            gmi = financial.gross_monthly_income(rent)
+            noi = financial.noi_calculation(gmi, financial.vacancy_credit_loss(gmi, 0.05), 6000)
+            dscr = financial.dscr_calculation(noi, financial.annual_debt_service(payment))
+
+            assert row[0] == pytest.approx(payment)
+            assert row[1] == pytest.approx(noi)
+            assert row[2] == pytest.approx(dscr)
+            assert row[3] == pytest.approx(financial.cap_rate(noi, price))
+
+    def test_no_loan(self):
+        """Test all-cash scenario: zero payment and infinite DSCR (edge case)."""
+        result = deal.evaluate_batch(300000, 2000, 0.03, 20, 0)
+
+        assert result[0, 0] == 0.0
+        assert result[0, 2] == math.inf
@@ -2,6 +2,8 @@
 Unit tests for backend/calculations/irr_npv.py
 """
 
+import math
+
 import pytest
 from backend.calculations import irr_npv
 
@@ -30,6 +32,40 @@ class TestIRRCalculation:
         # Loss scenario
         assert result < 0
 
+    def test_same_sign_cash_flows(self):
+        """Test that NaN is returned when no IRR exists (edge case)."""
+        assert math.isnan(irr_npv.irr_calculation([100000, 5000, 5000]))
+        assert math.isnan(irr_npv.irr_calculation([-100000, -5000, 0]))
+
+    def test_matches_closed_form(self):
+        """Test IRR of a par bond-like cash flow equals its coupon rate."""
+        cash_flows = [-100000] + [7000] * 9 + [107000]
+        result = irr_npv.irr_calculation(cash_flows)
+        assert result == pytest.approx(0.07, abs=1e-7)
+
+
+class TestIRRBatch:
+    """Tests for irr_batch()"""
+
+    def test_matches_scalar(self):
+        """Test each row's IRR equals irr_calculation() on that row."""
+        scenarios = [
+            [-100000] + [7000] * 9 + [107000],
+            [-100000] + [10000] * 10,
+            [-100000] + [5000] * 9 + [60000],
+        ]
+        result = irr_npv.irr_batch(scenarios)
+
+        assert result.shape == (3,)
+        for row, irr in zip(scenarios, result):
+            assert irr == pytest.approx(irr_npv.irr_calculation(row))
+
+    def test_no_irr_rows(self):
+        """Test rows with same-sign cash flows give NaN (edge case)."""
+        result = irr_npv.irr_batch([[100.0, 10.0, 10.0], [-100.0, 60.0, 60.0]])
+        assert math.isnan(result[0])
+        assert result[1] > 0
+
 
 class TestNPVCalculation:
     """Tests for npv_calculation()"""
@@ -55,6 +91,34 @@ class TestNPVCalculation:
         assert result == pytest.approx(expected, rel=0.01)
 
 
+class TestNPVBatch:
+    """Tests for npv_batch()"""
+
+    def test_matches_scalar_npv(self):
+        """Test batch NPV equals the scalar NPV for each rate."""
+        cash_flows = [-100000, 30000, 40000, 50000, 20000]
+        rates = [0.0, 0.05, 0.10]
+        result = irr_npv.npv_batch(rates, cash_flows)
+        assert result.shape == (3,)
+        for rate, npv in zip(rates, result):
+            assert npv == pytest.approx(irr_npv.npv_calculation(cash_flows, rate))
+
+    def test_multiple_scenarios(self):
+        """Test batch NPV over a grid of rates × cash flow scenarios."""
+        scenarios = [[-100, 60, 60], [-100, 0, 121]]
+        result = irr_npv.npv_batch([0.0, 0.10], scenarios)
+        assert result.shape == (2, 2)
+        assert result[0, 0] == pytest.approx(20.0)
+        assert result[1, 1] == pytest.approx(0.0)
+
+    def test_scalar_rate(self):
+        """Test a scalar discount rate is treated as a single rate (edge case)."""
+        cash_flows = [-100000, 30000, 40000, 50000]
+        result = irr_npv.npv_batch(0.05, cash_flows)
+        assert result.shape == (1,)
+        assert result[0] == pytest.approx(irr_npv.npv_calculation(cash_flows, 0.05))
+
+
 class TestNetSaleProceeds:
     """Tests for net_sale_proceeds()"""
 
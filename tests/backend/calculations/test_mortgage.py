@@ -2,6 +2,7 @@
 Unit tests for backend/calculations/mortgage.py
 """
 
+import numpy as np
 import pytest
 from backend.calculations import mortgage
 
@@ -45,6 +46,11 @@ class TestMonthlyPayment:
         # Expected: ~7,184 EUR/month
         assert result == pytest.approx(7184, rel=0.01)
 
+    def test_tiny_interest_continuous_with_zero(self):
+        """Test a near-zero rate stays close to the 0% payment (edge case)."""
+        result = mortgage.monthly_payment(400000, 1e-9, 20)
+        assert result == pytest.approx(400000 / 240, rel=1e-7)
+
 
 class TestAmortizationSchedule:
     """Tests for amortization_schedule()"""
@@ -56,38 +62,45 @@ class TestAmortizationSchedule:
         years = 5
         schedule = mortgage.amortization_schedule(principal, annual_rate, years)
 
-        # Check structure
+        # Check structure: one array entry per month for every column
+        assert isinstance(schedule, mortgage.AmortSchedule)
         assert len(schedule) == 60  # 5 years * 12 months
-        assert all('month' in entry for entry in schedule)
-        assert all('payment' in entry for entry in schedule)
-        assert all('principal' in entry for entry in schedule)
-        assert all('interest' in entry for entry in schedule)
-        assert all('balance' in entry for entry in schedule)
+        assert len(schedule.payment_number) == 60
+        assert len(schedule.payment) == 60
+        assert len(schedule.principal_payment) == 60
+        assert len(schedule.interest_payment) == 60
+        assert len(schedule.remaining_balance) == 60
 
     def test_first_payment_structure(self):
         """Test first payment details."""
         schedule = mortgage.amortization_schedule(100000, 0.03, 5)
-        first_payment = schedule[0]
 
-        assert first_payment['month'] == 1
-        assert first_payment['payment'] == pytest.approx(first_payment['principal'] + first_payment['interest'], rel=0.01)
-        assert first_payment['balance'] < 100000
+        assert schedule.payment_number[0] == 1
+        assert schedule.payment[0] == pytest.approx(schedule.principal_payment[0] + schedule.interest_payment[0], rel=0.01)
+        assert schedule.remaining_balance[0] < 100000
 
     def test_final_payment_balance(self):
         """Test that final balance is approximately zero."""
         schedule = mortgage.amortization_schedule(100000, 0.03, 5)
-        final_payment = schedule[-1]
 
-        assert final_payment['month'] == 60
-        assert final_payment['balance'] == pytest.approx(0, abs=1)  # Within 1 EUR
+        assert schedule.payment_number[-1] == 60
+        assert schedule.remaining_balance[-1] == pytest.approx(0, abs=1)  # Within 1 EUR
+
+    def test_final_balance_unrounded_rate(self):
+        """Test a rate with many decimals still amortizes to exactly zero (edge case)."""
+        rate = 0.0345678912345
+        schedule = mortgage.amortization_schedule(400000, rate, 20)
+
+        assert schedule.remaining_balance[-1] == pytest.approx(0, abs=1e-6)
+        assert mortgage.monthly_payment(400000, rate, 20) == mortgage._payment_kernel(400000, rate, 20)
 
     def test_principal_increases_over_time(self):
         """Test that principal portion increases over time."""
         schedule = mortgage.amortization_schedule(100000, 0.03, 10)
 
-        first_principal = schedule[0]['principal']
-        mid_principal = schedule[60]['principal']  # Middle of loan
-        last_principal = schedule[-1]['principal']
+        first_principal = schedule.principal_payment[0]
+        mid_principal = schedule.principal_payment[60]  # Middle of loan
+        last_principal = schedule.principal_payment[-1]
 
         assert first_principal < mid_principal < last_principal
 
@@ -95,8 +108,45 @@ class TestAmortizationSchedule:
         """Test that interest portion decreases over time."""
         schedule = mortgage.amortization_schedule(100000, 0.03, 10)
 
-        first_interest = schedule[0]['interest']
-        mid_interest = schedule[60]['interest']
-        last_interest = schedule[-1]['interest']
+        first_interest = schedule.interest_payment[0]
+        mid_interest = schedule.interest_payment[60]
+        last_interest = schedule.interest_payment[-1]
+
+        assert first_interest > mid_interest > last_interest
+
+    def test_interest_total_and_payoff(self):
+        """Test column totals: principal repaid in full, payments = principal + interest."""
+        schedule = mortgage.amortization_schedule(100000, 0.03, 5)
+
+        assert schedule.principal_payment.sum() == pytest.approx(100000)
+        assert schedule.payment.sum() == pytest.approx(100000 + schedule.interest_payment.sum())
 
-        assert first_interest > mid_interest > last_interest
\ No newline at end of file
+    def test_no_loan(self):
+        """Test empty schedule when there is no principal (edge case)."""
+        schedule = mortgage.amortization_schedule(0, 0.03, 5)
+        assert len(schedule) == 0
+        assert len(schedule.remaining_balance) == 0
+
+
+class TestRemainingBalance:
+    """Tests for remaining_balance() and remaining_balance_vec()"""
+
+    def test_matches_schedule(self):
+        """Test closed form equals the amortization schedule balance."""
+        schedule = mortgage.amortization_schedule(400000, 0.035, 20)
+        result = mortgage.remaining_balance(400000, 0.035, 20, 120)
+        assert result == pytest.approx(schedule.remaining_balance[119], abs=1e-6)
+
+    def test_vectorized(self):
+        """Test vectorized balances for several sale months."""
+        months = np.array([0, 12, 60, 240, 300])
+        result = mortgage.remaining_balance_vec(400000, 0.035, 20, months)
+        expected = [mortgage.remaining_balance(400000, 0.035, 20, int(k)) for k in months]
+        assert result == pytest.approx(expected)
+        assert result[0] == 400000
+        assert result[-1] == 0.0
+
+    def test_zero_interest(self):
+        """Test linear paydown at 0% interest (edge case)."""
+        result = mortgage.remaining_balance(120000, 0.0, 10, 60)
+        assert result == pytest.approx(60000)
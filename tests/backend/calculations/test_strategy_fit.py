@@ -0,0 +1,109 @@
+"""
+Unit tests for backend/calculations/strategy_fit.py
+"""
+
+import numpy as np
+import pytest
+from backend.calculations import strategy_fit
+
+
+class TestNormalizeScore:
+    """Tests for normalize_score()"""
+
+    def test_expected_use(self):
+        """Test linear mapping inside the range."""
+        assert strategy_fit.normalize_score(1.15, 0.8, 1.5) == pytest.approx(50.0)
+
+    def test_clamped(self):
+        """Test values outside the range are clamped to 0-100."""
+        assert strategy_fit.normalize_score(0.5, 0.8, 1.5) == 0.0
+        assert strategy_fit.normalize_score(2.0, 0.8, 1.5) == 100.0
+
+    def test_nan_maps_to_top(self):
+        """Test NaN falls through the upper clamp to 100 (edge case)."""
+        assert strategy_fit.normalize_score(float("nan"), 0.8, 1.5) == 100.0
+        scores = strategy_fit._score_kernel(
+            np.array([np.nan]), np.array([[0.8]]), np.array([[1.5]]), np.array([[1.0]])
+        )
+        assert scores.tolist() == [100.0]
+
+
+class TestNormalizeScoreArray:
+    """Tests for normalize_score_array()"""
+
+    def test_matches_scalar(self):
+        """Test vector form equals normalize_score element-wise."""
+        values = np.array([0.5, 0.8, 1.15, 1.5, 2.0, np.nan])
+        result = strategy_fit.normalize_score_array(values, 0.8, 1.5)
+
+        assert result.tolist() == [strategy_fit.normalize_score(v, 0.8, 1.5) for v in values]
+
+    def test_empty_range(self):
+        """Test empty ranges map to 50 without nan/inf (edge case)."""
+        result = strategy_fit.normalize_score_array([1.0, 2.0], np.array([0.0, 2.0]), np.array([2.0, 2.0]))
+
+        assert result.tolist() == [50.0, 50.0]
+
+
+class TestStrategyFits:
+    """Tests for the individual fit functions and calculate_all_strategy_fits()"""
+
+    def test_location_nue_pros_cons(self):
+        """Test dynamic pros/cons fire from DSCR and IRR thresholds."""
+        fit = strategy_fit.calculate_location_nue_fit(
+            dscr=1.3, irr=0.09, legal_rent_compliant=False, bedrooms=2
+        )
+
+        assert fit.pros[:2] == ["Strong cash flow (DSCR: 1.30)", "Excellent IRR: 9.0%"]
+        assert fit.cons[0] == "Rent exceeds legal ceiling (encadrement)"
+        assert fit.reasons == ["Legal risk with current rent", "Positive monthly cash flow"]
+
+    def test_colocation_needs_bedrooms(self):
+        """Test colocation penalty with a single bedroom (edge case)."""
+        fit = strategy_fit.calculate_colocation_fit(
+            dscr=0.9, irr=0.05, bedrooms=1, legal_rent_compliant=True
+        )
+
+        assert fit.cons[:2] == ["Insufficient bedrooms for colocation", "Negative cash flow (DSCR: 0.90)"]
+        assert fit.score < 10
+
+    def test_all_fits_sorted(self):
+        """Test all five strategies are returned best-first."""
+        fits = strategy_fit.calculate_all_strategy_fits(
+            tmc=1800, market_rent=2000, dscr=1.25, irr=0.07,
+            price_discount_pct=-0.08, legal_rent_compliant=True,
+            bedrooms=3, dpe_grade="F"
+        )
+
+        assert len(fits) == 5
+        scores = [fit.score for fit in fits]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_kernel_scores_match_individual_fits(self):
+        """Test the batched score kernel matches each fit function's own score."""
+        inputs = dict(dscr=1.1, irr=0.06, legal_rent_compliant=True)
+        fits = strategy_fit.calculate_all_strategy_fits(
+            tmc=2100, market_rent=2000, price_discount_pct=0.02,
+            bedrooms=2, dpe_grade="C", **inputs
+        )
+        by_name = {fit.strategy: fit.score for fit in fits}
+
+        lmnp = strategy_fit.calculate_lmnp_fit(bedrooms=2, **inputs)
+        value_add = strategy_fit.calculate_value_add_fit(1.1, 0.06, 0.02, "C")
+        assert by_name[lmnp.strategy] == lmnp.score
+        assert by_name[value_add.strategy] == value_add.score
+
+    def test_pros_cons_formatted_lazily(self):
+        """Test pros/cons stay as templates until first accessed, then are cached."""
+        fit = strategy_fit.calculate_colocation_fit(
+            dscr=1.6, irr=0.2, bedrooms=4, legal_rent_compliant=True
+        )
+
+        assert "pros" not in vars(fit)
+        assert fit.pro_items[0] == ("{} bedrooms ideal for colocation", (4,))
+        assert fit.pros[:3] == [
+            "4 bedrooms ideal for colocation",
+            "Excellent cash flow (DSCR: 1.60)",
+            "Exceptional IRR: 20.0%",
+        ]
+        assert fit.pros is fit.pros
@@ -2,6 +2,7 @@
 Unit tests for backend/calculations/taxes.py
 """
 
+import numpy as np
 import pytest
 from backend.calculations import taxes
 
@@ -110,4 +111,43 @@ class TestRegimeReelTax:
         """Test with no deductible expenses."""
         result = taxes.regime_reel_tax(24000, 0, 0, 0.30, 0.172)
         # Full rent is taxable
-        assert result['net_rental_income'] == 24000
\ No newline at end of file
+        assert result['net_rental_income'] == 24000
+
+class TestTaxBatch:
+    """Tests for tax_batch() and regime_reel_tax_batch()"""
+
+    def test_matches_scalar_micro(self):
+        """Test batch micro regime rows equal the scalar dict results."""
+        marginals = np.array([0.11, 0.30, 0.41])
+        result = taxes.tax_batch(24000, 0.50, marginals, 0.172)
+
+        assert result.shape == (3, 4)
+        for row, marginal in zip(result, marginals):
+            expected = taxes.lmnp_micro_bic_tax(24000, 0.50, marginal, 0.172)
+            assert row.tolist() == pytest.approx([
+                expected["taxable_income"], expected["income_tax"],
+                expected["social_charges"], expected["total_tax"]
+            ])
+
+    def test_regime_reel_deficit(self):
+        """Test batch régime réel clamps tax at zero and reports the deficit."""
+        result = taxes.regime_reel_tax_batch([15000, 24000], [12000, 8000], [8000, 4000], 0.30, 0.172)
+
+        assert result[0].tolist() == pytest.approx([-5000, 0, 0, 0, -5000])
+        assert result[1].tolist() == pytest.approx([12000, 3600, 2064, 5664, 0])
+
+
+class TestAfterTaxMargin:
+    """Tests for after_tax_margin() and after_tax_margin_vec()"""
+
+    def test_expected_use(self):
+        """Test monthly margin after spreading annual taxes over 12 months."""
+        result = taxes.after_tax_margin(500, 3600, 2064)
+        # 500 - (3600 + 2064) / 12 = 28
+        assert result == pytest.approx(28)
+
+    def test_vectorized(self):
+        """Test vectorized margin over a monthly timeline."""
+        cash_flows = np.array([500.0, 600.0, -100.0])
+        result = taxes.after_tax_margin_vec(cash_flows, 1200, 0)
+        assert result == pytest.approx([400.0, 500.0, -200.0])
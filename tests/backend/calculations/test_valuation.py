@@ -2,6 +2,7 @@
 Unit tests for backend/calculations/valuation.py
 """
 
+import numpy as np
 import pytest
 from backend.calculations import valuation
 
@@ -69,6 +70,21 @@ class TestPriceVerdict:
         assert result == "Average"
 
 
+class TestPriceVerdictArray:
+    """Tests for price_verdict_array()"""
+
+    def test_matches_scalar(self):
+        """Test array verdicts equal the scalar verdicts, including thresholds."""
+        prices = np.array([9000, 9500, 10000, 10500, 11000])
+        result = valuation.price_verdict_array(prices, 10000)
+        assert result.tolist() == [valuation.price_verdict(p, 10000) for p in prices]
+
+    def test_unknown_nowcast(self):
+        """Test zero now-cast gives "Unknown" (edge case)."""
+        result = valuation.price_verdict_array([9000, 9000], [0, 10000])
+        assert result.tolist() == ["Unknown", "Under-priced"]
+
+
 class TestListingDelta:
     """Tests for listing_delta()"""
 
@@ -97,6 +113,53 @@ class TestListingDelta:
         assert result == 0.0
 
 
+class TestListingDeltaCalculation:
+    """Tests for listing_delta_calculation()"""
+
+    def test_defaults(self):
+        """Test default inputs apply only the DPE D penalty."""
+        assert valuation.listing_delta_calculation() == pytest.approx(-0.02)
+
+    def test_stale_listing_penalties(self):
+        """Test DOM penalty is -5% above 1.5× median and -10% above 2×."""
+        stale = valuation.listing_delta_calculation(days_on_market=50, median_dom=30, dpe_grade="C")
+        very_stale = valuation.listing_delta_calculation(days_on_market=61, median_dom=30, dpe_grade="C")
+        assert stale == pytest.approx(-0.05)
+        assert very_stale == pytest.approx(-0.10)
+
+    def test_dpe_grades(self):
+        """Test DPE adjustments, including lowercase and unknown grades."""
+        assert valuation.listing_delta_calculation(dpe_grade="a") == pytest.approx(0.05)
+        assert valuation.listing_delta_calculation(dpe_grade="G") == pytest.approx(-0.15)
+        assert valuation.listing_delta_calculation(dpe_grade="Z") == 0.0
+        assert valuation.listing_delta_calculation(dpe_grade="") == 0.0
+
+
+class TestListingDeltaBatch:
+    """Tests for listing_delta_batch()"""
+
+    def test_matches_scalar(self):
+        """Test batch deltas equal the scalar calculation per listing."""
+        price_cuts = np.array([0.0, -0.10, 0.0, 0.02])
+        days = np.array([10, 100, 50, 61])
+        grades = ["D", "g", "", "AB"]
+
+        result = valuation.listing_delta_batch(price_cuts, days, 30, grades, -0.01)
+        expected = [
+            valuation.listing_delta_calculation(cut, int(dom), 30, grade, -0.01)
+            for cut, dom, grade in zip(price_cuts, days, grades)
+        ]
+        assert result == pytest.approx(expected)
+
+    def test_grade_string_and_nowcast(self):
+        """Test one-letter-per-listing grade string feeding nowcast_value."""
+        deltas = valuation.listing_delta_batch(np.zeros(2), np.zeros(2), 30, "CZ")
+        assert deltas == pytest.approx([0.0, 0.0])
+
+        values = valuation.nowcast_value(np.array([10000.0, 8000.0]), 0.05, deltas)
+        assert values == pytest.approx([10500.0, 8400.0])
+
+
 class TestYieldOnCost:
     """Tests for yield_on_cost()"""
 
@@ -0,0 +1,3 @@
+"""
+Tests for the CLI.
+"""
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""
+Unit tests for backend/cli/main.py
+"""
+
+import pytest
+from typer.testing import CliRunner
+
+from backend.cli.main import app, evaluate_core
+
+runner = CliRunner()
+
+
+def _write_csv(tmp_path, text):
+    """Write scenario CSV text to a temp file and return its path."""
+    path = tmp_path / "scenarios.csv"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestEvaluateCore:
+    """Tests for evaluate_core."""
+
+    def test_expected_metrics(self):
+        """Test the documented example scenario."""
+        metrics = evaluate_core(500000, 50, 400000, 0.03, 20, 2000)
+
+        assert metrics["price_per_m2"] == 10000
+        assert metrics["dscr"] == pytest.approx(0.631, abs=1e-3)
+        assert metrics["cap_rate"] == pytest.approx(metrics["noi"] / 500000)
+
+    def test_no_rent_negative_noi(self):
+        """Test zero rent leaves only operating expenses in NOI."""
+        metrics = evaluate_core(300000, 40, 200000, 0.03, 20, 0)
+
+        assert metrics["noi"] == pytest.approx(-6000.0)
+        assert metrics["dscr"] < 0
+
+
+class TestEvaluateBatch:
+    """Tests for the evaluate-batch command."""
+
+    def test_happy_path(self, tmp_path):
+        """Test every CSV row is rendered with its verdict."""
+        path = _write_csv(
+            tmp_path,
+            "address,price,surface,loan_amount,monthly_rent\n"
+            "Flat A,500000,50,400000,2000\n"
+            "Flat B,200000,40,100000,2500\n"
+        )
+
+        result = runner.invoke(app, ["evaluate-batch", "--csv", str(path)])
+
+        assert result.exit_code == 0
+        assert "2 scenarios" in result.output
+        assert "Flat A" in result.output
+        assert "Flat B" in result.output
+        assert "PASS" in result.output
+        assert "BUY" in result.output
+
+    def test_missing_column(self, tmp_path):
+        """Test a missing required column is reported as a bad parameter."""
+        path = _write_csv(tmp_path, "price,surface\n500000,50\n")
+
+        result = runner.invoke(app, ["evaluate-batch", "--csv", str(path)])
+
+        assert result.exit_code == 2
+        assert "loan_amount" in result.output
+
+    def test_zero_surface(self, tmp_path):
+        """Test a zero surface is rejected instead of dividing by zero."""
+        path = _write_csv(
+            tmp_path,
+            "price,surface,loan_amount\n500000,50,400000\n300000,0,200000\n"
+        )
+
+        result = runner.invoke(app, ["evaluate-batch", "--csv", str(path)])
+
+        assert result.exit_code == 2
+        assert not isinstance(result.exception, ZeroDivisionError)
+        assert "Surface must be positive" in result.output
@@ -5,6 +5,8 @@ Unit tests for appreciation rate data.
 import pytest
 from backend.data.appreciation_rates import (
     get_appreciation_rate,
+    get_appreciation_rate_by_key,
+    get_appreciation_rates_batch,
     get_appreciation_rate_display,
     get_appreciation_source,
     DEPARTMENT_APPRECIATION_RATES
@@ -53,6 +55,21 @@ def test_get_appreciation_rate_unknown():
     assert 0.019 < rate < 0.021
 
 
+def test_get_appreciation_rate_by_key():
+    """Test key-based lookup matches the postal code API."""
+    assert get_appreciation_rate_by_key("75") == get_appreciation_rate("75001")
+    assert get_appreciation_rate_by_key("75", forward_looking=False) == get_appreciation_rate("75001", forward_looking=False)
+    assert get_appreciation_rate_by_key(None) == 0.02  # default 0.5% + 1.5% forward
+
+
+def test_get_appreciation_rates_batch():
+    """Test batch lookup matches the scalar API, including defaults."""
+    codes = ["75001", "06000", "35000", "20000", "97400", "2A004", "7500", "99999"]
+    for forward_looking in (True, False):
+        rates = get_appreciation_rates_batch(codes, forward_looking=forward_looking)
+        assert rates.tolist() == [get_appreciation_rate(c, forward_looking=forward_looking) for c in codes]
+
+
 def test_get_appreciation_rate_display():
     """Test formatted appreciation rate display."""
     display = get_appreciation_rate_display("06000", forward_looking=True)
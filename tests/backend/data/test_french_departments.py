@@ -0,0 +1,65 @@
+"""
+Unit tests for French department data.
+"""
+
+from backend.data.french_departments import (
+    get_city_by_key,
+    get_city_from_department,
+    get_department_name,
+    get_department_name_by_key,
+    normalize_dept_key,
+    resolve_city
+)
+
+
+def test_normalize_dept_key_standard():
+    """Test standard postal codes map to their 2-digit department."""
+    assert normalize_dept_key("75001") == "75"
+    assert normalize_dept_key("06000") == "06"
+
+
+def test_normalize_dept_key_special_cases():
+    """Test overseas and Corsica postal codes keep 3 characters."""
+    assert normalize_dept_key("97400") == "974"
+    assert normalize_dept_key("20000") == "200"
+    assert normalize_dept_key("20") == "200"
+
+
+def test_normalize_dept_key_invalid():
+    """Test empty or too-short postal codes give no key."""
+    assert normalize_dept_key("") is None
+    assert normalize_dept_key("7") is None
+    assert normalize_dept_key(None) is None
+
+
+def test_get_city_from_department():
+    """Test main city lookup, including overseas and both Corsican departments."""
+    assert get_city_from_department("69001") == "Lyon"
+    assert get_city_from_department("97400") == "Saint-Denis"
+    assert get_city_from_department("20000") == "Ajaccio"
+    assert get_city_from_department("20600") == "Bastia"
+    assert get_city_from_department("99999") is None
+
+
+def test_get_department_name():
+    """Test department name lookup."""
+    assert get_department_name("13001") == "Bouches-du-Rhône"
+    assert get_department_name("20600") == "Haute-Corse"
+    assert get_department_name("") is None
+
+
+def test_lookups_by_key():
+    """Test key-based lookups match the postal code APIs."""
+    key = normalize_dept_key("97200")
+    assert get_city_by_key(key) == get_city_from_department("97200") == "Fort-de-France"
+    assert get_department_name_by_key(key) == "Martinique"
+    assert get_city_by_key(None) is None
+
+
+def test_resolve_city():
+    """Test specific postal code mappings win over the department main city."""
+    assert resolve_city("74100") == "Annemasse"
+    assert get_city_from_department("74100") == "Annecy"
+    assert resolve_city("69003") == "Lyon"
+    assert resolve_city("69003") == "Lyon"  # cached on second lookup
+    assert resolve_city("99999") is None
@@ -4,7 +4,10 @@ Unit tests for postal code database.
 
 import pytest
 from backend.data.postal_codes import (
+    POSTAL_CODE_TO_CITY,
     get_city_from_postal_code,
+    get_cities_from_postal_codes,
+    get_postal_codes_by_prefix,
     get_department_from_postal_code,
     get_city_and_department
 )
@@ -61,6 +64,13 @@ def test_get_department_fallback():
     assert get_department_from_postal_code("01234") == "01"
 
 
+def test_department_is_postal_prefix():
+    """Test every listed department equals its postal code prefix."""
+    for postal_code, (_, dept) in POSTAL_CODE_TO_CITY.items():
+        assert dept == postal_code[:2]
+        assert get_department_from_postal_code(postal_code) == dept
+
+
 def test_get_city_and_department():
     """Test getting both city and department."""
     city, dept = get_city_and_department("75001")
@@ -77,3 +87,21 @@ def test_get_city_and_department_unknown():
     city, dept = get_city_and_department("99999")
     assert city is None
     assert dept == "99"  # Fallback to extracted department
+
+
+def test_get_cities_batch_matches_scalar():
+    """Test batch city lookup agrees with the per-code lookup."""
+    codes = ["75001", "92100", "13001", "2A004", "99999", "7500", "", "ab123", "750011"]
+    expected = [get_city_from_postal_code(code) for code in codes]
+    assert get_cities_from_postal_codes(codes).tolist() == expected
+    assert get_cities_from_postal_codes([]).tolist() == []
+
+
+def test_get_postal_codes_by_prefix():
+    """Test prefix queries return the matching listed codes in order."""
+    paris = get_postal_codes_by_prefix("750")
+    assert paris == sorted(code for code in POSTAL_CODE_TO_CITY if code.startswith("750"))
+    assert paris[0] == "75001"
+    assert "75020" in paris
+    assert get_postal_codes_by_prefix("99") == []
+    assert len(get_postal_codes_by_prefix("")) == len(POSTAL_CODE_TO_CITY)
@@ -0,0 +1,30 @@
+"""
+Unit tests for rent control data.
+"""
+
+import numpy as np
+
+from backend.data.rent_control import (
+    RENT_CONTROL_ALL,
+    get_rent_control_band,
+    get_rent_control_bands_batch
+)
+
+
+def test_rent_control_bands_batch_matches_scalar():
+    """Test batch rows equal get_rent_control_band() for every controlled code."""
+    codes = list(RENT_CONTROL_ALL)
+    bands = get_rent_control_bands_batch(codes)
+
+    assert bands.shape == (len(codes), 3)
+    for row, code in zip(bands, codes):
+        assert tuple(row) == get_rent_control_band(code)
+
+
+def test_rent_control_bands_batch_uncontrolled():
+    """Test codes outside controlled zones give NaN rows."""
+    bands = get_rent_control_bands_batch(["75001", "23000", "", "7500"])
+
+    assert not np.isnan(bands[0]).any()
+    assert np.isnan(bands[1:]).all()
+    assert get_rent_control_bands_batch([]).shape == (0, 3)
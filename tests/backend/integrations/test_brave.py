@@ -34,8 +34,8 @@ class TestSearchWeb:
             }
         }
 
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+        with patch.object(brave, "_get_brave_client") as mock_client:
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             results = await brave.search_web(
                 api_key="test_key",
@@ -54,8 +54,8 @@ class TestSearchWeb:
         mock_response = AsyncMock()
         mock_response.status_code = 429
 
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+        with patch.object(brave, "_get_brave_client") as mock_client:
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             with pytest.raises(Exception, match="Rate limit exceeded"):
                 await brave.search_web(
@@ -70,8 +70,8 @@ class TestSearchWeb:
         mock_response.status_code = 200
         mock_response.json.return_value = {"web": {"results": []}}
 
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+        with patch.object(brave, "_get_brave_client") as mock_client:
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             results = await brave.search_web(
                 api_key="test_key",
@@ -87,11 +87,24 @@ class TestSearchWeb:
         mock_response.status_code = 500
         mock_response.raise_for_status.side_effect = Exception("Server error")
 
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+        with patch.object(brave, "_get_brave_client") as mock_client:
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             with pytest.raises(Exception):
                 await brave.search_web(
                     api_key="test_key",
                     query="test query"
-                )
\ No newline at end of file
+                )
+
+class TestBraveClient:
+    """Tests for the shared Brave Search HTTP client"""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_until_closed(self):
+        """Test searches share one client and closing resets it."""
+        client = brave._get_brave_client()
+        assert brave._get_brave_client() is client
+
+        await brave.close_brave_client()
+        assert client.is_closed
+        assert brave._BRAVE_CLIENT is None
@@ -0,0 +1,354 @@
+"""
+Unit tests for backend/integrations/dvf.py
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+from backend.integrations import dvf
+
+
+def _record(surface=50, valeur=250000, date="2018-06-01", nature="Vente", lat=48.86, lon=2.35):
+    return {
+        "nature_mutation": nature,
+        "date_mutation": date,
+        "surface_reelle_bati": surface,
+        "valeur_fonciere": valeur,
+        "lat": lat,
+        "lon": lon,
+    }
+
+
+def _filter(records, surface=50, **kwargs):
+    return dvf._filter_comps(
+        records, surface, None, datetime(2019, 6, 1),
+        min_date_24m="2017-01-01", min_date_36m="2016-01-01", **kwargs
+    )
+
+
+class TestHaversineBatch:
+    """Tests for haversine_batch()"""
+
+    def test_matches_scalar(self):
+        """Test vectorized distances agree with haversine_distance()."""
+        lats = np.array([48.86, 48.87, 45.76, np.nan])
+        lons = np.array([2.35, 2.36, 4.83, 2.35])
+        distances = dvf.haversine_batch(48.86, 2.35, lats, lons)
+
+        for i in range(3):
+            assert distances[i] == pytest.approx(dvf.haversine_distance(48.86, 2.35, lats[i], lons[i]), rel=1e-12)
+        assert np.isnan(distances[3])
+
+
+class TestTimeDecayWeights:
+    """Tests for time_decay_weights()"""
+
+    def test_matches_scalar(self):
+        """Test batch weights agree with time_decay_weight() for any input."""
+        reference = datetime(2019, 6, 1, 15, 30)
+        dates = ["2019-05-31", "2017-01-15", "2005-03-01", "2019-06-10", "", "bad", None, "2018-6-1"]
+
+        # Second list has an impossible date, which sends the batch to the scalar path
+        for batch in (dates, dates + ["2018-02-30"]):
+            weights = dvf.time_decay_weights(batch, reference)
+            for weight, sale_date in zip(weights, batch):
+                assert weight == pytest.approx(dvf.time_decay_weight(sale_date, reference), rel=1e-12)
+
+    def test_empty(self):
+        """Test no dates gives an empty array."""
+        assert dvf.time_decay_weights([], datetime(2019, 6, 1)).shape == (0,)
+
+
+class TestCalculateWeightedMedianAndBands:
+    """Tests for calculate_weighted_median_and_bands()"""
+
+    def test_equal_weights(self):
+        """Test bands over equally weighted comps."""
+        comps = [{"price_per_m2": price, "date_mutation": "2019-06-01"} for price in (4000, 1000, 3000, 2000)]
+        stats = dvf.calculate_weighted_median_and_bands(comps, datetime(2019, 6, 1))
+
+        assert stats["median"] == 2500
+        assert stats["p10"] == 1000
+        assert stats["p25"] == 2000
+        assert stats["p75"] == 4000
+        assert stats["p90"] == 4000
+        assert stats["mean"] == pytest.approx(2500)
+        assert stats["count"] == 4
+
+    def test_room_weights(self):
+        """Test a dissimilar room count lowers a comp's weight."""
+        comps = [
+            {"price_per_m2": 1000, "date_mutation": "2019-06-01", "nombre_pieces_principales": 3},
+            {"price_per_m2": 2000, "date_mutation": "2019-06-01", "nombre_pieces_principales": 5},
+            {"price_per_m2": 0},
+        ]
+        stats = dvf.calculate_weighted_median_and_bands(comps, datetime(2019, 6, 1), subject_rooms=3)
+
+        # Weights 1.0 and 0.7 -> 10 and 7 samples
+        assert stats["median"] == 1000
+        assert stats["p90"] == 2000
+        assert stats["mean"] == pytest.approx((10 * 1000 + 7 * 2000) / 17)
+        assert stats["count"] == 3
+
+    def test_no_valid_prices(self):
+        """Test empty or non-positive prices give no stats."""
+        assert dvf.calculate_weighted_median_and_bands([], datetime(2019, 6, 1)) == {}
+        assert dvf.calculate_weighted_median_and_bands([{"price_per_m2": 0}], datetime(2019, 6, 1)) == {}
+
+
+class TestCalculateMedianPricePerM2:
+    """Tests for calculate_median_price_per_m2()"""
+
+    def test_small_and_large_lists(self):
+        """Test one, two and many prices give the statistics.median result."""
+        assert dvf.calculate_median_price_per_m2([{"price_per_m2": 5000}]) == 5000
+        assert dvf.calculate_median_price_per_m2([{"price_per_m2": 5000}, {"price_per_m2": 6000}]) == 5500
+        assert dvf.calculate_median_price_per_m2([{"price_per_m2": p} for p in (7000, 4000, 0, 6000, 5000)]) == 5500
+
+    def test_no_valid_prices(self):
+        """Test empty or non-positive prices give 0."""
+        assert dvf.calculate_median_price_per_m2([]) == 0.0
+        assert dvf.calculate_median_price_per_m2([{"price_per_m2": 0}, {}]) == 0.0
+
+
+class TestClampBounds:
+    """Tests for _clamp_bounds()"""
+
+    def test_matches_quantile(self):
+        """Test bounds equal np.quantile for small, large and tied inputs."""
+        rng = np.random.default_rng(0)
+        for prices in (
+            np.array([5000.0]),
+            np.array([4000.0, 6000.0]),
+            rng.random(7) * 10000,
+            rng.random(250) * 10000,
+            np.round(rng.random(100) * 5) * 1000,
+        ):
+            assert np.array_equal(dvf._clamp_bounds(prices), np.quantile(prices, [0.05, 0.95]))
+
+
+class TestFilterComps:
+    """Tests for _filter_comps()"""
+
+    def test_keeps_only_sales_in_band(self):
+        """Test non-sales, out-of-band surfaces and bad values are dropped."""
+        records = [_record() for _ in range(12)] + [
+            _record(nature="Echange"),
+            _record(surface=80),
+            _record(valeur=0),
+            _record(surface=None),
+            _record(date=""),
+        ]
+        comps = _filter(records)
+
+        assert len(comps) == 12
+        assert all(c["price_per_m2"] == 5000 for c in comps)
+
+    def test_widens_band_when_few_comps(self):
+        """Test the ±17.5% band and 36-month window apply below 12 comps."""
+        records = [_record(), _record(surface=58, valeur=290000), _record(date="2016-06-01")]
+        comps = _filter(records)
+
+        assert [c["surface_reelle_bati"] for c in comps] == [50, 58, 50]
+
+    def test_radius_filter(self):
+        """Test records outside the radius or without coordinates are dropped."""
+        records = [_record(), _record(lat=48.90), _record(lat=None)]
+        comps = _filter(records, lat=48.86, lon=2.35, radius_km=0.4)
+
+        assert len(comps) == 1
+        assert comps[0]["lat"] == 48.86
+
+    def test_outlier_clamp(self):
+        """Test prices outside P5-P95 are removed."""
+        records = [_record(valeur=250000 + 1000 * i) for i in range(40)]
+        comps = _filter(records)
+
+        prices = [c["price_per_m2"] for c in comps]
+        assert min(prices) > 5000
+        assert max(prices) < 5000 + 20 * 39
+
+    def test_small_set_not_clamped(self):
+        """Test sets below the clamp minimum keep every distinct price."""
+        for values in ((150000, 200000), (150000, 200000, 250000), (100000, 240000, 250000, 260000, 900000)):
+            comps = _filter([_record(valeur=v) for v in values])
+
+            assert [c["valeur_fonciere"] for c in comps] == list(values)
+
+    def test_outlier_clamp_from_minimum_size(self):
+        """Test the clamp applies once a set reaches the minimum size."""
+        values = [250000 + 1000 * i for i in range(dvf._CLAMP_MIN_COMPS)]
+        comps = _filter([_record(valeur=v) for v in values])
+
+        kept = [c["valeur_fonciere"] for c in comps]
+        assert kept == values[1:-1]
+
+    def test_empty(self):
+        """Test no records gives no comps."""
+        assert _filter([]) == []
+
+
+class TestFetchDvfCompsProgressive:
+    """Tests for fetch_dvf_comps_progressive()"""
+
+    @pytest.mark.asyncio
+    async def test_smallest_radius_with_enough_comps(self):
+        """Test the search stops at the first radius reaching min_comps."""
+        records = [_record() for _ in range(12)] + [_record(lat=48.866) for _ in range(12)]
+
+        with patch.object(dvf, "_fetch_raw_dvf_data", AsyncMock(return_value=records)):
+            comps, scope = await dvf.fetch_dvf_comps_progressive("75001", 50, lat=48.86, lon=2.35)
+
+        assert scope == "0.4km radius"
+        assert len(comps) == 12
+
+        with patch.object(dvf, "_fetch_raw_dvf_data", AsyncMock(return_value=records)):
+            comps, scope = await dvf.fetch_dvf_comps_progressive("75001", 50, lat=48.86, lon=2.35, min_comps=24)
+
+        assert scope == "0.8km radius"
+        assert len(comps) == 24
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_commune(self):
+        """Test too few comps in every radius falls back to the commune."""
+        records = [_record(lat=48.90) for _ in range(5)] + [_record(lat=None)]
+
+        with patch.object(dvf, "_fetch_raw_dvf_data", AsyncMock(return_value=records)):
+            comps, scope = await dvf.fetch_dvf_comps_progressive("75001", 50, lat=48.86, lon=2.35)
+
+        assert scope == "Commune 75001"
+        assert len(comps) == 6
+
+
+    @pytest.mark.asyncio
+    async def test_sparse_commune_keeps_distinct_prices(self):
+        """Test two sales at different prices both come back as comps."""
+        records = [_record(valeur=150000), _record(valeur=200000)]
+
+        with patch.object(dvf, "_fetch_raw_dvf_data", AsyncMock(return_value=records)):
+            comps, scope = await dvf.fetch_dvf_comps_progressive("75001", 50)
+
+        assert scope == "Commune 75001"
+        assert [c["price_per_m2"] for c in comps] == [3000, 4000]
+
+
+class TestFetchDvfComps:
+    """Tests for fetch_dvf_comps()"""
+
+    @pytest.mark.asyncio
+    async def test_without_surface_keeps_all_sales(self):
+        """Test every recent sale is kept when no surface is given."""
+        records = [_record(surface=s, valeur=5000 * s) for s in (20, 50, 120)] + [_record(nature="Echange"), _record(date="2015-01-01")]
+
+        with patch.object(dvf, "_fetch_raw_dvf_data", AsyncMock(return_value=records)):
+            comps = await dvf.fetch_dvf_comps(address="1 rue de Rivoli", postal_code="75001")
+
+        assert sorted(c["surface_reelle_bati"] for c in comps) == [20, 50, 120]
+
+    @pytest.mark.asyncio
+    async def test_with_surface_uses_progressive_search(self):
+        """Test a surface applies the progressive search's surface band."""
+        records = [_record(surface=s, valeur=5000 * s) for s in (20, 50, 120)]
+
+        with patch.object(dvf, "_fetch_raw_dvf_data", AsyncMock(return_value=records)):
+            comps = await dvf.fetch_dvf_comps(address="1 rue de Rivoli", postal_code="75001", surface=50)
+
+        assert [c["surface_reelle_bati"] for c in comps] == [50]
+
+    @pytest.mark.asyncio
+    async def test_custom_radius_warns(self, caplog):
+        """Test a non-default radius is reported as ignored (edge case)."""
+        records = [_record(surface=50, valeur=250000)]
+
+        with patch.object(dvf, "_fetch_raw_dvf_data", AsyncMock(return_value=records)):
+            await dvf.fetch_dvf_comps(address="1 rue de Rivoli", postal_code="75001")
+            assert "radius_km" not in caplog.text
+            comps = await dvf.fetch_dvf_comps(address="1 rue de Rivoli", postal_code="75001", radius_km=2.0)
+
+        assert len(comps) == 1
+        assert "radius_km=2.0 ignored" in caplog.text
+
+
+class TestDvfClient:
+    """Tests for the shared DVF HTTP client"""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_until_closed(self):
+        """Test fetches share one client and closing resets it."""
+        client = dvf._get_dvf_client()
+        assert dvf._get_dvf_client() is client
+
+        await dvf.close_dvf_client()
+        assert client.is_closed
+        assert dvf._DVF_CLIENT is None
+
+        new_client = dvf._get_dvf_client()
+        assert new_client is not client
+        await dvf.close_dvf_client()
+
+
+class TestFetchRawDvfData:
+    """Tests for _fetch_raw_dvf_data() caching"""
+
+    @pytest.mark.asyncio
+    async def test_successful_response_cached(self):
+        """Test a second fetch for the same code is served from the cache."""
+        response = AsyncMock()
+        response.status_code = 200
+        response.content = json.dumps({"resultats": [_record()]}).encode()
+        response.json = lambda: json.loads(response.content)
+        client = AsyncMock()
+        client.get.return_value = response
+
+        dvf._DVF_CACHE.clear()
+        with patch.object(dvf, "_get_dvf_client", return_value=client):
+            first = await dvf._fetch_raw_dvf_data("75001", "Appartement", "2016-01-01")
+            second = await dvf._fetch_raw_dvf_data("75001", "Appartement", "2016-01-01")
+            await dvf._fetch_raw_dvf_data("75002", "Appartement", "2016-01-01")
+
+        assert first == second == [_record()]
+        assert client.get.call_count == 2
+        dvf._DVF_CACHE.clear()
+
+    @pytest.mark.asyncio
+    async def test_error_not_cached(self):
+        """Test non-200 responses are retried on the next fetch."""
+        response = AsyncMock()
+        response.status_code = 503
+        client = AsyncMock()
+        client.get.return_value = response
+
+        dvf._DVF_CACHE.clear()
+        with patch.object(dvf, "_get_dvf_client", return_value=client):
+            assert await dvf._fetch_raw_dvf_data("75001", "Appartement", "2016-01-01") == []
+            assert await dvf._fetch_raw_dvf_data("75001", "Appartement", "2016-01-01") == []
+
+        assert client.get.call_count == 2
+
+    def test_cache_evicts_oldest_over_cap(self):
+        """Test storing past the cap drops the oldest postal codes first."""
+        dvf._DVF_CACHE.clear()
+        with patch.object(dvf, "DVF_CACHE_MAX_ENTRIES", 2):
+            for code in ("75001", "75002", "75003"):
+                dvf._store_dvf_cache((code, "Appartement"), [])
+
+            # Refreshing a code makes it the newest entry
+            dvf._store_dvf_cache(("75002", "Appartement"), [])
+            dvf._store_dvf_cache(("75004", "Appartement"), [])
+
+        assert list(dvf._DVF_CACHE) == [("75002", "Appartement"), ("75004", "Appartement")]
+        dvf._DVF_CACHE.clear()
+
+    def test_cache_drops_expired_on_insert(self):
+        """Test expired entries are removed when a new response is stored."""
+        dvf._DVF_CACHE.clear()
+        with patch.object(dvf.time, "monotonic", return_value=1000.0):
+            dvf._store_dvf_cache(("75001", "Appartement"), [])
+        with patch.object(dvf.time, "monotonic", return_value=1000.0 + dvf.DVF_CACHE_TTL_SECONDS):
+            dvf._store_dvf_cache(("75002", "Appartement"), [])
+
+        assert list(dvf._DVF_CACHE) == [("75002", "Appartement")]
+        dvf._DVF_CACHE.clear()